@@ -12,11 +12,70 @@ Usage:
 """
 
 import sys
+import time
 import argparse
 import subprocess
 import difflib
 from pathlib import Path
-from typing import Dict, Callable
+from typing import Dict, Callable, List, Optional
+
+
+class ImportProfiler:
+    """Record how long each first-time module import takes (for --startup-profile)"""
+
+    def __init__(self):
+        self.records = []  # (module name, cumulative seconds, nesting depth)
+        self.started = time.perf_counter()
+        self._depth = 0
+        self._original_import = None
+
+    def install(self) -> None:
+        """Start timing imports by wrapping builtins.__import__"""
+        import builtins
+        self._original_import = builtins.__import__
+        builtins.__import__ = self._timed_import
+
+    def uninstall(self) -> None:
+        """Stop timing imports"""
+        import builtins
+        if self._original_import is not None:
+            builtins.__import__ = self._original_import
+            self._original_import = None
+
+    def _timed_import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        module_name = name
+        if level:
+            # Resolve relative imports against the importing package
+            package_parts = ((globals or {}).get("__package__") or "").split(".")
+            base_parts = package_parts[:len(package_parts) - level + 1]
+            module_name = ".".join(base_parts + ([name] if name else []))
+
+        if module_name in sys.modules:
+            return self._original_import(name, globals, locals, fromlist, level)
+
+        self._depth += 1
+        start = time.perf_counter()
+        try:
+            return self._original_import(name, globals, locals, fromlist, level)
+        finally:
+            self._depth -= 1
+            self.records.append((module_name, time.perf_counter() - start, self._depth))
+
+    def report(self, limit: int = 25) -> None:
+        """Print the slowest imports and total startup time to stderr"""
+        total = time.perf_counter() - self.started
+        print(f"\nStartup profile: {len(self.records)} modules imported, {total * 1000:.1f} ms since start",
+              file=sys.stderr)
+        print(f"{'cumulative ms':>14}  module", file=sys.stderr)
+        for module_name, elapsed, depth in sorted(self.records, key=lambda r: r[1], reverse=True)[:limit]:
+            print(f"{elapsed * 1000:14.1f}  {'  ' * depth}{module_name}", file=sys.stderr)
+
+
+# Start profiling before anything heavy is imported
+_import_profiler = None
+if "--startup-profile" in sys.argv:
+    _import_profiler = ImportProfiler()
+    _import_profiler.install()
 
 # Import version from SSOT
 try:
@@ -100,6 +159,8 @@ def create_global_parser() -> argparse.ArgumentParser:
                                help="Force execution, skipping checks")
     global_parser.add_argument("--yes", "-y", action="store_true",
                                help="Automatically answer yes to all prompts")
+    global_parser.add_argument("--startup-profile", action="store_true",
+                               help="Print per-module import times on exit")
 
     return global_parser
 
@@ -153,14 +214,45 @@ def setup_global_environment(args: argparse.Namespace):
         logger.debug(f"Arguments: {vars(args)}")
 
 
+# Static operation table: lets us build the top-level parser and help text
+# without importing any operation module
+OPERATIONS = {
+    "install": "Install SuperGemini framework components",
+    "update": "Update existing SuperGemini installation",
+    "uninstall": "Remove SuperGemini installation",
+    "backup": "Backup and restore operations"
+}
+
+
 def get_operation_modules() -> Dict[str, str]:
     """Return supported operations and their descriptions"""
-    return {
-        "install": "Install SuperGemini framework components",
-        "update": "Update existing SuperGemini installation",
-        "uninstall": "Remove SuperGemini installation",
-        "backup": "Backup and restore operations"
-    }
+    return dict(OPERATIONS)
+
+
+def get_selected_operation(argv: List[str]) -> Optional[str]:
+    """
+    Find the operation named on the command line before parsing
+
+    The operation is the first positional argument; values of global options
+    (e.g. `--install-dir backup install`) are skipped.
+    """
+    value_options = [
+        option
+        for action in create_global_parser()._actions if action.nargs != 0
+        for option in action.option_strings
+    ]
+    args = iter(argv)
+    for arg in args:
+        if arg == "--":
+            arg = next(args, None)
+        elif arg.startswith("-"):
+            # Long options may be abbreviated, as argparse allows
+            if "=" not in arg and any(option == arg or (arg.startswith("--") and option.startswith(arg))
+                                      for option in value_options):
+                next(args, None)
+            continue
+        return arg if arg in OPERATIONS else None
+    return None
 
 
 def load_operation_module(name: str):
@@ -174,10 +266,19 @@ def load_operation_module(name: str):
         return None
 
 
-def register_operation_parsers(subparsers, global_parser) -> Dict[str, Callable]:
-    """Register subcommand parsers and map operation names to their run functions"""
+def register_operation_parsers(subparsers, global_parser, selected: Optional[str] = None) -> Dict[str, Callable]:
+    """
+    Register subcommand parsers and map operation names to their run functions
+
+    Only the selected operation's module is imported and allowed to register its
+    full parser; the others get a lightweight parser built from OPERATIONS.
+    """
     operations = {}
     for name, desc in get_operation_modules().items():
+        if name != selected:
+            subparsers.add_parser(name, help=desc, parents=[global_parser])
+            continue
+
         module = load_operation_module(name)
         if module and hasattr(module, 'register_parser') and hasattr(module, 'run'):
             module.register_parser(subparsers, global_parser)
@@ -221,9 +322,20 @@ def handle_legacy_fallback(op: str, args: argparse.Namespace) -> int:
 
 def main() -> int:
     """Main entry point"""
+    try:
+        return _run_main()
+    finally:
+        if _import_profiler is not None:
+            _import_profiler.uninstall()
+            _import_profiler.report()
+
+
+def _run_main() -> int:
+    """Parse arguments and dispatch to the selected operation"""
     try:
         parser, subparsers, global_parser = create_parser()
-        operations = register_operation_parsers(subparsers, global_parser)
+        selected = get_selected_operation(sys.argv[1:])
+        operations = register_operation_parsers(subparsers, global_parser, selected)
         args = parser.parse_args()
 
         # No operation provided? Show help manually unless in quiet mode
@@ -237,7 +349,7 @@ def main() -> int:
 
         # Handle unknown operations and suggest corrections
         if args.operation not in operations:
-            close = difflib.get_close_matches(args.operation, operations.keys(), n=1)
+            close = difflib.get_close_matches(args.operation, get_operation_modules().keys(), n=1)
             suggestion = f"Did you mean: {close[0]}?" if close else ""
             display_error(f"Unknown operation: '{args.operation}'. {suggestion}")
             return 1
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Benchmark component discovery cost
+Compares the old instantiate-every-component discovery with class-level
+metadata scanning and with components.index.json discovery
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from setup.core.registry import ComponentRegistry
+
+COMPONENTS_DIR = PROJECT_ROOT / "setup" / "components"
+
+
+def instantiating_discovery(registry: ComponentRegistry) -> dict:
+    """Previous discovery: one instance for the name, another for the dependencies"""
+    graph = {}
+    for component_class in registry.component_classes.values():
+        name = component_class().get_metadata()["name"]
+        graph[name] = set(component_class().get_dependencies())
+    return graph
+
+
+def class_metadata_discovery(registry: ComponentRegistry) -> dict:
+    """Module scan: read class attributes, construct nothing"""
+    registry.discover_components(force_reload=True)
+    return registry.dependency_graph
+
+
+def index_discovery() -> dict:
+    """Index discovery: read components.index.json, import nothing"""
+    registry = ComponentRegistry(COMPONENTS_DIR)
+    registry.discover_components()
+    return registry.dependency_graph
+
+
+def time_it(func, iterations: int) -> float:
+    """Return mean milliseconds per call"""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - start) * 1000 / iterations
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark SuperGemini component discovery")
+    parser.add_argument("--iterations", type=int, default=200, help="Iterations per measurement (default: 200)")
+    args = parser.parse_args()
+
+    registry = ComponentRegistry(COMPONENTS_DIR, use_index=False)
+    registry.discover_components()  # Warm module imports so only discovery is measured
+
+    names = sorted(registry.component_classes)
+    print(f"Components: {len(names)} ({', '.join(names)})")
+    print(f"Iterations: {args.iterations}")
+
+    before = time_it(lambda: instantiating_discovery(registry), args.iterations)
+    after = time_it(lambda: class_metadata_discovery(registry), args.iterations)
+    indexed = time_it(index_discovery, args.iterations)
+
+    print(f"Instantiating discovery:   {before:8.3f} ms")
+    print(f"Class metadata discovery:  {after:8.3f} ms")
+    print(f"Index discovery:           {indexed:8.3f} ms")
+    if after > 0:
+        print(f"Speedup:                   {before / after:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
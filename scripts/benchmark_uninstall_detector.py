@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Benchmark uninstall file detection
+Builds a synthetic ~/.gemini tree (session logs, caches, a few framework files)
+and compares per-signature regex matching with the compiled single-pass
+matcher, and the pre-change detector (list queue, per-signature regexes, full
+json.load) with scan_all_files
+"""
+
+import argparse
+import json
+import random
+import re
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from setup.cli.commands.uninstall import DEFAULT_SCAN_JOBS, SuperGeminiFileDetector
+
+WORDS = ["session", "request", "response", "token", "model", "user", "cache", "tool",
+         "result", "history", "prompt", "output", "context", "file", "edit", "diff"]
+
+
+def build_tree(root: Path, file_count: int, seed: int) -> list:
+    """Write file_count small text files; about 1% carry a framework signature"""
+    rng = random.Random(seed)
+    files = []
+    for index in range(file_count):
+        directory = root / ("tmp" if index % 3 else "history") / f"session-{index // 500:04d}"
+        directory.mkdir(parents=True, exist_ok=True)
+        suffix = (".json", ".md", ".txt")[index % 3]
+        path = directory / f"entry-{index:06d}{suffix}"
+        body = " ".join(rng.choice(WORDS) for _ in range(rng.randint(100, 600)))
+        if rng.random() < 0.01:
+            body += "\n# SuperGemini Framework\n"
+        path.write_text(body, encoding="utf-8")
+        files.append(path)
+    return files
+
+
+def per_signature_match(detector: SuperGeminiFileDetector, path: Path) -> bool:
+    """Previous matcher: one re.search per signature"""
+    with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+        content = f.read(4096)
+    for signature in detector.supergemini_signatures:
+        if re.search(signature, content, re.IGNORECASE | re.MULTILINE):
+            return True
+    return False
+
+
+class LegacyFileDetector(SuperGeminiFileDetector):
+    """Pre-change classification: one re.search per signature and a full json.load per .json file"""
+
+    def _analyze_file_content(self, file_path: Path) -> bool:
+        try:
+            return per_signature_match(self, file_path)
+        except Exception:
+            return False
+
+    def _analyze_json_config(self, file_path: Path) -> bool:
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except Exception:
+            return False
+
+        def check_keys(obj, depth=0):
+            if depth > 3:
+                return False
+            if isinstance(obj, dict):
+                for key, value in obj.items():
+                    if any(sg_key in str(key).lower() for sg_key in self.supergemini_config_keys):
+                        return True
+                    if isinstance(value, (dict, list)) and check_keys(value, depth + 1):
+                        return True
+            elif isinstance(obj, list):
+                for item in obj:
+                    if isinstance(item, (dict, list)) and check_keys(item, depth + 1):
+                        return True
+            return False
+
+        return check_keys(data)
+
+
+def legacy_scan_all_files(detector: SuperGeminiFileDetector) -> tuple:
+    """Previous scan: list used as a queue, resolve() per directory, inline classification"""
+    supergemini_files = []
+    preserved_files = []
+    dirs_to_scan = [detector.install_dir]
+    processed_dirs = set()
+    while dirs_to_scan:
+        current_dir = dirs_to_scan.pop(0)
+        real_path = current_dir.resolve()
+        if real_path in processed_dirs:
+            continue
+        processed_dirs.add(real_path)
+        for item in current_dir.iterdir():
+            if item.is_file():
+                if detector.is_supergemini_file(item):
+                    supergemini_files.append(item)
+                else:
+                    preserved_files.append(item)
+            elif item.is_dir():
+                dirs_to_scan.append(item)
+    return supergemini_files, preserved_files
+
+
+def time_it(func, files: list) -> tuple:
+    """Return (seconds, matches) for func over all files"""
+    start = time.perf_counter()
+    matches = sum(1 for path in files if func(path))
+    return time.perf_counter() - start, matches
+
+
+def benchmark_content(detector: SuperGeminiFileDetector, files: list) -> None:
+    before, before_matches = time_it(lambda path: per_signature_match(detector, path), files)
+    after, after_matches = time_it(detector._analyze_file_content, files)
+
+    print(f"Signatures:              {len(detector.supergemini_signatures)}")
+    print(f"Per-signature matching:  {before:8.2f} s ({before_matches} matches)")
+    print(f"Compiled matcher:        {after:8.2f} s ({after_matches} matches)")
+    if after > 0:
+        print(f"Speedup:                 {before / after:8.1f}x")
+
+
+def benchmark_scan(detector: SuperGeminiFileDetector, jobs: int) -> None:
+    start = time.perf_counter()
+    legacy = legacy_scan_all_files(LegacyFileDetector(detector.install_dir))
+    before = time.perf_counter() - start
+
+    start = time.perf_counter()
+    current = detector.scan_all_files(max_workers=jobs)
+    after = time.perf_counter() - start
+
+    print(f"Pre-change detector:     {before:8.2f} s ({len(legacy[0])} SuperGemini files)")
+    print(f"scan_all_files (-j {jobs:<2}): {after:8.2f} s ({len(current[0])} SuperGemini files)")
+    if after > 0:
+        print(f"Speedup:                 {before / after:8.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark SuperGemini uninstall file detection")
+    parser.add_argument("--files", type=int, default=50000, help="Synthetic files to create (default: 50000)")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed for file contents")
+    parser.add_argument("--mode", choices=["content", "scan", "all"], default="all",
+                        help="Measure content matching, directory scanning, or both (default: all)")
+    parser.add_argument("--jobs", type=int, default=DEFAULT_SCAN_JOBS,
+                        help=f"scan_all_files worker threads (default: {DEFAULT_SCAN_JOBS})")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="sg-uninstall-bench-") as tmp:
+        root = Path(tmp) / ".gemini"
+        print(f"Building synthetic tree with {args.files} files...")
+        files = build_tree(root, args.files, args.seed)
+        detector = SuperGeminiFileDetector(root)
+
+        # Warm the page cache so runs measure detection, not cold disk reads
+        time_it(lambda path: path.stat().st_size > 0, files)
+
+        if args.mode in ("content", "all"):
+            benchmark_content(detector, files)
+        if args.mode in ("scan", "all"):
+            benchmark_scan(detector, args.jobs)
+
+
+if __name__ == "__main__":
+    main()
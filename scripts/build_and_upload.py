@@ -28,6 +28,16 @@ def update_version_refs():
         print(f"❌ Failed to update version references: {e}")
         sys.exit(1)
 
+def generate_component_index():
+    """Regenerate setup/components/components.index.json"""
+    print("🔄 Generating component index...")
+    try:
+        subprocess.run([sys.executable, "scripts/generate_component_index.py"],
+                      cwd=PROJECT_ROOT, check=True)
+    except subprocess.CalledProcessError as e:
+        print(f"❌ Failed to generate component index: {e}")
+        sys.exit(1)
+
 def run_command(cmd: List[str], description: str) -> Tuple[bool, str]:
     """Run a command and return success status and output"""
     print(f"🔄 {description}...")
@@ -207,6 +217,7 @@ def main():
     
     # Update version references first
     update_version_refs()
+    generate_component_index()
     
     # Step 1: Clean previous builds
     clean_build_artifacts()
@@ -0,0 +1,23 @@
+#!/usr/bin/env python3
+"""
+Generate setup/components/components.index.json
+Lets ComponentRegistry discover components without importing every module
+"""
+
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from setup.core.registry import ComponentRegistry
+
+
+def main():
+    registry = ComponentRegistry(PROJECT_ROOT / "setup" / "components")
+    index_file = registry.write_index()
+    print(f"✅ Wrote {index_file.relative_to(PROJECT_ROOT)} ({len(registry.component_index)} components)")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,19 +5,24 @@ Refactored from backup.py for unified CLI hub
 
 import sys
 import time
-import tarfile
 import json
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import List, Optional, Dict, Any, Tuple
 import argparse
 
 from ...services.settings import SettingsService as SettingsManager
+from ...services.backup_catalog import BackupCatalog
+from ...services.backup_store import BackupStore
 from ...utils.ui import (
     display_header, display_info, display_success, display_error, 
     display_warning, Menu, confirm, ProgressBar, Colors, format_size
 )
 from ...utils.logger import get_logger
+from ...utils.archive import (
+    COMPRESSION_METHODS, DEFAULT_EXTRACT_JOBS, INDEXABLE_METHODS,
+    archive_suffix, extract_archive, index_path, is_backup_archive, write_backup_archive
+)
 from ... import DEFAULT_INSTALL_DIR
 from ..base import OperationBase
 
@@ -40,9 +45,13 @@ def register_parser(subparsers, global_parser=None) -> argparse.ArgumentParser:
         epilog="""
 Examples:
   SuperGemini backup --create               # Create new backup
+  SuperGemini backup --create --compress-jobs 4  # Parallel gzip compression
+  SuperGemini backup --create --dedup       # Snapshot into the deduplicated store
   SuperGemini backup --list --verbose       # List available backups (verbose)
   SuperGemini backup --restore              # Interactive restore
   SuperGemini backup --restore backup.tar.gz  # Restore specific backup
+  SuperGemini backup --restore backup.tar.gz --path settings.json --path commands/sg
+                                            # Restore only matching files
   SuperGemini backup --info backup.tar.gz   # Show backup information
   SuperGemini backup --cleanup --force      # Clean up old backups (forced)
         """,
@@ -99,9 +108,28 @@ Examples:
     
     parser.add_argument(
         "--compress",
-        choices=["none", "gzip", "bzip2"],
+        choices=list(COMPRESSION_METHODS),
         default="gzip",
-        help="Compression method (default: gzip)"
+        help="Compression method (default: gzip; zstd needs the zstandard package)"
+    )
+    
+    parser.add_argument(
+        "--dedup",
+        action="store_true",
+        help="Store the backup as a snapshot in the deduplicated store (<backup-dir>/store)"
+    )
+    
+    parser.add_argument(
+        "--compress-jobs",
+        type=int,
+        default=1,
+        help="Compression threads for gzip/zstd (default: 1)"
+    )
+    
+    parser.add_argument(
+        "--no-index",
+        action="store_true",
+        help="Do not write the <backup>.idx member index used for selective restore (for --create)"
     )
     
     # Restore options
@@ -111,6 +139,21 @@ Examples:
         help="Overwrite existing files during restore"
     )
     
+    parser.add_argument(
+        "--path",
+        dest="paths",
+        action="append",
+        metavar="PATTERN",
+        help="Restore only this file, directory or glob (repeatable)"
+    )
+    
+    parser.add_argument(
+        "--restore-jobs",
+        type=int,
+        default=DEFAULT_EXTRACT_JOBS,
+        help=f"Extraction threads for uncompressed or indexed backups (default: {DEFAULT_EXTRACT_JOBS})"
+    )
+    
     # Cleanup options
     parser.add_argument(
         "--keep",
@@ -143,6 +186,31 @@ def check_installation_exists(install_dir: Path) -> bool:
     return settings_manager.check_installation_exists() or settings_manager.check_v2_installation_exists()
 
 
+def catalog_info(backup_path: Path, entry: Dict[str, Any]) -> Dict[str, Any]:
+    """Backup information from a catalog entry"""
+    info = {
+        "path": backup_path,
+        "exists": True,
+        "size": 0,
+        "created": None,
+        "metadata": {}
+    }
+    
+    if "error" in entry:
+        info["error"] = entry["error"]
+        return info
+    
+    info.update({
+        "size": entry["size"],
+        "created": datetime.fromisoformat(entry["created"]),
+        "files": entry["files"],
+        "components": entry.get("components", {}),
+        "checksum": entry.get("sha256"),
+        "metadata": entry.get("metadata", {})
+    })
+    return info
+
+
 def get_backup_info(backup_path: Path) -> Dict[str, Any]:
     """Get information about a backup file"""
     info = {
@@ -156,39 +224,75 @@ def get_backup_info(backup_path: Path) -> Dict[str, Any]:
     if not backup_path.exists():
         return info
     
+    if is_snapshot_path(backup_path):
+        return get_snapshot_info(backup_path)
+    
     try:
-        # Get file stats
-        stats = backup_path.stat()
-        info["size"] = stats.st_size
-        info["created"] = datetime.fromtimestamp(stats.st_mtime)
-        
-        # Try to read metadata from backup
-        if backup_path.suffix == ".gz":
-            mode = "r:gz"
-        elif backup_path.suffix == ".bz2":
-            mode = "r:bz2"
-        else:
-            mode = "r"
-        
-        with tarfile.open(backup_path, mode) as tar:
-            # Look for metadata file
-            try:
-                metadata_member = tar.getmember("backup_metadata.json")
-                metadata_file = tar.extractfile(metadata_member)
-                if metadata_file:
-                    info["metadata"] = json.loads(metadata_file.read().decode())
-            except KeyError:
-                pass  # No metadata file
-            
-            # Get list of files in backup
-            info["files"] = len(tar.getnames())
-            
+        # The catalog answers without opening the archive unless it changed
+        entry = BackupCatalog(backup_path.parent).lookup(backup_path)
+        return catalog_info(backup_path, entry)
     except Exception as e:
         info["error"] = str(e)
     
     return info
 
 
+def is_snapshot_path(path: Path) -> bool:
+    """Check whether a path is a snapshot manifest in a backup store"""
+    return path.suffix == ".json" and path.parent.name == "snapshots" and path.parent.parent.name == "store"
+
+
+def snapshot_info(snapshot: Dict[str, Any]) -> Dict[str, Any]:
+    """Backup information from a BackupStore.list_snapshots() entry"""
+    return {
+        "path": snapshot["path"],
+        "name": snapshot["path"].stem,
+        "exists": True,
+        "snapshot": True,
+        "size": snapshot["size"],
+        "files": snapshot["files"],
+        "created": datetime.fromisoformat(snapshot["created"]),
+        "metadata": snapshot.get("metadata", {})
+    }
+
+
+def get_snapshot_info(manifest_path: Path) -> Dict[str, Any]:
+    """Get information about a backup store snapshot"""
+    info = {
+        "path": manifest_path,
+        "name": manifest_path.stem,
+        "exists": manifest_path.exists(),
+        "snapshot": True,
+        "size": 0,
+        "created": None,
+        "metadata": {}
+    }
+    
+    try:
+        store = BackupStore(manifest_path.parent.parent.parent)
+        snapshot = store.load_snapshot(manifest_path.stem)
+        info["files"] = len(snapshot["files"])
+        info["size"] = sum(entry.get("size", 0) for entry in snapshot["files"].values())
+        info["created"] = datetime.fromisoformat(snapshot["created"])
+        info["metadata"] = snapshot.get("metadata", {})
+    except Exception as e:
+        info["error"] = str(e)
+    
+    return info
+
+
+def resolve_backup_path(backup_dir: Path, reference: str) -> Path:
+    """Resolve a backup file name/path or snapshot name to a path"""
+    backup_path = Path(reference)
+    if not backup_path.is_absolute():
+        backup_path = backup_dir / backup_path
+    if not backup_path.exists():
+        snapshot_path = BackupStore(backup_dir).snapshot_path(reference)
+        if snapshot_path.exists():
+            return snapshot_path
+    return backup_path
+
+
 def list_backups(backup_dir: Path) -> List[Dict[str, Any]]:
     """List all available backups"""
     backups = []
@@ -196,11 +300,18 @@ def list_backups(backup_dir: Path) -> List[Dict[str, Any]]:
     if not backup_dir.exists():
         return backups
     
-    # Find all backup files
-    for backup_file in backup_dir.glob("*.tar*"):
-        if backup_file.is_file():
-            info = get_backup_info(backup_file)
-            backups.append(info)
+    # Find all backup files; the catalog only rescans new or changed ones
+    archives = [
+        backup_file for backup_file in sorted(backup_dir.iterdir())
+        if is_backup_archive(backup_file) and backup_file.is_file()
+    ]
+    entries = BackupCatalog(backup_dir).refresh(archives)
+    for backup_file in archives:
+        backups.append(catalog_info(backup_file, entries[backup_file.name]))
+    
+    # Snapshots in the deduplicated store
+    for snapshot in BackupStore(backup_dir).list_snapshots():
+        backups.append(snapshot_info(snapshot))
     
     # Sort by creation date (newest first)
     backups.sort(key=lambda x: x.get("created", datetime.min), reverse=True)
@@ -211,22 +322,23 @@ def list_backups(backup_dir: Path) -> List[Dict[str, Any]]:
 def display_backup_list(backups: List[Dict[str, Any]]) -> None:
     """Display list of available backups"""
     print(f"\n{Colors.CYAN}{Colors.BRIGHT}Available Backups{Colors.RESET}")
-    print("=" * 70)
+    print("=" * 90)
     
     if not backups:
         print(f"{Colors.YELLOW}No backups found{Colors.RESET}")
         return
     
-    print(f"{'Name':<30} {'Size':<10} {'Created':<20} {'Files':<8}")
-    print("-" * 70)
+    print(f"{'Name':<42} {'Type':<6} {'Size':<10} {'Created':<20} {'Files':<8}")
+    print("-" * 90)
     
     for backup in backups:
-        name = backup["path"].name
+        name = backup.get("name") or backup["path"].name
+        kind = "store" if backup.get("snapshot") else "tar"
         size = format_size(backup["size"]) if backup["size"] > 0 else "unknown"
         created = backup["created"].strftime("%Y-%m-%d %H:%M") if backup["created"] else "unknown"
         files = str(backup.get("files", "unknown"))
         
-        print(f"{name:<30} {size:<10} {created:<20} {files:<8}")
+        print(f"{name:<42} {kind:<6} {size:<10} {created:<20} {files:<8}")
     
     print()
 
@@ -282,57 +394,50 @@ def create_backup(args: argparse.Namespace) -> bool:
         else:
             backup_name = f"supergemini_backup_{timestamp}"
         
-        # Determine compression
-        if args.compress == "gzip":
-            backup_file = backup_dir / f"{backup_name}.tar.gz"
-            mode = "w:gz"
-        elif args.compress == "bzip2":
-            backup_file = backup_dir / f"{backup_name}.tar.bz2"
-            mode = "w:bz2"
-        else:
-            backup_file = backup_dir / f"{backup_name}.tar"
-            mode = "w"
-        
-        logger.info(f"Creating backup: {backup_file}")
-        
         # Create metadata
         metadata = create_backup_metadata(args.install_dir)
         
-        # Create backup
-        start_time = time.time()
-        
-        with tarfile.open(backup_file, mode) as tar:
-            # Add metadata file
-            import tempfile
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as temp_file:
-                json.dump(metadata, temp_file, indent=2)
-                temp_file.flush()
-                tar.add(temp_file.name, arcname="backup_metadata.json")
-                Path(temp_file.name).unlink()  # Clean up temp file
-            
-            # Add installation directory contents
-            files_added = 0
-            for item in args.install_dir.rglob("*"):
-                if item.is_file() and item != backup_file:
-                    try:
-                        # Create relative path for archive
-                        rel_path = item.relative_to(args.install_dir)
-                        tar.add(item, arcname=str(rel_path))
-                        files_added += 1
-                        
-                        if files_added % 10 == 0:
-                            logger.debug(f"Added {files_added} files to backup")
-                            
-                    except Exception as e:
-                        logger.warning(f"Could not add {item} to backup: {e}")
+        if getattr(args, "dedup", False):
+            logger.info(f"Creating snapshot {backup_name} in {backup_dir / 'store'}")
+            stats = BackupStore(backup_dir).create_snapshot(
+                args.install_dir,
+                name=backup_name,
+                metadata=metadata,
+                exclude=[backup_dir],
+                logger=logger
+            )
+            logger.success(f"Snapshot created successfully in {stats['duration']:.1f} seconds")
+            logger.info(f"Files: {stats['files']} ({stats['reused']} unchanged since the last snapshot)")
+            logger.info(
+                f"New data stored: {format_size(stats['bytes_stored'])} in {stats['new_blobs']} blobs "
+                f"({format_size(stats['bytes_total'])} total)"
+            )
+            return True
         
-        duration = time.time() - start_time
-        file_size = backup_file.stat().st_size
+        backup_file = backup_dir / f"{backup_name}{archive_suffix(args.compress)}"
+        
+        logger.info(f"Creating backup: {backup_file}")
         
-        logger.success(f"Backup created successfully in {duration:.1f} seconds")
+        # Stream installation files straight into the archive; the backup
+        # directory itself is left out so backups do not nest
+        stats = write_backup_archive(
+            args.install_dir,
+            backup_file,
+            method=args.compress,
+            jobs=max(1, getattr(args, "compress_jobs", 1)),
+            metadata=json.dumps(metadata, indent=2).encode(),
+            exclude=[backup_dir],
+            index=not getattr(args, "no_index", False) and args.compress in INDEXABLE_METHODS,
+            logger=logger
+        )
+        
+        BackupCatalog(backup_dir).record(backup_file, stats["files"], metadata)
+        
+        logger.success(f"Backup created successfully in {stats['duration']:.1f} seconds")
         logger.info(f"Backup file: {backup_file}")
-        logger.info(f"Files archived: {files_added}")
-        logger.info(f"Backup size: {format_size(file_size)}")
+        logger.info(f"Files archived: {stats['files']}")
+        logger.info(f"Backup size: {format_size(stats['bytes_out'])} ({format_size(stats['bytes_in'])} uncompressed)")
+        logger.info(f"Throughput: {stats['throughput']:.1f} MB/s")
         
         return True
         
@@ -358,53 +463,41 @@ def restore_backup(backup_path: Path, args: argparse.Namespace) -> bool:
         
         logger.info(f"Restoring from backup: {backup_path}")
         
-        # Determine compression
-        if backup_path.suffix == ".gz":
-            mode = "r:gz"
-        elif backup_path.suffix == ".bz2":
-            mode = "r:bz2"
+        if info.get("snapshot"):
+            start_time = time.time()
+            store = BackupStore(backup_path.parent.parent.parent)
+            result = store.restore_snapshot(backup_path.stem, args.install_dir,
+                                            overwrite=args.overwrite, patterns=getattr(args, "paths", None),
+                                            logger=logger)
         else:
-            mode = "r"
-        
-        # Create backup of current installation if it exists
-        if check_installation_exists(args.install_dir) and not args.dry_run:
-            logger.info("Creating backup of current installation before restore")
-            # This would call create_backup internally
-        
-        # Extract backup
-        start_time = time.time()
-        files_restored = 0
-        
-        with tarfile.open(backup_path, mode) as tar:
-            # Extract all files except metadata
-            for member in tar.getmembers():
-                if member.name == "backup_metadata.json":
-                    continue
-                
-                try:
-                    target_path = args.install_dir / member.name
-                    
-                    # Check if file exists and overwrite flag
-                    if target_path.exists() and not args.overwrite:
-                        logger.warning(f"Skipping existing file: {target_path}")
-                        continue
-                    
-                    # Extract file
-                    tar.extract(member, args.install_dir)
-                    files_restored += 1
-                    
-                    if files_restored % 10 == 0:
-                        logger.debug(f"Restored {files_restored} files")
-                        
-                except Exception as e:
-                    logger.warning(f"Could not restore {member.name}: {e}")
+            # Create backup of current installation if it exists
+            if check_installation_exists(args.install_dir) and not args.dry_run:
+                logger.info("Creating backup of current installation before restore")
+                # This would call create_backup internally
+            
+            # List members once and extract only the selected ones (all but metadata by default)
+            start_time = time.time()
+            result = extract_archive(
+                backup_path,
+                args.install_dir,
+                patterns=getattr(args, "paths", None),
+                overwrite=args.overwrite,
+                jobs=max(1, getattr(args, "restore_jobs", DEFAULT_EXTRACT_JOBS)),
+                logger=logger
+            )
+        
+        if getattr(args, "paths", None) and result["matched"] == 0:
+            logger.error(f"No files in backup match: {', '.join(args.paths)}")
+            return False
         
         duration = time.time() - start_time
         
         logger.success(f"Restore completed successfully in {duration:.1f} seconds")
-        logger.info(f"Files restored: {files_restored}")
+        logger.info(f"Files restored: {result['restored']}")
+        if result["skipped"]:
+            logger.info(f"Files skipped (already exist, use --overwrite): {result['skipped']}")
         
-        return True
+        return result["failed"] == 0
         
     except Exception as e:
         logger.exception(f"Failed to restore backup: {e}")
@@ -422,7 +515,7 @@ def interactive_restore_selection(backups: List[Dict[str, Any]]) -> Optional[Pat
     # Create menu options
     backup_options = []
     for backup in backups:
-        name = backup["path"].name
+        name = backup.get("name") or backup["path"].name
         size = format_size(backup["size"]) if backup["size"] > 0 else "unknown"
         created = backup["created"].strftime("%Y-%m-%d %H:%M") if backup["created"] else "unknown"
         backup_options.append(f"{name} ({size}, {created})")
@@ -471,11 +564,27 @@ def cleanup_old_backups(backup_dir: Path, args: argparse.Namespace) -> bool:
         logger.info(f"Cleaning up {len(to_remove)} old backups")
         
         for backup in to_remove:
+            name = backup.get("name") or backup["path"].name
             try:
                 backup["path"].unlink()
-                logger.info(f"Removed backup: {backup['path'].name}")
+                if not backup.get("snapshot"):
+                    index_path(backup["path"]).unlink(missing_ok=True)
+                logger.info(f"Removed backup: {name}")
+            except Exception as e:
+                logger.warning(f"Could not remove {name}: {e}")
+        
+        removed_archives = [backup["path"].name for backup in to_remove
+                            if not backup.get("snapshot") and not backup["path"].exists()]
+        if removed_archives:
+            BackupCatalog(backup_dir).forget(removed_archives)
+        
+        # Reclaim store blobs no remaining snapshot references
+        if any(backup.get("snapshot") for backup in to_remove):
+            try:
+                removed, freed = BackupStore(backup_dir).gc(logger=logger)
+                logger.info(f"Removed {removed} unreferenced blobs ({format_size(freed)})")
             except Exception as e:
-                logger.warning(f"Could not remove {backup['path'].name}: {e}")
+                logger.warning(f"Could not garbage-collect backup store: {e}")
         
         return True
         
@@ -535,17 +644,13 @@ def run(args: argparse.Namespace) -> int:
                     logger.info("Restore cancelled by user")
                     return 0
             else:
-                # Specific backup file
-                backup_path = Path(args.restore)
-                if not backup_path.is_absolute():
-                    backup_path = backup_dir / backup_path
+                # Specific backup file or snapshot name
+                backup_path = resolve_backup_path(backup_dir, args.restore)
             
             success = restore_backup(backup_path, args)
             
         elif args.info:
-            backup_path = Path(args.info)
-            if not backup_path.is_absolute():
-                backup_path = backup_dir / backup_path
+            backup_path = resolve_backup_path(backup_dir, args.info)
             
             info = get_backup_info(backup_path)
             if info["exists"]:
@@ -554,6 +659,8 @@ def run(args: argparse.Namespace) -> int:
                 print(f"Size: {format_size(info['size'])}")
                 print(f"Created: {info['created']}")
                 print(f"Files: {info.get('files', 'unknown')}")
+                if info.get("checksum"):
+                    print(f"SHA-256: {info['checksum']}")
                 
                 if info["metadata"]:
                     metadata = info["metadata"]
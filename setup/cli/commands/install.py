@@ -12,6 +12,7 @@ import argparse
 from ...core.installer import Installer
 from ...core.registry import ComponentRegistry
 from ...services.config import ConfigService
+from ...services.gemini_md import IMPORT_PROFILES
 from ...core.validator import Validator
 from ...utils.ui import (
     display_header, display_info, display_success, display_error, 
@@ -44,6 +45,8 @@ Examples:
   SuperGemini install                          # Interactive installation
   SuperGemini install --dry-run                # Dry-run mode  
   SuperGemini install --components core mcp    # Specific components
+  SuperGemini install --import-profile minimal # Import only FLAGS/PRINCIPLES/RULES into prompts
+  SuperGemini install --import-profile lazy    # Load mode/MCP guides only when their flag is used
   SuperGemini install --verbose --force        # Verbose with force mode
         """,
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -93,11 +96,69 @@ Examples:
         help="Skip backup creation during installation"
     )
 
+    parser.add_argument(
+        "--backup-dedup",
+        action="store_true",
+        help="Back up into the deduplicated snapshot store instead of a full archive"
+    )
+
+    parser.add_argument(
+        "--mcp-jobs",
+        type=int,
+        default=4,
+        metavar="N",
+        help="Number of MCP server packages to install in parallel (default: 4)"
+    )
+
+    parser.add_argument(
+        "--mcp-npm-batch",
+        action="store_true",
+        help="Install all npm-based MCP server packages with a single npm call"
+    )
+
     parser.add_argument(
         "--skip-gemini-md",
         action="store_true",
         help="Skip GEMINI.md management during installation"
     )
+
+    parser.add_argument(
+        "--import-profile",
+        choices=list(IMPORT_PROFILES),
+        help="Framework files GEMINI.md imports into every prompt: full, lazy (no mode or MCP guides; "
+             "commands read them when their flag is used) or minimal (FLAGS, PRINCIPLES, RULES) "
+             "(default: last used, else full)"
+    )
+
+    parser.add_argument(
+        "--context-budget",
+        type=int,
+        metavar="TOKENS",
+        help="Warn when GEMINI.md and its imports exceed this many estimated tokens"
+    )
+
+    parser.add_argument(
+        "--strict-budget",
+        action="store_true",
+        help="Leave GEMINI.md unchanged and fail instead of warning when over --context-budget"
+    )
+
+    parser.add_argument(
+        "--minify",
+        action="store_const",
+        const=True,
+        dest="minify",
+        help="Install compact Markdown copies (no comments, example sections or repeated blocks) "
+             "and report the token savings; the source files are not changed (default: last used)"
+    )
+
+    parser.add_argument(
+        "--no-minify",
+        action="store_const",
+        const=False,
+        dest="minify",
+        help="Install the Markdown files as shipped"
+    )
     
     parser.set_defaults(func=run_install)
     return parser
@@ -178,7 +239,7 @@ def validate_prerequisites(args: argparse.Namespace) -> bool:
     logger.info("Validating system requirements...")
     
     try:
-        validator = Validator()
+        validator = Validator(install_dir=args.install_dir)
         
         # Check Python version
         if not validator.check_python_version():
@@ -491,12 +552,7 @@ def execute_installation(components: List[str], installer: Installer, registry:
     logger = get_logger()
     
     try:
-        # Create backup if not disabled
-        if not args.no_backup:
-            logger.info("Creating backup of existing installation...")
-            backup_path = installer.create_backup()
-            if backup_path:
-                logger.info(f"Backup created: {backup_path}")
+        installer.register_components(list(component_instances.values()))
         
         # Execute installation
         logger.info(f"Installing {len(components)} components...")
@@ -504,67 +560,52 @@ def execute_installation(components: List[str], installer: Installer, registry:
         # Setup progress bar
         progress = ProgressBar(len(components), prefix="Installing")
         
-        installed_components = []
-        
-        for i, component_name in enumerate(components):
-            instance = component_instances.get(component_name)
-            if not instance:
-                logger.warning(f"No instance available for component: {component_name}")
-                continue
-            
-            logger.info(f"Installing {component_name}...")
-            
-            # Install component
-            config = {
-                "force_overwrite": args.force_overwrite,
-                "skip_gemini_md": args.skip_gemini_md,
-                "dry_run": args.dry_run
-            }
-            
-            # Add MCP server selection if installing MCP component
-            if component_name == "mcp" and hasattr(args, "mcp_servers") and args.mcp_servers:
-                config["selected_mcp_servers"] = args.mcp_servers
-                logger.info(f"Configuring MCP servers: {args.mcp_servers}")
-            
-            success = instance.install(config)
-            
-            if success:
-                installed_components.append(component_name)
-                logger.info(f"✓ {instance} component installed successfully")
+        # Progress is reported as components finish (the installer serializes callbacks)
+        def report_progress(component_name: str, installed: bool, completed: int, total: int) -> None:
+            if installed:
+                logger.info(f"✓ {component_instances[component_name]} component installed successfully")
             else:
                 logger.error(f"✗ Failed to install component: {component_name}")
                 display_error(f"Failed to install component: {component_name}")
-                
-                # Continue with remaining components
-                continue
-            
-            progress.update(i + 1)
+            progress.update(min(completed, progress.total))
+        
+        config = {
+            "force_overwrite": args.force_overwrite,
+            "skip_gemini_md": args.skip_gemini_md,
+            "backup": not args.no_backup,
+            "backup_dedup": args.backup_dedup,
+            "import_profile": args.import_profile,
+            "context_budget": args.context_budget,
+            "strict_context_budget": args.strict_budget,
+            "minify": args.minify,
+            "skip_validation": args.skip_validation,
+            "dry_run": args.dry_run,
+            "mcp_jobs": max(1, getattr(args, "mcp_jobs", 4) or 1),
+            "mcp_npm_batch": getattr(args, "mcp_npm_batch", False)
+        }
+        
+        # Add MCP server selection if installing MCP component
+        if "mcp" in components and hasattr(args, "mcp_servers") and args.mcp_servers:
+            config["selected_mcp_servers"] = args.mcp_servers
+            logger.info(f"Configuring MCP servers: {args.mcp_servers}")
+        
+        # Components install level by level on the installer's thread pool;
+        # GEMINI.md imports are written once after the last level
+        success = installer.install_components(components, config, progress_callback=report_progress)
         
         progress.finish()
         
+        if installer.backup_path:
+            logger.info(f"Backup created: {installer.backup_path}")
+        
+        installed_components = [name for name in components if name in installer.installed_components]
         if not installed_components:
             logger.error("No components were installed successfully")
             return False
         
-        # Post-installation validation
-        if not args.skip_validation:
-            logger.info("Running post-installation validation...")
-            validation_success = True
-            
-            for component_name in installed_components:
-                instance = component_instances.get(component_name)
-                if instance:
-                    is_valid, errors = instance.validate_installation()
-                    if is_valid:
-                        logger.info(f"  ✓ {component_name}: Valid")
-                    else:
-                        logger.warning(f"  ✗ {component_name}: {', '.join(errors)}")
-                        validation_success = False
-            
-            if validation_success:
-                logger.info("All components validated successfully!")
-            else:
-                logger.warning("Some components failed validation")
+        if not success:
+            display_error("Installation completed with errors (see above)")
+            return False
         
         logger.info(f"Installed components: {', '.join(installed_components)}")
         return True
@@ -805,7 +846,7 @@ def execute_install_workflow(args: argparse.Namespace, components: List[str], re
         logger.info(f"Resolved component dependencies: {resolved_components}")
         
         # Create installer
-        installer = Installer(args.install_dir, dry_run=args.dry_run)
+        installer = Installer(args.install_dir, dry_run=args.dry_run, registry=registry)
         
         # Create component instances
         component_instances = registry.create_component_instances(resolved_components, args.install_dir)
@@ -3,12 +3,16 @@ SuperGemini Uninstall Operation Module
 Enhanced complete deletion system with comprehensive file detection
 """
 
+import errno
+import os
 import sys
 import time
-import json
 import re
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional, Dict, Any, Set, Tuple
+from typing import Callable, Iterator, List, Optional, Dict, Any, Set, Tuple
 import argparse
 
 from ...core.registry import ComponentRegistry
@@ -20,10 +24,105 @@ from ...utils.ui import (
 )
 from ...utils.environment import get_supergemini_environment_variables, cleanup_environment_variables
 from ...utils.logger import get_logger
+from ...utils.json_scan import json_has_key
 from ... import DEFAULT_INSTALL_DIR, PROJECT_ROOT
 from ...utils.paths import get_safe_components_directory
 from ..base import OperationBase
 
+# Retry rounds and initial delay (seconds) for files locked by another process
+LOCK_RETRIES = 3
+LOCK_RETRY_DELAY = 0.1
+
+def _usable_cpu_count() -> int:
+    """CPUs this process may run on (the affinity mask, where the OS exposes one)"""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0)) or 1
+    return os.cpu_count() or 1
+
+
+# Worker threads and batch size for classifying files during uninstall scans;
+# classification is Python-bound once files are cached, so threads only pay
+# off with more than one core and a single-core machine classifies inline
+DEFAULT_SCAN_JOBS = min(8, _usable_cpu_count())
+SCAN_BATCH_SIZE = 256
+
+
+class SignatureMatcher:
+    """
+    Single-pass matcher for SuperGemini content signatures
+    
+    Every signature is reduced to the literal text its match must contain
+    (the start of each `.*`-separated part). Content is lowercased once and
+    checked for those literals with plain substring tests; only signatures
+    whose literals all occur are confirmed with their precompiled,
+    case-insensitive regex.
+    """
+    
+    _REGEX_META = set('.^$*+?{}[]|()\\')
+    
+    def __init__(self, signatures: List[str]):
+        groups: Dict[Tuple[str, ...], List[str]] = {}
+        for signature in signatures:
+            literals = tuple(
+                literal for literal in map(self._literal_prefix, signature.split('.*')) if literal
+            )
+            groups.setdefault(literals, []).append(self._bound_gap(signature))
+        
+        # (literals, pattern) pairs; signatures without literals are always confirmed
+        self.groups: List[Tuple[Tuple[str, ...], "re.Pattern[str]"]] = [
+            (literals, re.compile("|".join(f"(?:{p})" for p in patterns), re.IGNORECASE | re.MULTILINE))
+            for literals, patterns in groups.items()
+        ]
+    
+    @classmethod
+    def _literal_prefix(cls, signature: str) -> str:
+        """Lowercased literal text a signature (or `.*` part) match must start with"""
+        literal = []
+        i = 0
+        while i < len(signature):
+            char = signature[i]
+            if char == '\\':
+                escaped = signature[i + 1:i + 2]
+                if not escaped or escaped.isalnum():
+                    break  # Character class such as \s or \d
+                literal.append(escaped)
+                i += 2
+                continue
+            if char in cls._REGEX_META:
+                # A quantifier makes the previous character optional
+                if char in '*?{' and literal:
+                    literal.pop()
+                break
+            literal.append(char)
+            i += 1
+        return "".join(literal).lower()
+    
+    @classmethod
+    def _bound_gap(cls, signature: str) -> str:
+        """
+        Rewrite a `head.*tail` gap so it stops at the next `head`
+        
+        Plain `.*` rescans to the end of the line from every `head`
+        occurrence, which is quadratic on long single-line files such as
+        JSON session logs. The rewritten pattern matches the same lines.
+        """
+        head, gap, tail = signature.partition('.*')
+        if gap and head and '.*' not in tail and not cls._REGEX_META.intersection(head):
+            return f"{head}(?:(?!{head})[^\\n])*?{tail}"
+        return signature
+    
+    def search(self, content: str) -> bool:
+        """Check whether any signature matches the content"""
+        lowered = content.lower()
+        for literals, pattern in self.groups:
+            for literal in literals:
+                if literal not in lowered:
+                    break
+            else:
+                if pattern.search(content):
+                    return True
+        return False
+
 
 class SuperGeminiFileDetector:
     """Enhanced SuperGemini file detection with multiple identification strategies"""
@@ -53,6 +152,8 @@ class SuperGeminiFileDetector:
             r'mcp.*server',
             r'structured.*thinking',
         ]
+        # Built once per detector; matches any signature in a single pass
+        self.signature_matcher = SignatureMatcher(self.supergemini_signatures)
         
         # Known SuperGemini file patterns (exact matches)
         self.supergemini_files = {
@@ -71,6 +172,13 @@ class SuperGeminiFileDetector:
             'MCP_StructuredThinking.md',
         }
         
+        # SuperGemini-specific configuration keys (matched lowercase) for JSON analysis
+        self.supergemini_config_keys = (
+            'supergemini', 'mcp_servers', 'structured-thinking',
+            'context7', 'sequential-thinking', 'morphllm', 'serena', 'magic',
+            'playwright-mcp'
+        )
+        
         # Directory patterns that contain SuperGemini files
         self.supergemini_directories = {
             'commands/sg',
@@ -155,50 +263,15 @@ class SuperGeminiFileDetector:
                 content = f.read(4096)  # Read first 4KB only for efficiency
                 
                 # Check for SuperGemini signatures
-                for signature in self.supergemini_signatures:
-                    if re.search(signature, content, re.IGNORECASE | re.MULTILINE):
-                        return True
-                        
-            return False
+                return self.signature_matcher.search(content)
         except Exception:
             return False
 
     def _analyze_json_config(self, file_path: Path) -> bool:
         """Analyze JSON files for SuperGemini configurations"""
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                
-                # Check for SuperGemini-specific configuration keys
-                supergemini_keys = [
-                    'supergemini', 'SuperGemini', 'mcp_servers', 'structured-thinking',
-                    'context7', 'sequential-thinking', 'morphllm', 'serena', 'magic',
-                    'playwright-mcp'
-                ]
-                
-                def check_keys(obj, depth=0):
-                    if depth > 3:  # Prevent deep recursion
-                        return False
-                    
-                    if isinstance(obj, dict):
-                        for key, value in obj.items():
-                            if any(sg_key in str(key).lower() for sg_key in supergemini_keys):
-                                return True
-                            if isinstance(value, (dict, list)):
-                                if check_keys(value, depth + 1):
-                                    return True
-                    elif isinstance(obj, list):
-                        for item in obj:
-                            if isinstance(item, (dict, list)):
-                                if check_keys(item, depth + 1):
-                                    return True
-                    
-                    return False
-                
-                return check_keys(data)
-                
-        except Exception:
-            return False
+        # Stream keys (depth <= 3, bounded read) instead of loading the whole
+        # document; session logs under ~/.gemini can be hundreds of MB
+        return json_has_key(file_path, self.supergemini_config_keys, max_depth=3)
 
     def _is_supergemini_log(self, file_path: Path) -> bool:
         """Check if file is a SuperGemini log file"""
@@ -216,81 +289,426 @@ class SuperGeminiFileDetector:
         except Exception:
             return False
 
-    def scan_all_files(self) -> Tuple[List[Path], List[Path]]:
+    def _walk(self) -> Iterator[Tuple[Path, str, os.stat_result]]:
+        """
+        Breadth-first walk of the installation directory
+        
+        Entries are visited in name order, so the walk is deterministic.
+        Directories are tracked by (device, inode) to avoid symlink loops.
+        
+        Yields:
+            (path, kind, stat) with kind "file", "dir", or "alias" for a
+            directory already reached through another path (symlink loop or alias)
+        """
+        try:
+            root_stat = self.install_dir.stat()
+        except OSError as e:
+            self.logger.debug(f"Cannot scan {self.install_dir}: {e}")
+            return
+        
+        seen_dirs = {(root_stat.st_dev, root_stat.st_ino)}
+        dirs_to_scan = deque([self.install_dir])
+        
+        while dirs_to_scan:
+            current_dir = dirs_to_scan.popleft()
+            try:
+                with os.scandir(current_dir) as it:
+                    entries = sorted(it, key=lambda entry: entry.name)
+            except OSError as e:
+                self.logger.debug(f"Cannot scan {current_dir}: {e}")
+                continue
+            
+            for entry in entries:
+                try:
+                    if entry.is_dir():
+                        stat = entry.stat()
+                        dir_key = (stat.st_dev, stat.st_ino)
+                        if dir_key in seen_dirs:
+                            yield Path(entry.path), "alias", stat
+                        else:
+                            seen_dirs.add(dir_key)
+                            dirs_to_scan.append(Path(entry.path))
+                            yield Path(entry.path), "dir", stat
+                    elif entry.is_file():
+                        yield Path(entry.path), "file", entry.stat()
+                except OSError:
+                    continue
+
+    def _classify_batch(self, batch: List[Path]) -> List[bool]:
+        """Classify a batch of files (runs on a scan worker thread)"""
+        return [self.is_supergemini_file(file_path) for file_path in batch]
+
+    def classify_tree(self, max_workers: int = DEFAULT_SCAN_JOBS) -> "InstallationScan":
+        """
+        Walk and classify the installation directory once
+        
+        The walk runs on the calling thread and hands batches of files to a
+        thread pool for content classification, which is I/O bound. Results
+        keep walk order regardless of which batch finishes first.
+        
+        Args:
+            max_workers: Classification threads (1 classifies inline)
+        
+        Returns:
+            InstallationScan with a verdict for every file and directory
+        """
+        scan = InstallationScan(self)
+        if not self.install_dir.exists():
+            return scan
+        
+        if max_workers <= 1:
+            files = []
+            for path, kind, stat in self._walk():
+                if kind == "file":
+                    files.append(path)
+                    scan.record_stat(path, stat)
+                else:
+                    scan.add_directory(path, alias=(kind == "alias"))
+            scan.add_files(files, self._classify_batch(files))
+            return scan
+        
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="sg-scan") as executor:
+            pending = []
+            batch = []
+            for path, kind, stat in self._walk():
+                if kind != "file":
+                    scan.add_directory(path, alias=(kind == "alias"))
+                    continue
+                scan.record_stat(path, stat)
+                batch.append(path)
+                if len(batch) >= SCAN_BATCH_SIZE:
+                    pending.append((batch, executor.submit(self._classify_batch, batch)))
+                    batch = []
+            if batch:
+                pending.append((batch, executor.submit(self._classify_batch, batch)))
+            
+            for batch, future in pending:
+                scan.add_files(batch, future.result())
+        
+        return scan
+
+    def scan_all_files(self, max_workers: int = DEFAULT_SCAN_JOBS) -> Tuple[List[Path], List[Path]]:
         """
         Scan all files in installation directory
         
+        Args:
+            max_workers: Classification threads (1 classifies inline)
+        
         Returns:
             Tuple of (supergemini_files, preserved_files)
         """
-        supergemini_files = []
-        preserved_files = []
+        try:
+            scan = self.classify_tree(max_workers=max_workers)
+        except Exception as e:
+            self.logger.error(f"Error scanning files: {e}")
+            return [], []
+        return scan.supergemini_files, scan.preserved_files
+
+
+class InstallationScan:
+    """
+    Snapshot of one classification pass over an installation directory
+    
+    Holds the verdict, inode and mtime of every file, and derives directory
+    safety bottom-up from the same pass. It is shared by every uninstall
+    phase, so later phases re-check only entries that changed instead of
+    rescanning the disk.
+    """
+    
+    def __init__(self, detector: SuperGeminiFileDetector):
+        self.detector = detector
+        self.install_dir = detector.install_dir
+        # File -> is SuperGemini file, in walk order
+        self.files: Dict[Path, bool] = {}
+        # File -> (inode, mtime_ns, size) when it was classified
+        self.stats: Dict[Path, Tuple[int, int, int]] = {}
+        # Directory -> direct subdirectories, in walk order
+        self.directories: Dict[Path, List[Path]] = {self.install_dir: []}
+        # Directories holding an alias of another directory (never safe)
+        self._has_alias: Set[Path] = set()
+        self._directory_safety: Optional[Dict[Path, bool]] = None
+    
+    def add_directory(self, directory: Path, alias: bool = False) -> None:
+        """Record a directory found by the walk"""
+        if alias:
+            self._has_alias.add(directory.parent)
+            return
+        self.directories.setdefault(directory, [])
+        self.directories.setdefault(directory.parent, []).append(directory)
+        self._directory_safety = None
+    
+    def record_stat(self, file_path: Path, stat: os.stat_result) -> None:
+        """Remember the identity of a file as it was classified"""
+        self.stats[file_path] = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+    
+    def add_files(self, files: List[Path], verdicts: List[bool]) -> None:
+        """Record classified files"""
+        self.files.update(zip(files, verdicts))
+        self._directory_safety = None
+    
+    @property
+    def supergemini_files(self) -> List[Path]:
+        return [path for path, is_supergemini in self.files.items() if is_supergemini]
+    
+    @property
+    def preserved_files(self) -> List[Path]:
+        return [path for path, is_supergemini in self.files.items() if not is_supergemini]
+    
+    def covers(self, path: Path) -> bool:
+        """Check whether a path lies inside the scanned directory"""
+        return path == self.install_dir or self.install_dir in path.parents
+    
+    def is_supergemini_file(self, file_path: Path) -> bool:
+        """Verdict for a file, classifying (and remembering) files the walk did not see"""
+        verdict = self.files.get(file_path)
+        if verdict is None:
+            verdict = self.detector.is_supergemini_file(file_path)
+            self.files[file_path] = verdict
+            self._directory_safety = None
+        return verdict
+    
+    def recheck(self, file_path: Path, stat: Optional[os.stat_result] = None) -> Optional[bool]:
+        """
+        Current verdict for a file, reclassifying it only if it changed
         
-        if not self.install_dir.exists():
-            return supergemini_files, preserved_files
+        Args:
+            file_path: File to check
+            stat: Current stat of the file, if the caller already has it
         
+        Returns:
+            None if the file no longer exists, otherwise whether it is a
+            SuperGemini file (from the snapshot if inode, mtime and size still match)
+        """
+        if stat is None:
+            try:
+                stat = file_path.stat()
+            except OSError:
+                self.forget(file_path)
+                return None
+        
+        identity = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        if file_path in self.files and self.stats.get(file_path) == identity:
+            return self.files[file_path]
+        
+        self.detector.logger.debug(f"Re-checking changed file: {file_path}")
+        verdict = self.detector.is_supergemini_file(file_path)
+        self.files[file_path] = verdict
+        self.stats[file_path] = identity
+        self._directory_safety = None
+        return verdict
+    
+    def forget(self, file_path: Path) -> None:
+        """Drop a removed file from the snapshot"""
+        if self.files.pop(file_path, None) is not None:
+            self._directory_safety = None
+        self.stats.pop(file_path, None)
+    
+    def remaining_supergemini_files(self) -> List[Path]:
+        """SuperGemini files from the snapshot that still exist (changed ones re-checked)"""
+        return [path for path in list(self.files) if self.recheck(path)]
+    
+    def directories_deepest_first(self) -> List[Path]:
+        """Scanned directories (excluding the root), children before parents"""
+        return [directory for directory in reversed(list(self.directories)) if directory != self.install_dir]
+    
+    def _compute_directory_safety(self) -> Dict[Path, bool]:
+        """A directory is safe if all its files are SuperGemini files and all subdirectories are safe"""
+        safety = {directory: directory not in self._has_alias for directory in self.directories}
+        for file_path, is_supergemini in self.files.items():
+            if not is_supergemini and file_path.parent in safety:
+                safety[file_path.parent] = False
+        
+        # Walk order lists parents before children, so reverse it for bottom-up
+        for directory in reversed(list(self.directories)):
+            if safety[directory] and not all(safety[child] for child in self.directories[directory]):
+                safety[directory] = False
+        return safety
+    
+    def is_directory_safe(self, directory: Path) -> bool:
+        """
+        Check whether a directory holds only SuperGemini files (or nothing)
+        
+        Directories outside the scan, or not seen by it, are treated as
+        unsafe unless they no longer exist.
+        """
+        if self._directory_safety is None:
+            self._directory_safety = self._compute_directory_safety()
+        if directory in self._directory_safety:
+            return self._directory_safety[directory]
+        return not directory.exists()
+
+
+def _is_lock_error(error: OSError) -> bool:
+    """Check whether a removal failed because another process holds the file"""
+    # Windows sharing/lock violations, POSIX busy files
+    return getattr(error, "winerror", None) in (32, 33) or error.errno in (errno.EBUSY, errno.ETXTBSY)
+
+
+def remove_files_batched(files: List[Path],
+                         scan: Optional[InstallationScan] = None,
+                         dry_run: bool = False,
+                         lock_retries: int = LOCK_RETRIES,
+                         retry_delay: float = LOCK_RETRY_DELAY,
+                         progress_callback: Optional[Callable[[int], None]] = None) -> Dict[str, Any]:
+    """
+    Remove files directory by directory
+    
+    Each directory is listed once with os.scandir and its files are unlinked
+    relative to a directory descriptor where the platform supports it. With a
+    scan snapshot, files that changed since the scan are re-checked and kept
+    if they no longer look like SuperGemini files. Only removals that fail
+    with a lock error are retried, after everything else has been removed.
+    
+    Args:
+        files: Files to remove
+        scan: Snapshot to re-check changed files against and update
+        dry_run: Report what would be removed without removing anything
+        lock_retries: Retry rounds for locked files
+        retry_delay: Delay before the first retry round (grows linearly)
+        progress_callback: Called with the number of files handled so far
+        
+    Returns:
+        Dict with "removed", "missing" and "preserved" path lists, "failed"
+        as (path, error) pairs, and "retried" (number of lock retries)
+    """
+    result = {"removed": [], "missing": [], "preserved": [], "failed": [], "retried": 0}
+    locked: List[Tuple[Path, OSError]] = []
+    
+    by_directory: Dict[Path, List[Path]] = {}
+    for file_path in files:
+        by_directory.setdefault(file_path.parent, []).append(file_path)
+    
+    use_dir_fd = os.unlink in os.supports_dir_fd and os.scandir in os.supports_fd
+    handled = 0
+    
+    for directory, batch in by_directory.items():
+        dir_fd = None
         try:
-            # Use iterative approach to prevent recursion issues
-            dirs_to_scan = [self.install_dir]
-            processed_dirs = set()
-            
-            while dirs_to_scan:
-                current_dir = dirs_to_scan.pop(0)
+            if use_dir_fd:
+                dir_fd = os.open(directory, os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
+            with os.scandir(dir_fd if dir_fd is not None else directory) as it:
+                entries = {entry.name: entry for entry in it}
+        except OSError:
+            entries = {}
+        
+        try:
+            for file_path in batch:
+                entry = entries.get(file_path.name)
+                if entry is None:
+                    result["missing"].append(file_path)
+                    if scan is not None:
+                        scan.forget(file_path)
+                    continue
+                
+                if scan is not None:
+                    try:
+                        verdict = scan.recheck(file_path, entry.stat())
+                    except OSError:
+                        verdict = None
+                    if not verdict:
+                        result["preserved" if verdict is False else "missing"].append(file_path)
+                        continue
                 
-                # Prevent infinite loops
-                real_path = current_dir.resolve()
-                if real_path in processed_dirs:
+                if dry_run:
+                    result["removed"].append(file_path)
                     continue
-                processed_dirs.add(real_path)
                 
                 try:
-                    for item in current_dir.iterdir():
-                        if item.is_file():
-                            if self.is_supergemini_file(item):
-                                supergemini_files.append(item)
-                            else:
-                                preserved_files.append(item)
-                        elif item.is_dir():
-                            # Add to scan queue
-                            dirs_to_scan.append(item)
-                except PermissionError:
-                    self.logger.debug(f"Permission denied: {current_dir}")
-                    continue
-                    
-        except Exception as e:
-            self.logger.error(f"Error scanning files: {e}")
-        
-        return supergemini_files, preserved_files
+                    if dir_fd is not None:
+                        os.unlink(file_path.name, dir_fd=dir_fd)
+                    else:
+                        os.unlink(file_path)
+                    result["removed"].append(file_path)
+                    if scan is not None:
+                        scan.forget(file_path)
+                except FileNotFoundError:
+                    result["missing"].append(file_path)
+                except OSError as e:
+                    if _is_lock_error(e):
+                        locked.append((file_path, e))
+                    else:
+                        result["failed"].append((file_path, e))
+        finally:
+            if dir_fd is not None:
+                os.close(dir_fd)
+        
+        handled += len(batch)
+        if progress_callback:
+            progress_callback(handled)
+    
+    # Retry only locked files, with a growing delay between rounds
+    for attempt in range(lock_retries):
+        if not locked:
+            break
+        time.sleep(retry_delay * (attempt + 1))
+        still_locked = []
+        for file_path, _ in locked:
+            result["retried"] += 1
+            try:
+                os.unlink(file_path)
+                result["removed"].append(file_path)
+                if scan is not None:
+                    scan.forget(file_path)
+            except FileNotFoundError:
+                result["missing"].append(file_path)
+            except OSError as e:
+                if _is_lock_error(e):
+                    still_locked.append((file_path, e))
+                else:
+                    result["failed"].append((file_path, e))
+        locked = still_locked
+    
+    result["failed"].extend(locked)
+    return result
+
 
+def write_removal_log(log_path: Path, result: Dict[str, Any]) -> None:
+    """Write one line per file handled by remove_files_batched"""
+    with open(log_path, 'w', encoding='utf-8') as f:
+        for outcome in ("removed", "missing", "preserved"):
+            for file_path in result[outcome]:
+                f.write(f"{outcome}\t{file_path}\n")
+        for file_path, error in result["failed"]:
+            f.write(f"failed\t{file_path}\t{error}\n")
 
-def verify_supergemini_file(file_path: Path, component: str) -> bool:
+
+@lru_cache(maxsize=32)
+def _get_detector(install_dir: Path) -> SuperGeminiFileDetector:
+    """Shared detector per directory (signature tables are built once)"""
+    return SuperGeminiFileDetector(install_dir)
+
+
+def verify_supergemini_file(file_path: Path, component: str, scan: Optional[InstallationScan] = None) -> bool:
     """
     Enhanced SuperGemini file verification
     
     Args:
         file_path: Path to the file to verify
         component: Component name this file belongs to
+        scan: Classification pass to read the verdict from
         
     Returns:
         True if safe to remove, False if uncertain (preserve by default)
     """
     try:
-        # Use enhanced detector
-        detector = SuperGeminiFileDetector(file_path.parent)
-        return detector.is_supergemini_file(file_path)
+        if scan is not None and scan.covers(file_path):
+            return scan.is_supergemini_file(file_path)
+        return _get_detector(file_path.parent).is_supergemini_file(file_path)
         
     except Exception:
         # If any error occurs in verification, preserve the file
         return False
 
 
-def verify_directory_safety(directory: Path, component: str) -> bool:
+def verify_directory_safety(directory: Path, component: str, scan: Optional[InstallationScan] = None) -> bool:
     """
     Enhanced directory safety verification
     
     Args:
         directory: Directory path to verify
         component: Component name
+        scan: Classification pass to read the verdict from; without one,
+            the directory is walked once
         
     Returns:
         True if safe to remove (only if empty or only contains SuperGemini files)
@@ -299,25 +717,9 @@ def verify_directory_safety(directory: Path, component: str) -> bool:
         if not directory.exists():
             return True
         
-        # Check if directory is empty
-        contents = list(directory.iterdir())
-        if not contents:
-            return True
-        
-        # Use enhanced detector for comprehensive analysis
-        detector = SuperGeminiFileDetector(directory)
-        
-        # Check if all contents are SuperGemini files
-        for item in contents:
-            if item.is_file():
-                if not detector.is_supergemini_file(item):
-                    return False
-            elif item.is_dir():
-                # Recursively check subdirectories
-                if not verify_directory_safety(item, component):
-                    return False
-        
-        return True
+        if scan is None or not scan.covers(directory):
+            scan = SuperGeminiFileDetector(directory).classify_tree()
+        return scan.is_directory_safe(directory)
         
     except Exception:
         # If any error occurs, preserve the directory
@@ -403,6 +805,12 @@ Examples:
         help="Skip creating environment variable restore script"
     )
     
+    parser.add_argument(
+        "--removal-log",
+        type=Path,
+        help="Write the outcome for every removed file to this log file"
+    )
+    
     # Enhanced detection options
     parser.add_argument(
         "--verify-all",
@@ -448,7 +856,8 @@ def get_installation_info(install_dir: Path) -> Dict[str, Any]:
         "supergemini_files": [],
         "preserved_files": [],
         "total_size": 0,
-        "supergemini_size": 0
+        "supergemini_size": 0,
+        "scan": None
     }
     
     if not install_dir.exists():
@@ -468,9 +877,11 @@ def get_installation_info(install_dir: Path) -> Dict[str, Any]:
     
     # Enhanced file scanning with SuperGemini detection
     try:
-        detector = SuperGeminiFileDetector(install_dir)
-        supergemini_files, preserved_files = detector.scan_all_files()
+        scan = SuperGeminiFileDetector(install_dir).classify_tree()
+        supergemini_files, preserved_files = scan.supergemini_files, scan.preserved_files
         
+        # Later safety checks read from this pass instead of rescanning
+        info["scan"] = scan
         info["supergemini_files"] = supergemini_files
         info["preserved_files"] = preserved_files
         info["files"] = supergemini_files + preserved_files
@@ -491,13 +902,7 @@ def get_installation_info(install_dir: Path) -> Dict[str, Any]:
         info["total_size"] += info["supergemini_size"]
         
         # Find directories
-        visited_dirs = set()
-        for file_path in info["files"]:
-            current_dir = file_path.parent
-            while current_dir != install_dir and current_dir not in visited_dirs:
-                visited_dirs.add(current_dir)
-                info["directories"].append(current_dir)
-                current_dir = current_dir.parent
+        info["directories"] = [directory for directory in scan.directories if directory != install_dir]
                 
     except Exception as e:
         logger = get_logger()
@@ -918,6 +1323,10 @@ def perform_enhanced_uninstall(components: List[str], args: argparse.Namespace,
         # Get SuperGemini files to remove
         supergemini_files = info.get("supergemini_files", [])
         preserved_files = info.get("preserved_files", [])
+        # Snapshot from get_installation_info, shared by every phase below
+        scan = info.get("scan")
+        # Every phase only reports what it would do
+        dry_run = getattr(args, "dry_run", False)
         
         logger.info(f"Enhanced uninstall: {len(supergemini_files)} SuperGemini files, {len(preserved_files)} preserved files")
         
@@ -929,48 +1338,32 @@ def perform_enhanced_uninstall(components: List[str], args: argparse.Namespace,
             suffix=""
         )
         
-        file_manager = FileService()
-        
         # Phase 1: Remove individual SuperGemini files
         logger.info("Phase 1: Removing SuperGemini files...")
-        removed_files = []
-        failed_files = []
         
         # Close log handlers first to prevent file lock issues
-        import logging
         # Access the internal logging.Logger through the wrapper
-        internal_logger = logger.logger if hasattr(logger, 'logger') else logger
-        for handler in internal_logger.handlers[:]:
-            if hasattr(handler, 'close'):
-                handler.close()
-            internal_logger.removeHandler(handler)
-        
-        for i, file_path in enumerate(supergemini_files):
-            progress.update(i, f"Removing {file_path.name}")
-            
+        if not dry_run:
+            internal_logger = logger.logger if hasattr(logger, 'logger') else logger
+            for handler in internal_logger.handlers[:]:
+                if hasattr(handler, 'close'):
+                    handler.close()
+                internal_logger.removeHandler(handler)
+        
+        removal = remove_files_batched(
+            supergemini_files,
+            scan=scan,
+            dry_run=dry_run,
+            progress_callback=lambda handled: progress.update(handled, "Removing files")
+        )
+        removed_files = removal["removed"]
+        failed_files = [file_path for file_path, _ in removal["failed"]]
+        
+        if getattr(args, "removal_log", None):
             try:
-                if file_path.exists():
-                    # Special handling for log files - ensure they're not locked
-                    if '.log' in file_path.suffix or 'log' in file_path.name.lower():
-                        # Force close any file handles
-                        import gc
-                        gc.collect()
-                        time.sleep(0.1)  # Brief wait for file handles to release
-                    
-                    if file_manager.remove_file(file_path):
-                        removed_files.append(file_path)
-                        print(f"✓ Successfully removed: {file_path}")
-                    else:
-                        failed_files.append(file_path)
-                        print(f"✗ Failed to remove: {file_path}")
-                else:
-                    print(f"- File already removed: {file_path}")
-                    
-            except Exception as e:
-                print(f"Error removing file {file_path}: {e}")
-                failed_files.append(file_path)
-                
-            time.sleep(0.01)  # Brief pause
+                write_removal_log(args.removal_log, removal)
+            except OSError as e:
+                print(f"Could not write removal log {args.removal_log}: {e}")
         
         # Phase 2: Component-specific cleanup
         logger.info("Phase 2: Component cleanup...")
@@ -998,7 +1391,10 @@ def perform_enhanced_uninstall(components: List[str], args: argparse.Namespace,
             progress.update(len(supergemini_files) + i, f"Cleaning {component_name}")
             
             try:
-                if component_name in component_instances:
+                if component_name in component_instances and dry_run:
+                    logger.info(f"[DRY RUN] Would run {component_name} component cleanup")
+                    uninstalled_components.append(component_name)
+                elif component_name in component_instances:
                     instance = component_instances[component_name]
                     if instance.uninstall():
                         uninstalled_components.append(component_name)
@@ -1019,16 +1415,22 @@ def perform_enhanced_uninstall(components: List[str], args: argparse.Namespace,
             progress.update(len(supergemini_files) + len(components), "Cleaning environment")
             logger.info("Phase 3: Cleaning up environment variables...")
             create_restore_script = not args.no_restore_script
-            env_cleanup_success = cleanup_environment_variables(env_vars, create_restore_script)
-            
-            if env_cleanup_success:
-                logger.success(f"Removed {len(env_vars)} environment variables")
+            if dry_run:
+                logger.info(f"[DRY RUN] Would remove environment variables: {', '.join(sorted(env_vars))}")
             else:
-                logger.warning("Some environment variables could not be removed")
+                env_cleanup_success = cleanup_environment_variables(env_vars, create_restore_script)
+                
+                if env_cleanup_success:
+                    logger.success(f"Removed {len(env_vars)} environment variables")
+                else:
+                    logger.warning("Some environment variables could not be removed")
         
         # Phase 4: Clean up empty directories
         logger.info("Phase 4: Cleaning empty directories...")
-        cleanup_empty_directories(args.install_dir, preserve_patterns=None if args.complete else ['*'])
+        if dry_run:
+            logger.info("[DRY RUN] Would remove directories left empty")
+        else:
+            cleanup_empty_directories(args.install_dir, preserve_patterns=None if args.complete else ['*'], scan=scan)
         
         progress.finish("Enhanced uninstall complete")
         
@@ -1038,8 +1440,16 @@ def perform_enhanced_uninstall(components: List[str], args: argparse.Namespace,
         print(f"\n{Colors.CYAN}{Colors.BRIGHT}Uninstall Results{Colors.RESET}")
         print("=" * 50)
         
-        print(f"{Colors.GREEN}Successfully removed:{Colors.RESET}")
+        if dry_run:
+            print(f"{Colors.YELLOW}Dry run: nothing was changed{Colors.RESET}")
+        print(f"{Colors.GREEN}{'Would remove' if dry_run else 'Successfully removed'}:{Colors.RESET}")
         print(f"  SuperGemini files: {len(removed_files)}")
+        if removal["missing"]:
+            print(f"  Already removed: {len(removal['missing'])}")
+        if removal["preserved"]:
+            print(f"  Kept (changed since scan): {len(removal['preserved'])}")
+        if removal["retried"]:
+            print(f"  Lock retries: {removal['retried']}")
         print(f"  Components: {len(uninstalled_components)}")
         if args.cleanup_env and env_vars and env_cleanup_success:
             print(f"  Environment variables: {len(env_vars)}")
@@ -1053,8 +1463,11 @@ def perform_enhanced_uninstall(components: List[str], args: argparse.Namespace,
             if failed_components:
                 print(f"  Failed to clean {len(failed_components)} components")
         
+        if dry_run:
+            return not failed_files and not failed_components
+        
         # Final verification
-        remaining_files = verify_complete_removal(args.install_dir)
+        remaining_files = verify_complete_removal(args.install_dir, scan=scan)
         if remaining_files:
             print(f"\n{Colors.YELLOW}Note: {len(remaining_files)} SuperGemini files may still remain{Colors.RESET}")
             logger.warning(f"Incomplete removal: {len(remaining_files)} files remain")
@@ -1069,10 +1482,21 @@ def perform_enhanced_uninstall(components: List[str], args: argparse.Namespace,
         return False
 
 
-def cleanup_empty_directories(install_dir: Path, preserve_patterns: Optional[List[str]] = None) -> None:
+def cleanup_empty_directories(install_dir: Path, preserve_patterns: Optional[List[str]] = None,
+                              scan: Optional[InstallationScan] = None) -> None:
     """Clean up empty directories after file removal"""
     logger = get_logger()
     
+    if scan is not None:
+        # Directories come from the snapshot; rmdir itself refuses non-empty ones
+        for directory in scan.directories_deepest_first():
+            try:
+                os.rmdir(directory)
+                logger.debug(f"Removed empty directory: {directory}")
+            except OSError:
+                pass
+        return
+    
     try:
         # Find all directories
         all_dirs = []
@@ -1103,12 +1527,15 @@ def cleanup_empty_directories(install_dir: Path, preserve_patterns: Optional[Lis
         logger.debug(f"Error during directory cleanup: {e}")
 
 
-def verify_complete_removal(install_dir: Path) -> List[Path]:
+def verify_complete_removal(install_dir: Path, scan: Optional[InstallationScan] = None) -> List[Path]:
     """Verify that all SuperGemini files have been removed"""
     if not install_dir.exists():
         return []
     
     try:
+        if scan is not None:
+            return scan.remaining_supergemini_files()
+
         detector = SuperGeminiFileDetector(install_dir)
         supergemini_files, _ = detector.scan_all_files()
         return supergemini_files
@@ -1124,12 +1551,11 @@ def perform_uninstall(components: List[str], args: argparse.Namespace, info: Dic
 def cleanup_installation_directory(install_dir: Path, args: argparse.Namespace) -> None:
     """Enhanced installation directory cleanup"""
     logger = get_logger()
-    file_manager = FileService()
     
     try:
         # Use enhanced detector to identify SuperGemini files
-        detector = SuperGeminiFileDetector(install_dir)
-        supergemini_files, preserved_files = detector.scan_all_files()
+        scan = SuperGeminiFileDetector(install_dir).classify_tree()
+        supergemini_files, preserved_files = scan.supergemini_files, scan.preserved_files
         
         # Build preserve patterns
         preserve_patterns = []
@@ -1143,15 +1569,12 @@ def cleanup_installation_directory(install_dir: Path, args: argparse.Namespace)
         
         # Remove SuperGemini files specifically
         logger.info(f"Removing {len(supergemini_files)} SuperGemini files...")
-        for file_path in supergemini_files:
-            try:
-                if file_path.exists():
-                    file_manager.remove_file(file_path)
-            except Exception as e:
-                logger.debug(f"Could not remove {file_path}: {e}")
+        removal = remove_files_batched(supergemini_files, scan=scan)
+        for file_path, error in removal["failed"]:
+            logger.debug(f"Could not remove {file_path}: {error}")
         
         # Clean up empty directories
-        cleanup_empty_directories(install_dir, preserve_patterns)
+        cleanup_empty_directories(install_dir, preserve_patterns, scan=scan)
         
         logger.info(f"Cleanup complete: removed SuperGemini files, preserved {len(preserved_files)} user files")
         
@@ -1236,7 +1659,7 @@ def run(args: argparse.Namespace) -> int:
             
             # Offer to clean up empty directory
             if info["exists"] and (info["files"] or info["directories"]):
-                if not args.no_confirm:
+                if not args.no_confirm and not args.dry_run:
                     if confirm(f"Remove empty directory {args.install_dir}?", default=False):
                         try:
                             import shutil
@@ -1307,7 +1730,9 @@ def run(args: argparse.Namespace) -> int:
         success = perform_enhanced_uninstall(components, args, info, env_vars)
         
         if success:
-            if not args.quiet:
+            if not args.quiet and args.dry_run:
+                display_success("Dry run complete; nothing was removed")
+            elif not args.quiet:
                 display_success("SuperGemini enhanced uninstall completed successfully!")
                 
                 if not args.dry_run:
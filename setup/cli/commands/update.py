@@ -11,6 +11,7 @@ import argparse
 
 from ...core.installer import Installer
 from ...core.registry import ComponentRegistry
+from ...services.gemini_md import IMPORT_PROFILES
 from ...services.settings import SettingsService
 from ...core.validator import Validator
 from ...utils.ui import (
@@ -19,6 +20,8 @@ from ...utils.ui import (
 )
 from ...utils.environment import setup_environment_variables
 from ...utils.logger import get_logger
+from ...utils.npm import get_npm_global_inventory
+from ...utils.probe_cache import ProbeCache, PROBE_CACHE_FILENAME, get_default_probe_cache_ttl
 from ... import DEFAULT_INSTALL_DIR, PROJECT_ROOT
 from ...utils.paths import get_safe_components_directory
 from ..base import OperationBase
@@ -77,6 +80,48 @@ Examples:
         help="Skip backup creation"
     )
     
+    parser.add_argument(
+        "--import-profile",
+        choices=list(IMPORT_PROFILES),
+        help="Framework files GEMINI.md imports into every prompt (default: last used, else full)"
+    )
+    
+    parser.add_argument(
+        "--context-budget",
+        type=int,
+        metavar="TOKENS",
+        help="Warn when GEMINI.md and its imports exceed this many estimated tokens"
+    )
+    
+    parser.add_argument(
+        "--strict-budget",
+        action="store_true",
+        help="Leave GEMINI.md unchanged and fail instead of warning when over --context-budget"
+    )
+    
+    parser.add_argument(
+        "--minify",
+        action="store_const",
+        const=True,
+        dest="minify",
+        help="Install compact Markdown copies (no comments, example sections or repeated blocks) "
+             "and report the token savings; the source files are not changed (default: last used)"
+    )
+    
+    parser.add_argument(
+        "--no-minify",
+        action="store_const",
+        const=False,
+        dest="minify",
+        help="Install the Markdown files as shipped"
+    )
+    
+    parser.add_argument(
+        "--backup-dedup",
+        action="store_true",
+        help="Back up into the deduplicated snapshot store instead of a full archive"
+    )
+    
     # Update options
     parser.add_argument(
         "--reinstall",
@@ -146,6 +191,32 @@ def display_update_check(installed_components: Dict[str, str], available_updates
     print()
 
 
+def display_mcp_package_status(install_dir: Path, registry: ComponentRegistry) -> None:
+    """Display installed versions of configured MCP server packages"""
+    mcp_instance = registry.get_component_instance("mcp", install_dir)
+    if not mcp_instance:
+        return
+    
+    configured_servers = mcp_instance._get_installed_servers()
+    
+    # Load the npm inventory through the persistent probe cache so repeated
+    # `update --check` runs skip `npm ls -g` until a global package changes
+    probe_cache = ProbeCache(install_dir / PROBE_CACHE_FILENAME, get_default_probe_cache_ttl())
+    get_npm_global_inventory(probe_cache=probe_cache)
+    versions = mcp_instance.get_server_package_versions(configured_servers)
+    if not versions:
+        return
+    
+    print(f"{Colors.BLUE}MCP server packages:{Colors.RESET}")
+    for server_key, version in versions.items():
+        package = mcp_instance.mcp_servers[server_key]["npm_package"]
+        if version:
+            print(f"  {server_key}: {package} v{version}")
+        else:
+            print(f"  {server_key}: {package} {Colors.YELLOW}(not installed){Colors.RESET}")
+    print()
+
+
 def get_components_to_update(args: argparse.Namespace, installed_components: Dict[str, str], 
                            available_updates: Dict[str, Dict[str, str]]) -> Optional[List[str]]:
     """Determine which components to update"""
@@ -282,11 +353,11 @@ def perform_update(components: List[str], args: argparse.Namespace) -> bool:
     start_time = time.time()
     
     try:
-        # Create installer
-        installer = Installer(args.install_dir, dry_run=args.dry_run)
-        
         # Create component registry
         registry = ComponentRegistry(get_safe_components_directory())
+        
+        # Create installer
+        installer = Installer(args.install_dir, dry_run=args.dry_run, registry=registry)
         registry.discover_components()
         
         # Create component instances
@@ -335,20 +406,22 @@ def perform_update(components: List[str], args: argparse.Namespace) -> bool:
         config = {
             "force": args.force,
             "backup": backup,
+            "backup_dedup": args.backup_dedup,
+            "import_profile": args.import_profile,
+            "context_budget": args.context_budget,
+            "strict_context_budget": args.strict_budget,
+            "minify": args.minify,
             "dry_run": args.dry_run,
             "update_mode": True,
             "selected_mcp_servers": list(mcp_instance.mcp_servers.keys()) if "mcp" in component_instances else []
         }
         
-        success = installer.update_components(components, config)
+        # Progress is reported as components finish (the installer serializes callbacks)
+        def report_progress(component_name: str, updated: bool, completed: int, total: int) -> None:
+            status = "Updated" if updated else "Failed"
+            progress.update(min(completed, progress.total), f"{status} {component_name}")
         
-        # Update progress
-        for i, component_name in enumerate(components):
-            if component_name in installer.updated_components:
-                progress.update(i + 1, f"Updated {component_name}")
-            else:
-                progress.update(i + 1, f"Failed {component_name}")
-            time.sleep(0.1)  # Brief pause for visual effect
+        success = installer.update_components(components, config, progress_callback=report_progress)
         
         progress.finish("Update complete")
         
@@ -362,6 +435,13 @@ def perform_update(components: List[str], args: argparse.Namespace) -> bool:
             summary = installer.get_update_summary()
             if summary.get('updated'):
                 logger.info(f"Updated components: {', '.join(summary['updated'])}")
+
+            if summary.get('files_skipped') or summary.get('files_removed'):
+                logger.info(
+                    f"Files: {summary['files_copied']} copied, "
+                    f"{summary['files_skipped']} unchanged skipped ({format_size(summary['bytes_skipped'])}), "
+                    f"{summary['files_removed']} obsolete removed"
+                )
             
             if summary.get('backup_path'):
                 logger.info(f"Backup created: {summary['backup_path']}")
@@ -438,6 +518,8 @@ def run(args: argparse.Namespace) -> int:
         
         # If only checking for updates, exit here
         if args.check:
+            if not args.quiet and "mcp" in installed_components:
+                display_mcp_package_status(args.install_dir, registry)
             return 0
         
         # Get components to update
@@ -1,10 +1,16 @@
 """Component implementations for SuperGemini installation system"""
 
-from .core import CoreComponent
-from .commands import CommandsComponent
-from .mcp import MCPComponent
-from .modes import ModesComponent
-from .mcp_docs import MCPDocsComponent
+import importlib
+
+# Component classes are imported on first access so that loading one
+# component module (e.g. via the registry index) does not import them all
+_COMPONENT_MODULES = {
+    'CoreComponent': 'core',
+    'CommandsComponent': 'commands',
+    'MCPComponent': 'mcp',
+    'ModesComponent': 'modes',
+    'MCPDocsComponent': 'mcp_docs'
+}
 
 __all__ = [
     'CoreComponent',
@@ -12,4 +18,11 @@ __all__ = [
     'MCPComponent',
     'ModesComponent',
     'MCPDocsComponent'
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    if name in _COMPONENT_MODULES:
+        module = importlib.import_module(f".{_COMPONENT_MODULES[name]}", __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -6,11 +6,19 @@ from typing import Dict, List, Tuple, Optional, Any
 from pathlib import Path
 import re
 
-from ..core.base import Component
+from ..core.base import Component, FileTransform
+from ..services.gemini_md import ON_DEMAND_DOCS, loads_docs_on_demand
+
+# Bump when the on-demand section changes so installed commands are rewritten
+ON_DEMAND_SECTION_VERSION = 1
 
 class CommandsComponent(Component):
     """SuperGemini slash commands component"""
     
+    component_name = "commands"
+    component_category = "commands"
+    component_dependencies = ("core",)
+    
     def __init__(self, install_dir: Optional[Path] = None):
         """Initialize commands component"""
         super().__init__(install_dir, Path("commands/sg"))
@@ -42,10 +50,10 @@ class CommandsComponent(Component):
     def get_metadata(self) -> Dict[str, str]:
         """Get component metadata"""
         return {
-            "name": "commands",
+            "name": self.component_name,
             "version": "4.3.0",
             "description": "SuperGemini slash command definitions",
-            "category": "commands"
+            "category": self.component_category
         }
     
     def get_metadata_modifications(self) -> Dict[str, Any]:
@@ -74,6 +82,36 @@ class CommandsComponent(Component):
 
         return super()._install(config);
 
+    def get_file_transform(self, config: Dict[str, Any]) -> Optional[FileTransform]:
+        """
+        Teach the installed commands to read mode and MCP guides on demand
+        when the import profile keeps them out of GEMINI.md
+        """
+        if not loads_docs_on_demand(config.get("import_profile")):
+            return None
+        transform_id = f"on-demand-docs/{ON_DEMAND_SECTION_VERSION}:{self.install_dir.as_posix()}"
+        return transform_id, self._add_on_demand_section
+
+    def _add_on_demand_section(self, source: Path, text: str) -> str:
+        """Append the flag-to-guide instructions to a command's prompt"""
+        opening = text.find('"""')
+        closing = text.rfind('"""')
+        if opening < 0 or closing <= opening:
+            self.logger.debug(f"{source.name} has no multi-line prompt; installed unchanged")
+            return text
+
+        lines = [
+            "## On-Demand Context",
+            "",
+            "Mode and MCP guides are not preloaded. If this command was invoked with one of "
+            f"these flags, first read the guide from `{self.install_dir.as_posix()}/` and follow it "
+            "(skip guides that are not installed):",
+        ]
+        for doc, flags in ON_DEMAND_DOCS.items():
+            lines.append(f"- {', '.join(f'`{flag}`' for flag in flags)}: {doc}")
+
+        return text[:closing].rstrip("\n") + "\n\n" + "\n".join(lines) + "\n" + text[closing:]
+
     def _post_install(self) -> bool:
         # Convert MD files to TOML for Gemini CLI compatibility
         self._convert_md_to_toml()
@@ -163,6 +201,8 @@ class CommandsComponent(Component):
             except Exception as e:
                 self.logger.warning(f"Could not update metadata: {e}")
             
+            self.get_manifest().remove()
+
             self.logger.success(f"Commands component uninstalled ({removed_count} files removed)")
             return True
             
@@ -170,10 +210,6 @@ class CommandsComponent(Component):
             self.logger.exception(f"Unexpected error during commands uninstallation: {e}")
             return False
     
-    def get_dependencies(self) -> List[str]:
-        """Get dependencies"""
-        return ["core"]
-    
     def update(self, config: Dict[str, Any]) -> bool:
         """Update commands component"""
         try:
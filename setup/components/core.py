@@ -12,6 +12,10 @@ from ..services.gemini_md import GEMINIMdService
 class CoreComponent(Component):
     """Core SuperGemini framework files component"""
     
+    component_name = "core"
+    component_category = "core"
+    component_dependencies = ()
+    
     def __init__(self, install_dir: Optional[Path] = None):
         """Initialize core component"""
         super().__init__(install_dir)
@@ -20,10 +24,10 @@ class CoreComponent(Component):
         """Get component metadata"""
         from .. import __version__
         return {
-            "name": "core",
+            "name": self.component_name,
             "version": __version__,
             "description": "SuperGemini framework documentation and core files",
-            "category": "core"
+            "category": self.component_category
         }
     
     def get_metadata_modifications(self) -> Dict[str, Any]:
@@ -86,7 +90,7 @@ class CoreComponent(Component):
         try:
             manager = GEMINIMdService(self.install_dir)
             manager.add_imports(self.component_files, category="Core Framework")
-            self.logger.info("Updated GEMINI.md with core framework imports")
+            self.logger.info("Registered core framework imports for GEMINI.md")
         except Exception as e:
             self.logger.warning(f"Failed to update GEMINI.md with core framework imports: {e}")
             # Don't fail the whole installation for this
@@ -124,6 +128,8 @@ class CoreComponent(Component):
             except Exception as e:
                 self.logger.warning(f"Could not update metadata: {e}")
             
+            self.get_manifest().remove()
+
             self.logger.success(f"Core component uninstalled ({removed_count} files removed)")
             return True
             
@@ -131,10 +137,6 @@ class CoreComponent(Component):
             self.logger.exception(f"Unexpected error during core uninstallation: {e}")
             return False
     
-    def get_dependencies(self) -> List[str]:
-        """Get component dependencies (core has none)"""
-        return []
-    
     def update(self, config: Dict[str, Any]) -> bool:
         """Update core component"""
         try:
@@ -8,6 +8,7 @@ import time
 import sys
 import subprocess
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, List, Tuple, Optional, Any
 from pathlib import Path
 
@@ -24,11 +25,22 @@ except ImportError:
 
 from ..core.base import Component
 from ..utils.ui import display_info, display_warning
+from ..utils.npm import (
+    get_npm_global_inventory, invalidate_npm_global_inventory,
+    get_installed_npm_version, npm_package_name
+)
+
+# Default number of MCP server packages installed concurrently
+DEFAULT_MCP_JOBS = 4
 
 
 class MCPComponent(Component):
     """MCP servers configuration component"""
     
+    component_name = "mcp"
+    component_category = "integration"
+    component_dependencies = ("core",)
+    
     def __init__(self, install_dir: Optional[Path] = None):
         """Initialize MCP component"""
         super().__init__(install_dir)
@@ -130,10 +142,10 @@ class MCPComponent(Component):
         """Get component metadata"""
         from .. import __version__
         return {
-            "name": "mcp",
+            "name": self.component_name,
             "version": __version__,
             "description": "MCP server configuration management via .gemini.json",
-            "category": "integration"
+            "category": self.component_category
         }
     
     def set_selected_servers(self, selected_servers: List[str]) -> None:
@@ -361,6 +373,45 @@ class MCPComponent(Component):
             self.logger.error(f"Installation error for {server_key}: {e}")
             return False
     
+    def _install_npm_packages_batch(self, server_keys: List[str]) -> bool:
+        """
+        Install the npm packages of several MCP servers with a single npm call
+        
+        Args:
+            server_keys: Server keys whose packages are installed via npm
+            
+        Returns:
+            True if the batched install succeeded for every package
+        """
+        npm_packages = [self.mcp_servers[key]["npm_package"] for key in server_keys]
+        if not npm_packages:
+            return True
+        
+        try:
+            self.logger.info(f"Installing {len(npm_packages)} npm packages in one batch: {' '.join(npm_packages)}")
+            
+            result = subprocess.run(
+                ["npm", "install", "-g"] + npm_packages,
+                capture_output=True,
+                text=True,
+                timeout=180 * len(npm_packages),
+                shell=(sys.platform == "win32")
+            )
+            
+            if result.returncode == 0:
+                self.logger.info(f"Successfully installed npm batch: {len(npm_packages)} packages")
+                return True
+            else:
+                self.logger.warning(f"Batched npm install failed: {result.stderr}")
+                return False
+                
+        except subprocess.TimeoutExpired:
+            self.logger.warning("Batched npm install timeout")
+            return False
+        except Exception as e:
+            self.logger.warning(f"Batched npm install error: {e}")
+            return False
+    
     def _install_uv_package(self, server_key: str, server_info: Dict[str, Any]) -> bool:
         """Install uv package for Python-based MCP server (like Serena)"""
         uv_package = server_info.get("uv_package")
@@ -404,31 +455,105 @@ class MCPComponent(Component):
             return self._verify_npm_installation(server_key, server_info)
     
     def _verify_npm_installation(self, server_key: str, server_info: Dict[str, Any]) -> bool:
-        """Verify npm package installation"""
+        """Verify npm package installation against the cached global npm inventory"""
         npm_package = server_info.get("npm_package")
         if not npm_package:
             return False
         
-        try:
-            result = subprocess.run(
-                ["npm", "list", "-g", npm_package.split('@')[0]],
-                capture_output=True,
-                text=True,
-                timeout=30,
-                shell=(sys.platform == "win32")
-            )
-            
-            if result.returncode == 0:
-                self.logger.info(f"Verified installation: {server_key}")
-                return True
-            else:
-                self.logger.warning(f"Package verification failed: {npm_package}")
-                return False
-                
-        except Exception as e:
-            self.logger.error(f"Verification failed for {server_key}: {e}")
+        inventory = get_npm_global_inventory()
+        if inventory is not None and npm_package_name(npm_package) not in inventory:
+            # Another worker may have read the inventory before this install finished
+            inventory = get_npm_global_inventory(refresh=True)
+        if inventory is None:
+            self.logger.warning(f"Could not read global npm packages to verify {server_key}")
+            return False
+        
+        if npm_package_name(npm_package) in inventory:
+            self.logger.info(f"Verified installation: {server_key}")
+            return True
+        else:
+            self.logger.warning(f"Package verification failed: {npm_package}")
             return False
     
+    def get_server_package_versions(self, server_keys: List[str]) -> Dict[str, Optional[str]]:
+        """
+        Get installed package versions for MCP servers from the cached npm inventory
+        
+        Args:
+            server_keys: Server keys to look up (non-npm servers are skipped)
+            
+        Returns:
+            Dict mapping server key to installed version, or None if not installed
+        """
+        versions = {}
+        for server_key in server_keys:
+            npm_package = self.mcp_servers.get(server_key, {}).get("npm_package")
+            if npm_package:
+                versions[server_key] = get_installed_npm_version(npm_package)
+        return versions
+    
+    def _install_server_package(self, server_key: str, preinstalled: bool = False) -> Dict[str, bool]:
+        """Install and verify a single MCP server package (runs in a worker thread)"""
+        server_info = self.mcp_servers[server_key]
+        installed = preinstalled or self._install_mcp_server_package(server_key, server_info)
+        verified = installed and self._verify_mcp_installation(server_key, server_info)
+        return {"installed": installed, "verified": verified}
+    
+    def _install_server_packages(self, server_keys: List[str], max_workers: int = DEFAULT_MCP_JOBS,
+                                 batch_npm: bool = False) -> Dict[str, Dict[str, bool]]:
+        """
+        Install and verify MCP server packages on a bounded worker pool
+        
+        Each worker verifies its package right after installing it, so slow
+        verifications (uv runs a subprocess) overlap with other installs.
+        
+        Args:
+            server_keys: Known server keys to install
+            max_workers: Maximum number of concurrent installs
+            batch_npm: Install all npm packages with one npm call first, falling
+                back to per-package installs if the batch fails
+            
+        Returns:
+            Dict mapping server key to {"installed": bool, "verified": bool}
+        """
+        results: Dict[str, Dict[str, bool]] = {}
+        if not server_keys:
+            return results
+        
+        preinstalled = set()
+        if batch_npm:
+            npm_keys = [
+                key for key in server_keys
+                if self.mcp_servers[key].get("install_method", "npm") == "npm"
+                and self.mcp_servers[key].get("npm_package")
+            ]
+            if len(npm_keys) > 1:
+                if self._install_npm_packages_batch(npm_keys):
+                    preinstalled.update(npm_keys)
+                else:
+                    self.logger.info("Falling back to installing npm packages individually")
+        
+        # Verification reads npm's global tree; drop any copy read before these installs
+        invalidate_npm_global_inventory()
+        
+        workers = max(1, min(max_workers, len(server_keys)))
+        self.logger.info(f"Installing {len(server_keys)} MCP server packages ({workers} parallel jobs)")
+        
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(self._install_server_package, server_key, server_key in preinstalled): server_key
+                for server_key in server_keys
+            }
+            for future in as_completed(futures):
+                server_key = futures[future]
+                try:
+                    results[server_key] = future.result()
+                except Exception as e:
+                    self.logger.error(f"Installation error for {server_key}: {e}")
+                    results[server_key] = {"installed": False, "verified": False}
+        
+        return results
+    
     def _verify_uv_installation(self, server_key: str, server_info: Dict[str, Any]) -> bool:
         """Verify uv package installation"""
         try:
@@ -667,26 +792,34 @@ class MCPComponent(Component):
                 self.logger.error(error)
             return False
         
-        # Phase 1: Install npm packages (NEW - v3 logic)
+        # Phase 1: Install and verify packages concurrently (NEW - v3 logic)
         installed_count = 0
         failed_servers = []
         
+        known_servers = []
         for server_key in selected_servers:
             if server_key not in self.mcp_servers:
                 self.logger.warning(f"Unknown MCP server: {server_key}")
                 failed_servers.append(server_key)
-                continue
-            
+            else:
+                known_servers.append(server_key)
+        
+        max_workers = config.get("mcp_jobs") or DEFAULT_MCP_JOBS
+        install_results = self._install_server_packages(
+            known_servers, max_workers, batch_npm=config.get("mcp_npm_batch", False)
+        )
+        
+        # Report per-server results in selection order
+        for server_key in known_servers:
             server_info = self.mcp_servers[server_key]
+            result = install_results.get(server_key, {})
             
-            # Step 1: Install actual npm package
-            if not self._install_mcp_server_package(server_key, server_info):
+            if not result.get("installed"):
                 self.logger.error(f"Failed to install npm package for {server_key}")
                 failed_servers.append(server_key)
                 continue
             
-            # Step 2: Verify installation
-            if not self._verify_mcp_installation(server_key, server_info):
+            if not result.get("verified"):
                 self.logger.warning(f"Installation verification failed for {server_key}")
                 # Continue anyway as package might still work
             
@@ -857,6 +990,15 @@ class MCPComponent(Component):
             except Exception as e:
                 self.logger.warning(f"Could not update settings.json: {e}")
             
+            # Global npm packages are shared and left in place; point them out
+            leftover = [
+                self.mcp_servers[key]["npm_package"]
+                for key, version in self.get_server_package_versions(installed_servers).items()
+                if version
+            ]
+            if leftover:
+                self.logger.info(f"MCP server packages still installed globally: {', '.join(leftover)}")
+            
             if removed_count > 0:
                 self.logger.success(f"MCP component uninstalled ({removed_count} SuperGemini-managed servers removed)")
             else:
@@ -914,10 +1056,6 @@ class MCPComponent(Component):
         
         return True
     
-    def get_dependencies(self) -> List[str]:
-        """Get dependencies"""
-        return ["core"]
-    
     def get_size_estimate(self) -> int:
         """Get estimated size - minimal since we only modify config"""
         return 4096  # 4KB - just config modifications
@@ -12,6 +12,10 @@ from ..services.gemini_md import GEMINIMdService
 class MCPDocsComponent(Component):
     """MCP documentation component - installs docs for selected MCP servers"""
     
+    component_name = "mcp_docs"
+    component_category = "documentation"
+    component_dependencies = ("core",)
+    
     def __init__(self, install_dir: Optional[Path] = None):
         """Initialize MCP docs component"""
         # Initialize attributes before calling parent constructor
@@ -33,10 +37,10 @@ class MCPDocsComponent(Component):
     def get_metadata(self) -> Dict[str, str]:
         """Get component metadata"""
         return {
-            "name": "mcp_docs",
+            "name": self.component_name,
             "version": "4.3.0",
             "description": "MCP server documentation and usage guides",
-            "category": "documentation"
+            "category": self.component_category
         }
     
     def set_selected_servers(self, selected_servers: List[str]) -> None:
@@ -113,16 +117,9 @@ class MCPDocsComponent(Component):
             self.logger.warning("No MCP documentation files found to install")
             return True  # Not an error - just no docs to install
 
-        # Copy documentation files
-        success_count = 0
-        for source, target in files_to_install:
-            self.logger.debug(f"Copying {source.name} to {target}")
-            
-            if self.file_manager.copy_file(source, target):
-                success_count += 1
-                self.logger.debug(f"Successfully copied {source.name}")
-            else:
-                self.logger.error(f"Failed to copy {source.name}")
+        # Copy changed files
+        success_count = self._sync_files(files_to_install, force=config.get("force_overwrite", False),
+                                         transform=self.get_file_transform(config))
 
         if success_count != len(files_to_install):
             self.logger.error(f"Only {success_count}/{len(files_to_install)} documentation files copied successfully")
@@ -162,7 +159,7 @@ class MCPDocsComponent(Component):
             try:
                 manager = GEMINIMdService(self.install_dir)
                 manager.add_imports(self.component_files, category="MCP Documentation")
-                self.logger.info("Updated GEMINI.md with MCP documentation imports")
+                self.logger.info("Registered MCP documentation imports for GEMINI.md")
             except Exception as e:
                 self.logger.warning(f"Failed to update GEMINI.md with MCP documentation imports: {e}")
                 # Don't fail the whole installation for this
@@ -207,6 +204,8 @@ class MCPDocsComponent(Component):
             except Exception as e:
                 self.logger.warning(f"Could not update settings.json: {e}")
             
+            self.get_manifest().remove()
+
             self.logger.success(f"MCP documentation uninstalled ({removed_count} files removed)")
             return True
             
@@ -214,10 +213,6 @@ class MCPDocsComponent(Component):
             self.logger.exception(f"Unexpected error during MCP docs uninstallation: {e}")
             return False
     
-    def get_dependencies(self) -> List[str]:
-        """Get dependencies"""
-        return ["core"]
-    
     def _get_source_dir(self) -> Optional[Path]:
         """Get source directory for MCP documentation files"""
         # Assume we're in SuperGemini/setup/components/mcp_docs.py
@@ -12,6 +12,10 @@ from ..services.gemini_md import GEMINIMdService
 class ModesComponent(Component):
     """SuperGemini behavioral modes component"""
     
+    component_name = "modes"
+    component_category = "modes"
+    component_dependencies = ("core",)
+    
     def __init__(self, install_dir: Optional[Path] = None):
         """Initialize modes component"""
         super().__init__(install_dir, Path(""))
@@ -19,10 +23,10 @@ class ModesComponent(Component):
     def get_metadata(self) -> Dict[str, str]:
         """Get component metadata"""
         return {
-            "name": "modes",
+            "name": self.component_name,
             "version": "4.3.0",
             "description": "SuperGemini behavioral modes (Brainstorming, Introspection, Task Management, Token Efficiency)",
-            "category": "modes"
+            "category": self.component_category
         }
     
     def _install(self, config: Dict[str, Any]) -> bool:
@@ -43,16 +47,9 @@ class ModesComponent(Component):
             self.logger.warning("No mode files found to install")
             return False
 
-        # Copy mode files
-        success_count = 0
-        for source, target in files_to_install:
-            self.logger.debug(f"Copying {source.name} to {target}")
-            
-            if self.file_manager.copy_file(source, target):
-                success_count += 1
-                self.logger.debug(f"Successfully copied {source.name}")
-            else:
-                self.logger.error(f"Failed to copy {source.name}")
+        # Copy changed files
+        success_count = self._sync_files(files_to_install, force=config.get("force_overwrite", False),
+                                         transform=self.get_file_transform(config))
 
         if success_count != len(files_to_install):
             self.logger.error(f"Only {success_count}/{len(files_to_install)} mode files copied successfully")
@@ -90,7 +87,7 @@ class ModesComponent(Component):
             try:
                 manager = GEMINIMdService(self.install_dir)
                 manager.add_imports(self.component_files, category="Behavioral Modes")
-                self.logger.info("Updated GEMINI.md with mode imports")
+                self.logger.info("Registered mode imports for GEMINI.md")
             except Exception as e:
                 self.logger.warning(f"Failed to update GEMINI.md with mode imports: {e}")
                 # Don't fail the whole installation for this
@@ -130,6 +127,8 @@ class ModesComponent(Component):
             except Exception as e:
                 self.logger.warning(f"Could not update settings.json: {e}")
             
+            self.get_manifest().remove()
+
             self.logger.success(f"Modes component uninstalled ({removed_count} files removed)")
             return True
             
@@ -137,10 +136,6 @@ class ModesComponent(Component):
             self.logger.exception(f"Unexpected error during modes uninstallation: {e}")
             return False
     
-    def get_dependencies(self) -> List[str]:
-        """Get dependencies"""
-        return ["core"]
-    
     def _get_source_dir(self) -> Optional[Path]:
         """Get source directory for mode files"""
         # Assume we're in SuperGemini/setup/components/modes.py
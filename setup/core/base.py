@@ -3,18 +3,31 @@ Abstract base class for installable components
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Tuple, Optional, Any
+from typing import Callable, List, Dict, Tuple, Optional, Any
 from pathlib import Path
 import json
 from ..services.files import FileService
+from ..services.gemini_md import format_token_change
+from ..services.manifest import ManifestService
 from ..services.settings import SettingsService
 from ..utils.logger import get_logger
+from ..utils.minify import MINIFY_VERSION, minify_file
+from ..utils.ui import format_size
 from ..utils.security import SecurityValidator
 
+# (transform id, function(source, text) -> installed text); the id is recorded
+# in the install manifest so installed copies are rewritten when it changes
+FileTransform = Tuple[str, Callable[[Path, str], str]]
+
 
 class Component(ABC):
     """Base class for all installable components"""
     
+    # Discovery metadata, read by ComponentRegistry without instantiating the class
+    component_name: str = ""
+    component_category: str = ""
+    component_dependencies: Tuple[str, ...] = ()
+    
     def __init__(self, install_dir: Optional[Path] = None, component_subdir: Path = Path('')):
         """
         Initialize component with installation directory
@@ -32,6 +45,8 @@ class Component(ABC):
         self._component_files = None
         self.file_manager = FileService()
         self.install_component_subdir = self.install_dir / component_subdir
+        # Copy statistics from the last _sync_files() run
+        self.sync_stats: Dict[str, int] = {}
     
     @property
     def component_files(self) -> List[str]:
@@ -128,6 +143,23 @@ class Component(ABC):
 
         return files
     
+    def get_file_transform(self, config: Dict[str, Any]) -> Optional[FileTransform]:
+        """
+        Return the transform installed copies are written with
+
+        Only the installed copies change; the source tree is left untouched.
+        With config["minify"], Markdown files are installed minified.
+
+        Args:
+            config: Installation configuration
+
+        Returns:
+            FileTransform, or None to copy files as they are
+        """
+        if config.get("minify"):
+            return f"minify/{MINIFY_VERSION}", minify_file
+        return None
+    
     def get_settings_modifications(self) -> Dict[str, Any]:
         """
         Return settings.json modifications to apply
@@ -167,16 +199,9 @@ class Component(ABC):
         # Get files to install
         files_to_install = self.get_files_to_install()
 
-        # Copy framework files
-        success_count = 0
-        for source, target in files_to_install:
-            self.logger.debug(f"Copying {source.name} to {target}")
-
-            if self.file_manager.copy_file(source, target):
-                success_count += 1
-                self.logger.debug(f"Successfully copied {source.name}")
-            else:
-                self.logger.error(f"Failed to copy {source.name}")
+        # Copy changed framework files
+        success_count = self._sync_files(files_to_install, force=config.get("force_overwrite", False),
+                                         transform=self.get_file_transform(config))
 
         if success_count != len(files_to_install):
             self.logger.error(f"Only {success_count}/{len(files_to_install)} files copied successfully")
@@ -187,6 +212,110 @@ class Component(ABC):
         return self._post_install()
 
     
+    def get_manifest(self) -> ManifestService:
+        """Install manifest of this component"""
+        return ManifestService(self.install_dir, self.component_name or self.get_metadata()["name"])
+
+    def _sync_files(self, files_to_install: List[Tuple[Path, Path]], force: bool = False,
+                    transform: Optional[FileTransform] = None) -> int:
+        """
+        Copy files whose source changed since the last install and remove files
+        that are no longer part of the component, using the install manifest
+        
+        Args:
+            files_to_install: (source, target) pairs
+            force: Copy every file regardless of the manifest
+            transform: Write each file through this transform instead of
+                copying it (files installed with another transform are redone)
+            
+        Returns:
+            Number of files now in place (copied or already up to date)
+        """
+        manifest = self.get_manifest()
+        previous = manifest.load()
+        entries = {}
+        stats = {"copied": 0, "skipped": 0, "removed": 0, "bytes_copied": 0, "bytes_skipped": 0}
+        transform_id, transform_func = transform or (None, None)
+        if transform_func is not None:
+            stats.update({"bytes_source": 0, "bytes_installed": 0})
+
+        for source, target in files_to_install:
+            key = manifest.relative_key(target)
+            entry = previous.get(key)
+            source_hash = self.file_manager.get_file_hash(source)
+
+            if (not force and source_hash and entry
+                    and entry.get("source_sha256") == source_hash
+                    and entry.get("transform") == transform_id
+                    and manifest.target_unchanged(target, entry)):
+                entries[key] = entry
+                stats["skipped"] += 1
+                stats["bytes_skipped"] += entry.get("size", 0)
+                if transform_func is not None:
+                    stats["bytes_source"] += source.stat().st_size
+                    stats["bytes_installed"] += entry.get("size", 0)
+                continue
+
+            self.logger.debug(f"Copying {source.name} to {target}")
+
+            if transform_func is None:
+                copied = self.file_manager.copy_file(source, target)
+                installed_hash = source_hash
+            else:
+                try:
+                    content = transform_func(source, source.read_text(encoding='utf-8'))
+                except (OSError, ValueError) as e:
+                    self.logger.error(f"Could not transform {source.name}: {e}")
+                    continue
+                copied = self.file_manager.write_file(target, content, source)
+                installed_hash = self.file_manager.get_file_hash(target) if copied else None
+
+            if copied:
+                entries[key] = manifest.make_entry(target, installed_hash, source_hash, transform_id)
+                stats["copied"] += 1
+                stats["bytes_copied"] += entries[key]["size"]
+                if transform_func is not None:
+                    stats["bytes_source"] += source.stat().st_size
+                    stats["bytes_installed"] += entries[key]["size"]
+                self.logger.debug(f"Successfully copied {source.name}")
+            else:
+                self.logger.error(f"Failed to copy {source.name}")
+
+        # Remove files that dropped out of the source, unless the user changed them
+        for key, entry in previous.items():
+            if key in entries:
+                continue
+            target = manifest.target_path(key)
+            if target is None:
+                self.logger.warning(f"Ignoring manifest entry outside the install dir: {key}")
+                continue
+            if manifest.target_unchanged(target, entry):
+                if self.file_manager.remove_file(target):
+                    stats["removed"] += 1
+                    self.logger.debug(f"Removed obsolete file {key}")
+            elif target.exists():
+                self.logger.debug(f"Keeping obsolete file {key} (modified since install)")
+
+        try:
+            manifest.save(entries)
+        except OSError as e:
+            self.logger.warning(f"Could not write install manifest: {e}")
+
+        self.sync_stats = stats
+        if transform_func is not None:
+            self.logger.info(
+                f"{repr(self)}: installed with {transform_id}, "
+                f"{format_token_change(stats['bytes_source'], stats['bytes_installed'])}"
+            )
+        if stats["skipped"] or stats["removed"]:
+            self.logger.info(
+                f"{repr(self)}: {stats['copied']} files copied ({format_size(stats['bytes_copied'])}), "
+                f"{stats['skipped']} unchanged skipped ({format_size(stats['bytes_skipped'])}), "
+                f"{stats['removed']} obsolete removed"
+            )
+
+        return stats["copied"] + stats["skipped"]
+
     @abstractmethod
     def _post_install(self) -> bool:
         pass
@@ -202,7 +331,6 @@ class Component(ABC):
         """
         pass
     
-    @abstractmethod
     def get_dependencies(self) -> List[str]:
         """
         Return list of component dependencies
@@ -210,7 +338,7 @@ class Component(ABC):
         Returns:
             List of component names this component depends on
         """
-        pass
+        return list(self.component_dependencies)
 
     @abstractmethod
     def _get_source_dir(self) -> Optional[Path]:
@@ -227,6 +355,11 @@ class Component(ABC):
         Returns:
             True if successful, False otherwise
         """
+        # With an install manifest, reinstall in place: unchanged files are
+        # skipped and files dropped from the source are removed
+        if self.get_manifest().manifest_file.exists():
+            return self.install(config)
+
         # Default implementation: uninstall and reinstall
         if self.uninstall():
             return self.install(config)
@@ -2,13 +2,27 @@
 Base installer logic for SuperGemini installation system fixed some issues
 """
 
-from typing import List, Dict, Optional, Set, Tuple, Any
+from typing import List, Dict, Optional, Set, Tuple, Any, Callable
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 import shutil
-import tempfile
+import threading
 from datetime import datetime
 from .base import Component
+from .registry import ComponentRegistry
+from ..services.backup_catalog import BackupCatalog
+from ..services.backup_store import BackupStore
+from ..services.gemini_md import GEMINIMdService, format_token_change
+from ..services.settings import SettingsService
+from ..utils.archive import write_backup_archive
 from ..utils.logger import get_logger
+from ..utils.ui import format_size
+
+# Default number of components installed concurrently within a dependency level
+DEFAULT_INSTALL_JOBS = 4
+
+# Called as progress_callback(component_name, success, completed_count, total_count)
+ProgressCallback = Callable[[str, bool, int, int], None]
 
 
 class Installer:
@@ -16,17 +30,26 @@ class Installer:
 
     def __init__(self,
                  install_dir: Optional[Path] = None,
-                 dry_run: bool = False):
+                 dry_run: bool = False,
+                 max_workers: int = DEFAULT_INSTALL_JOBS,
+                 registry: Optional[ComponentRegistry] = None):
         """
         Initialize installer
         
         Args:
             install_dir: Target installation directory
             dry_run: If True, only simulate installation
+            max_workers: Maximum components installed concurrently per dependency level
+            registry: Registry whose dependency graph groups components into
+                levels (default: the bundled components)
         """
         from .. import DEFAULT_INSTALL_DIR
+        from ..utils.paths import get_safe_components_directory
         self.install_dir = install_dir or DEFAULT_INSTALL_DIR
+        self.registry = registry or ComponentRegistry(get_safe_components_directory())
         self.dry_run = dry_run
+        self.max_workers = max(1, max_workers)
+        self._state_lock = threading.Lock()
         self.components: Dict[str, Component] = {}
         self.installed_components: Set[str] = set()
         self.updated_components: Set[str] = set()
@@ -98,6 +121,25 @@ class Installer:
 
         return resolved
 
+    def get_installation_levels(self, ordered_names: List[str]) -> List[List[str]]:
+        """
+        Group resolved components into dependency levels
+        
+        Components within a level do not depend on each other and can be
+        installed concurrently once all previous levels are done. The levels
+        come from the registry (ComponentRegistry.get_installation_order).
+        
+        Args:
+            ordered_names: Component names in dependency order (from resolve_dependencies)
+            
+        Returns:
+            List of levels, each a list of component names in resolved order
+            
+        Raises:
+            ValueError: If the registry does not know a component or finds a cycle
+        """
+        return self.registry.get_installation_order(ordered_names)
+
     def validate_system_requirements(self) -> Tuple[bool, List[str]]:
         """
         Validate system requirements for all registered components
@@ -129,12 +171,17 @@ class Installer:
 
         return len(errors) == 0, errors
 
-    def create_backup(self) -> Optional[Path]:
+    def create_backup(self, dedup: bool = False) -> Optional[Path]:
         """
         Create backup of existing installation
         
+        Args:
+            dedup: Snapshot into the deduplicated backup store instead of
+                writing a full archive
+        
         Returns:
-            Path to backup archive or None if no existing installation
+            Path to backup archive (or snapshot manifest) or None if no
+            existing installation
         """
         if not self.install_dir.exists():
             return None
@@ -149,38 +196,39 @@ class Installer:
         # Create timestamped backup
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         backup_name = f"supergemini_backup_{timestamp}"
+        exclude = [self.install_dir / "backups", self.install_dir / "local"]
+
+        if dedup:
+            stats = BackupStore(backup_dir).create_snapshot(
+                self.install_dir, name=backup_name, exclude=exclude, logger=self.logger
+            )
+            self.logger.debug(
+                f"Snapshot {backup_name}: {stats['files']} files, {stats['new_blobs']} new blobs "
+                f"({format_size(stats['bytes_stored'])} stored)"
+            )
+            self.backup_path = stats["path"]
+            return self.backup_path
+
         backup_path = backup_dir / f"{backup_name}.tar.gz"
 
-        # Create temporary directory for backup
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_backup = Path(temp_dir) / backup_name
-
-            # Ensure temp backup directory exists
-            temp_backup.mkdir(parents=True, exist_ok=True)
-
-            # Copy all files except backups and local directories
-            for item in self.install_dir.iterdir():
-                if item.name not in ["backups", "local"]:
-                    try:
-                        if item.is_file():
-                            shutil.copy2(item, temp_backup / item.name)
-                        elif item.is_dir():
-                            shutil.copytree(item, temp_backup / item.name)
-                    except Exception as e:
-                        # Log warning but continue backup process
-                        self.logger.warning(f"Could not backup {item.name}: {e}")
-
-            # Create archive only if there are files to backup
-            if any(temp_backup.iterdir()):
-                # shutil.make_archive adds .tar.gz automatically, so use base name without extensions
-                base_path = backup_dir / backup_name
-                shutil.make_archive(str(base_path), 'gztar', temp_backup)
-            else:
-                # Create empty backup file to indicate backup was attempted
-                backup_path.touch()
-                self.logger.warning(
-                    f"No files to backup, created empty backup marker: {backup_path.name}"
-                )
+        # Stream files straight from the install dir into the archive,
+        # leaving out backups and local directories
+        stats = write_backup_archive(
+            self.install_dir,
+            backup_path,
+            method="gzip",
+            exclude=exclude,
+            index=True,
+            logger=self.logger
+        )
+        BackupCatalog(backup_dir).record(backup_path, stats["files"])
+        if stats["files"] == 0:
+            self.logger.warning(f"No files to backup, created empty backup: {backup_path.name}")
+        else:
+            self.logger.debug(
+                f"Backed up {stats['files']} files ({format_size(stats['bytes_in'])}) "
+                f"at {stats['throughput']:.1f} MB/s"
+            )
 
         self.backup_path = backup_path
         return backup_path
@@ -209,10 +257,11 @@ class Installer:
         # Check prerequisites
         success, errors = component.validate_prerequisites()
         if not success:
-            self.logger.error(f"Prerequisites failed for {component_name}:")
-            for error in errors:
-                self.logger.error(f"  - {error}")
-            self.failed_components.add(component_name)
+            # Emit as one message so concurrent installs don't interleave the list
+            details = "".join(f"\n  - {error}" for error in errors)
+            self.logger.error(f"Prerequisites failed for {component_name}:{details}")
+            with self._state_lock:
+                self.failed_components.add(component_name)
             return False
 
         # Perform installation
@@ -223,28 +272,36 @@ class Installer:
             else:
                 success = component.install(config)
 
-            if success:
-                self.installed_components.add(component_name)
-                self.updated_components.add(component_name)
-            else:
-                self.failed_components.add(component_name)
+            with self._state_lock:
+                if success:
+                    self.installed_components.add(component_name)
+                    self.updated_components.add(component_name)
+                else:
+                    self.failed_components.add(component_name)
 
             return success
 
         except Exception as e:
             self.logger.error(f"Error installing {component_name}: {e}")
-            self.failed_components.add(component_name)
+            with self._state_lock:
+                self.failed_components.add(component_name)
             return False
 
     def install_components(self,
                            component_names: List[str],
-                           config: Optional[Dict[str, Any]] = None) -> bool:
+                           config: Optional[Dict[str, Any]] = None,
+                           progress_callback: Optional[ProgressCallback] = None) -> bool:
         """
         Install multiple components in dependency order
         
+        Each dependency level is installed on a thread pool once the previous
+        level has finished. Components serialize their own writes to shared
+        files (GEMINI.md, .supergemini-metadata.json) through the services.
+        
         Args:
             component_names: List of component names to install
             config: Installation configuration
+            progress_callback: Called once per finished component (serialized)
             
         Returns:
             True if all successful, False if any failed
@@ -254,6 +311,7 @@ class Installer:
         # Resolve dependencies
         try:
             ordered_names = self.resolve_dependencies(component_names)
+            levels = self.get_installation_levels(ordered_names)
         except ValueError as e:
             self.logger.error(f"Dependency resolution error: {e}")
             return False
@@ -266,28 +324,103 @@ class Installer:
                 self.logger.error(f"  - {error}")
             return False
 
-        # Create backup if updating
-        if self.install_dir.exists() and not self.dry_run:
+        # Create backup if updating, unless update_components already made one
+        if (config.get("backup", True) and self.backup_path is None
+                and self.install_dir.exists() and not self.dry_run):
             self.logger.info("Creating backup of existing installation...")
             try:
-                self.create_backup()
+                self.create_backup(dedup=config.get("backup_dedup", False))
             except Exception as e:
                 self.logger.error(f"Failed to create backup: {e}")
                 return False
 
-        # Install each component
+        # Minify installed copies if asked to, or if the last install did
+        minify_requested = config.get("minify")
+        minify = self.resolve_minify(minify_requested)
+
+        # Install level by level; components within a level run concurrently
+        completed = 0
+        total = len(ordered_names)
         all_success = True
-        for name in ordered_names:
+        any_installed = False
+
+        def install_one(name: str) -> bool:
+            nonlocal completed
             self.logger.info(f"Installing {name}...")
-            if not self.install_component(name, config):
-                all_success = False
-                # Continue installing other components even if one fails
+            success = self.install_component(name, config)
+            with self._state_lock:
+                completed += 1
+                if progress_callback:
+                    progress_callback(name, success, completed, total)
+            return success
 
-        if not self.dry_run:
+        # Components register their GEMINI.md imports; they are written once
+        # after every level has finished
+        with GEMINIMdService(self.install_dir).transaction(
+                profile=config.get("import_profile"),
+                budget=config.get("context_budget"),
+                strict=config.get("strict_context_budget", False),
+                remember=True) as gemini_md_changes:
+            # Components see the resolved profile (commands adapt to it)
+            config = dict(config, import_profile=gemini_md_changes.profile, minify=minify)
+            for level in levels:
+                workers = min(self.max_workers, len(level))
+                if workers == 1:
+                    results = [install_one(name) for name in level]
+                else:
+                    with ThreadPoolExecutor(max_workers=workers) as executor:
+                        results = list(executor.map(install_one, level))
+
+                # Continue installing other components even if one fails
+                if not all(results):
+                    all_success = False
+                any_installed = any_installed or any(results)
+
+            # A dry run, or a run where nothing installed, leaves GEMINI.md
+            # and the remembered profile/budget as they were
+            if self.dry_run or not any_installed:
+                if self.dry_run:
+                    self.logger.info("[DRY RUN] Would update GEMINI.md imports")
+                gemini_md_changes.discard()
+
+        if gemini_md_changes.result is False:
+            all_success = False
+
+        if minify:
+            self.report_token_savings([self.components[name] for name in self.installed_components])
+        if not self.dry_run and any_installed and minify_requested is not None:
+            self.save_minify(minify)
+
+        if not self.dry_run and not config.get("skip_validation", False):
             self._run_post_install_validation()
 
         return all_success
 
+    def resolve_minify(self, minify: Optional[bool]) -> bool:
+        """Use the minify setting of the last install when none was given"""
+        if minify is not None:
+            return minify
+        try:
+            return bool(SettingsService(self.install_dir).get_metadata_setting("install.minify", False))
+        except ValueError:
+            return False
+
+    def save_minify(self, minify: bool) -> None:
+        """Remember the minify setting for later updates"""
+        try:
+            SettingsService(self.install_dir).update_metadata({"install": {"minify": minify}})
+        except ValueError as e:
+            self.logger.warning(f"Could not save minify setting: {e}")
+
+    def report_token_savings(self, components: List[Component]) -> None:
+        """Log the before/after token estimate of transformed installed copies"""
+        stats = [component.sync_stats for component in components
+                 if "bytes_source" in component.sync_stats]
+        if stats:
+            before = sum(s["bytes_source"] for s in stats)
+            after = sum(s["bytes_installed"] for s in stats)
+            self.logger.info(f"Installed framework files: {format_token_change(before, after)}")
+
     def _run_post_install_validation(self) -> None:
         """Run post-installation validation for all installed components"""
         self.logger.info("Running post-installation validation...")
@@ -309,9 +442,15 @@ class Installer:
             self.logger.info("All components validated successfully!")
         else:
             self.logger.error("Some components failed validation. Check errors above.")
-    def update_components(self, component_names: List[str], config: Dict[str, Any]) -> bool:
+    def update_components(self, component_names: List[str], config: Dict[str, Any],
+                          progress_callback: Optional[ProgressCallback] = None) -> bool:
         """Alias for update operation (uses install logic)"""
-        return self.install_components(component_names, config)
+        if config.get("backup") and self.backup_path is None:
+            try:
+                self.create_backup(dedup=config.get("backup_dedup", False))
+            except Exception as e:
+                self.logger.warning(f"Could not create backup before update: {e}")
+        return self.install_components(component_names, config, progress_callback)
 
 
     def get_installation_summary(self) -> Dict[str, Any]:
@@ -331,8 +470,17 @@ class Installer:
         }
 
     def get_update_summary(self) -> Dict[str, Any]:
+        # Incremental copy statistics from the install manifests
+        sync_stats = [
+            self.components[name].sync_stats
+            for name in self.updated_components if name in self.components
+        ]
         return {
             'updated': list(self.updated_components),
             'failed': list(self.failed_components),
-            'backup_path': str(self.backup_path) if self.backup_path else None
+            'backup_path': str(self.backup_path) if self.backup_path else None,
+            'files_copied': sum(stats.get('copied', 0) for stats in sync_stats),
+            'files_skipped': sum(stats.get('skipped', 0) for stats in sync_stats),
+            'files_removed': sum(stats.get('removed', 0) for stats in sync_stats),
+            'bytes_skipped': sum(stats.get('bytes_skipped', 0) for stats in sync_stats)
         }
@@ -2,46 +2,165 @@
 Component registry for auto-discovery and dependency resolution
 """
 
+import hashlib
 import importlib
 import inspect
-from typing import Dict, List, Set, Optional, Type
+import json
+import os
+from typing import Dict, List, Set, Optional, Tuple, Type, Any
 from pathlib import Path
 from .base import Component
 from ..utils.logger import get_logger
 
+# Discovery index generated next to the component modules
+COMPONENT_INDEX_FILENAME = "components.index.json"
+COMPONENT_INDEX_VERSION = 3
+
 
 class ComponentRegistry:
     """Auto-discovery and management of installable components"""
     
-    def __init__(self, components_dir: Path):
+    def __init__(self, components_dir: Path, use_index: bool = True):
         """
         Initialize component registry
         
         Args:
             components_dir: Directory containing component modules
+            use_index: Read components.index.json instead of importing every module
         """
         self.components_dir = components_dir
+        self.use_index = use_index
         self.component_classes: Dict[str, Type[Component]] = {}
+        self.component_index: Dict[str, Dict[str, Any]] = {}
         self.dependency_graph: Dict[str, Set[str]] = {}
         self._discovered = False
         self.logger = get_logger()
     
-    def discover_components(self, force_reload: bool = False) -> None:
+    @property
+    def index_file(self) -> Path:
+        """Path of the component discovery index"""
+        return self.components_dir / COMPONENT_INDEX_FILENAME
+    
+    def _get_module_files(self) -> List[Path]:
+        """Component module files in the components directory"""
+        return sorted(
+            py_file for py_file in self.components_dir.glob("*.py")
+            if not py_file.name.startswith("__")
+        )
+    
+    def _get_module_hashes(self) -> Dict[str, str]:
+        """
+        sha256 of each component module's source, by module name
+        
+        Line endings are normalized so a CRLF checkout of the same source
+        matches an index generated from LF files.
+        """
+        hashes = {}
+        for py_file in self._get_module_files():
+            source = py_file.read_bytes().replace(b"\r\n", b"\n")
+            hashes[py_file.stem] = hashlib.sha256(source).hexdigest()
+        return hashes
+    
+    def _load_index(self) -> bool:
+        """
+        Load discovery data from the component index
+        
+        Returns:
+            True if a fresh index was loaded, False if it is missing, invalid or stale
+        """
+        try:
+            with open(self.index_file, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+            module_hashes = self._get_module_hashes()
+        except (OSError, ValueError):
+            return False
+        
+        if not isinstance(index, dict) or index.get("version") != COMPONENT_INDEX_VERSION:
+            return False
+        
+        # Stale if modules were added, removed or edited since the index was
+        # written; compared by content because wheel and zip installs do not
+        # keep file mtimes
+        if index.get("modules") != module_hashes:
+            self.logger.debug("Component index is stale (component modules changed)")
+            return False
+        
+        try:
+            for name, entry in index.get("components", {}).items():
+                self.component_index[name] = {
+                    "module": entry["module"],
+                    "class": entry["class"],
+                    "dependencies": list(entry.get("dependencies", [])),
+                    "category": entry.get("category", "unknown")
+                }
+                self.dependency_graph[name] = set(entry.get("dependencies", []))
+        except (KeyError, TypeError, AttributeError):
+            self.component_index.clear()
+            self.dependency_graph.clear()
+            return False
+        
+        return True
+    
+    def _get_index_data(self) -> Dict[str, Any]:
+        """Index dict for the currently discovered components"""
+        return {
+            "version": COMPONENT_INDEX_VERSION,
+            "modules": self._get_module_hashes(),
+            "components": {
+                name: self.component_index[name]
+                for name in sorted(self.component_index)
+            }
+        }
+    
+    def _save_index(self) -> None:
+        """Atomically write the current discovery data to components.index.json"""
+        tmp_file = self.index_file.with_name(f"{COMPONENT_INDEX_FILENAME}.{os.getpid()}.tmp")
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(self._get_index_data(), f, indent=2)
+            f.write("\n")
+        os.replace(tmp_file, self.index_file)
+    
+    def write_index(self) -> Path:
         """
-        Auto-discover all component classes in components directory
+        Scan every component module and write components.index.json
+        
+        Returns:
+            Path of the written index
+        """
+        self.discover_components(force_reload=True, use_index=False)
+        self._save_index()
+        return self.index_file
+    
+    def discover_components(self, force_reload: bool = False, use_index: Optional[bool] = None) -> None:
+        """
+        Auto-discover all components in components directory
+        
+        Uses components.index.json when it is fresh, so no component module is
+        imported until a component class is actually requested. Falls back to
+        importing and scanning every module when the index is missing or stale;
+        the scan is kept in memory only, since the index may live in a
+        read-only install (scripts/generate_component_index.py writes it).
         
         Args:
             force_reload: Force rediscovery even if already done
+            use_index: Override the registry's use_index setting
         """
         if self._discovered and not force_reload:
             return
         
         self.component_classes.clear()
+        self.component_index.clear()
         self.dependency_graph.clear()
         
         if not self.components_dir.exists():
             return
         
+        if use_index is None:
+            use_index = self.use_index
+        if use_index and self._load_index():
+            self._discovered = True
+            return
+        
         # Add components directory to Python path temporarily
         import sys
         original_path = sys.path.copy()
@@ -64,8 +183,6 @@ class ComponentRegistry:
             # Restore original Python path
             sys.path = original_path
         
-        # Build dependency graph
-        self._build_dependency_graph()
         self._discovered = True
     
     def _load_component_module(self, module_name: str) -> None:
@@ -81,42 +198,62 @@ class ComponentRegistry:
             module = importlib.import_module(full_module_name)
             
             # Find all Component subclasses in the module
-            for name, obj in inspect.getmembers(module):
-                if (inspect.isclass(obj) and 
-                    issubclass(obj, Component) and 
-                    obj is not Component):
-                    
-                    # Create temporary instance to get metadata, then store class only
+            for name, obj in inspect.getmembers(module, inspect.isclass):
+                if issubclass(obj, Component) and obj is not Component:
                     try:
-                        temp_instance = obj()
-                        metadata = temp_instance.get_metadata()
-                        component_name = metadata["name"]
-                        
+                        component_name, dependencies, category = self._read_class_metadata(obj)
                         self.component_classes[component_name] = obj
-                        # Don't store instances during discovery to avoid circular dependencies
-                        # Instances will be created on-demand when needed
-                        
+                        self.component_index[component_name] = {
+                            "module": full_module_name,
+                            "class": obj.__name__,
+                            "dependencies": list(dependencies),
+                            "category": category
+                        }
+                        self.dependency_graph[component_name] = set(dependencies)
                     except Exception as e:
-                        self.logger.warning(f"Could not instantiate component {name}: {e}")
+                        self.logger.warning(f"Could not read metadata for component {name}: {e}")
         
         except Exception as e:
             self.logger.warning(f"Could not load component module {module_name}: {e}")
     
-    def _build_dependency_graph(self) -> None:
-        """Build dependency graph for all discovered components"""
-        for name, component_class in self.component_classes.items():
-            try:
-                # Create temporary instance to get dependencies
-                temp_instance = component_class()
-                dependencies = temp_instance.get_dependencies()
-                self.dependency_graph[name] = set(dependencies)
-            except Exception as e:
-                self.logger.warning(f"Could not get dependencies for {name}: {e}")
-                self.dependency_graph[name] = set()
+    @staticmethod
+    def _read_class_metadata(component_class: Type[Component]) -> Tuple[str, List[str], str]:
+        """
+        Read discovery metadata from a component class
+        
+        Classes declaring component_name are read without being instantiated;
+        older components without class-level metadata fall back to a temporary instance.
+        
+        Returns:
+            Tuple of (name, dependencies, category)
+        """
+        if component_class.component_name:
+            return (
+                component_class.component_name,
+                list(component_class.component_dependencies),
+                component_class.component_category
+            )
+        
+        temp_instance = component_class()
+        metadata = temp_instance.get_metadata()
+        return metadata["name"], temp_instance.get_dependencies(), metadata.get("category", "unknown")
+    
+    def _import_indexed_component(self, component_name: str) -> Optional[Type[Component]]:
+        """Import the module of one indexed component and return its class"""
+        entry = self.component_index[component_name]
+        try:
+            module = importlib.import_module(entry["module"])
+            component_class = getattr(module, entry["class"])
+        except Exception as e:
+            self.logger.warning(f"Could not load component {component_name}: {e}")
+            return None
+        
+        self.component_classes[component_name] = component_class
+        return component_class
     
     def get_component_class(self, component_name: str) -> Optional[Type[Component]]:
         """
-        Get component class by name
+        Get component class by name, importing only its module if needed
         
         Args:
             component_name: Name of component
@@ -125,6 +262,8 @@ class ComponentRegistry:
             Component class or None if not found
         """
         self.discover_components()
+        if component_name not in self.component_classes and component_name in self.component_index:
+            return self._import_indexed_component(component_name)
         return self.component_classes.get(component_name)
     
     def get_component_instance(self, component_name: str, install_dir: Optional[Path] = None) -> Optional[Component]:
@@ -141,7 +280,7 @@ class ComponentRegistry:
         self.discover_components()
         
         # Always create new instance (avoid caching to prevent circular references)
-        component_class = self.component_classes.get(component_name)
+        component_class = self.get_component_class(component_name)
         if component_class:
             try:
                 return component_class(install_dir) if install_dir else component_class()
@@ -159,7 +298,7 @@ class ComponentRegistry:
             List of component names
         """
         self.discover_components()
-        return list(self.component_classes.keys())
+        return list(self.component_index.keys())
     
     def get_component_metadata(self, component_name: str) -> Optional[Dict[str, str]]:
         """
@@ -173,7 +312,7 @@ class ComponentRegistry:
         """
         self.discover_components()
         # Create temporary instance to get metadata
-        component_class = self.component_classes.get(component_name)
+        component_class = self.get_component_class(component_name)
         if component_class:
             try:
                 temp_instance = component_class()
@@ -204,7 +343,7 @@ class ComponentRegistry:
             try:
                 from ..services.settings import SettingsService
                 settings_manager = SettingsService(install_dir)
-                for comp_name in self.component_instances.keys():
+                for comp_name in self.component_index.keys():
                     if settings_manager.is_component_installed(comp_name):
                         installed_components.add(comp_name)
                         self.logger.debug(f"Component {comp_name} is already installed")
@@ -331,13 +470,9 @@ class ComponentRegistry:
         self.discover_components()
         components = []
         
-        for name, instance in self.component_instances.items():
-            try:
-                metadata = instance.get_metadata()
-                if metadata.get("category") == category:
-                    components.append(name)
-            except Exception:
-                continue
+        for name, entry in self.component_index.items():
+            if entry.get("category") == category:
+                components.append(name)
         
         return components
     
@@ -355,16 +490,18 @@ class ComponentRegistry:
         self.discover_components()
         
         # Get all components including dependencies
-        all_components = set(self.resolve_dependencies(component_names))
+        ordered = self.resolve_dependencies(component_names)
         
-        # Group by dependency level
+        # Group by dependency level, keeping the resolved order within a level
         levels = []
-        remaining = all_components.copy()
+        remaining = set(ordered)
         
         while remaining:
             # Find components with no unresolved dependencies
             current_level = []
-            for name in list(remaining):
+            for name in ordered:
+                if name not in remaining:
+                    continue
                 deps = self.dependency_graph.get(name, set())
                 unresolved_deps = deps & remaining
                 
@@ -414,20 +551,14 @@ class ComponentRegistry:
         
         # Group components by category
         categories = {}
-        for name, instance in self.component_instances.items():
-            try:
-                metadata = instance.get_metadata()
-                category = metadata.get("category", "unknown")
-                if category not in categories:
-                    categories[category] = []
-                categories[category].append(name)
-            except Exception:
-                if "unknown" not in categories:
-                    categories["unknown"] = []
-                categories["unknown"].append(name)
+        for name, entry in self.component_index.items():
+            category = entry.get("category") or "unknown"
+            if category not in categories:
+                categories[category] = []
+            categories[category].append(name)
         
         return {
-            "total_components": len(self.component_classes),
+            "total_components": len(self.component_index),
             "categories": categories,
             "dependency_graph": {name: list(deps) for name, deps in self.dependency_graph.items()},
             "validation_errors": self.validate_dependency_graph()
@@ -5,10 +5,13 @@ System validation for SuperGemini installation requirements
 import subprocess
 import sys
 import shutil
-from typing import Tuple, List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Tuple, List, Dict, Any, Optional, Callable
 from pathlib import Path
 import re
 
+from ..utils.probe_cache import ProbeCache, PROBE_CACHE_FILENAME, get_default_probe_cache_ttl
+
 # Handle packaging import - if not available, use a simple version comparison
 try:
     from packaging import version
@@ -50,12 +53,102 @@ except ImportError:
             return SimpleVersion(version_str)
 
 
+# Total time allowed for all concurrent requirement probes (seconds)
+DEFAULT_PROBE_DEADLINE = 15.0
+
+
 class Validator:
     """System requirements validator"""
     
-    def __init__(self):
-        """Initialize validator"""
+    def __init__(self, install_dir: Optional[Path] = None, probe_cache_ttl: Optional[int] = None,
+                 probe_deadline: float = DEFAULT_PROBE_DEADLINE):
+        """
+        Initialize validator
+        
+        Args:
+            install_dir: Installation directory holding the persistent probe cache
+                (probe results are only cached in memory if not given)
+            probe_cache_ttl: Seconds probe results stay valid on disk
+                (defaults to SUPERGEMINI_PROBE_CACHE_TTL or 24h, 0 disables)
+            probe_deadline: Total seconds allowed for concurrently running checks
+        """
         self.validation_cache: Dict[str, Any] = {}
+        self.probe_deadline = probe_deadline
+        self.probe_cache: Optional[ProbeCache] = None
+        if install_dir is not None:
+            ttl = get_default_probe_cache_ttl() if probe_cache_ttl is None else probe_cache_ttl
+            self.probe_cache = ProbeCache(Path(install_dir) / PROBE_CACHE_FILENAME, ttl)
+    
+    def _run_probe(self, command: List[str]) -> subprocess.CompletedProcess:
+        """
+        Run a version probe, answering from the persistent probe cache when possible
+        
+        Args:
+            command: Probe command, e.g. ['node', '--version']
+            
+        Returns:
+            CompletedProcess with text stdout/stderr
+            
+        Raises:
+            subprocess.TimeoutExpired, FileNotFoundError: As subprocess.run
+        """
+        cache_key = None
+        if self.probe_cache is not None:
+            executable = shutil.which(command[0])
+            if executable:
+                cache_key = ProbeCache.make_key(command, executable)
+        
+        if cache_key:
+            cached = self.probe_cache.get(cache_key)
+            if cached is not None:
+                return cached
+        
+        # Use shell=True on Windows for better PATH resolution
+        result = subprocess.run(
+            command,
+            capture_output=True,
+            text=True,
+            timeout=10,
+            shell=(sys.platform == "win32")
+        )
+        
+        if cache_key:
+            self.probe_cache.put(cache_key, result)
+        return result
+    
+    def _run_checks(self, checks: List[Tuple[str, Callable[[], Tuple[bool, str]]]]) -> Dict[str, Tuple[bool, str]]:
+        """
+        Run independent checks concurrently under one total deadline
+        
+        Args:
+            checks: (name, check callable) pairs
+            
+        Returns:
+            Dict mapping check name to (success, message); checks still running
+            at the deadline are reported as timed out
+        """
+        results: Dict[str, Tuple[bool, str]] = {}
+        if not checks:
+            return results
+        
+        executor = ThreadPoolExecutor(max_workers=len(checks))
+        try:
+            futures = {executor.submit(check): name for name, check in checks}
+            done, _ = wait(futures, timeout=self.probe_deadline)
+            
+            for future, name in futures.items():
+                if future not in done:
+                    results[name] = (False, f"Check did not finish within {self.probe_deadline:g}s")
+                    continue
+                try:
+                    results[name] = future.result()
+                except Exception as e:
+                    results[name] = (False, f"Check failed: {e}")
+        finally:
+            # Don't wait for probes that overran the deadline
+            executor.shutdown(wait=False)
+        
+        return results
     
     def check_python(self, min_version: str = "3.8", max_version: Optional[str] = None) -> Tuple[bool, str]:
         """
@@ -114,14 +207,8 @@ class Validator:
             return self.validation_cache[cache_key]
         
         try:
-            # Check if node is installed - use shell=True on Windows for better PATH resolution
-            result = subprocess.run(
-                ['node', '--version'],
-                capture_output=True,
-                text=True,
-                timeout=10,
-                shell=(sys.platform == "win32")
-            )
+            # Check if node is installed
+            result = self._run_probe(['node', '--version'])
             
             if result.returncode != 0:
                 help_msg = self.get_installation_help("node")
@@ -182,14 +269,8 @@ class Validator:
             return self.validation_cache[cache_key]
         
         try:
-            # Check if gemini is installed - use shell=True on Windows for better PATH resolution
-            result = subprocess.run(
-                ['gemini', '--version'],
-                capture_output=True,
-                text=True,
-                timeout=10,
-                shell=(sys.platform == "win32")
-            )
+            # Check if gemini is installed
+            result = self._run_probe(['gemini', '--version'])
             
             if result.returncode != 0:
                 help_msg = self.get_installation_help("gemini_cli")
@@ -252,13 +333,7 @@ class Validator:
             # Split command into parts
             cmd_parts = command.split()
             
-            result = subprocess.run(
-                cmd_parts,
-                capture_output=True,
-                text=True,
-                timeout=10,
-                shell=(sys.platform == "win32")
-            )
+            result = self._run_probe(cmd_parts)
             
             if result.returncode != 0:
                 result_tuple = (False, f"{tool_name} not found or command failed")
@@ -382,51 +457,57 @@ class Validator:
         Returns:
             Tuple of (all_passed: bool, error_messages: List[str])
         """
-        errors = []
+        checks = []
         
         # Check Python requirements
         if "python" in requirements:
             python_req = requirements["python"]
-            success, message = self.check_python(
+            checks.append(("python", lambda: self.check_python(
                 python_req["min_version"],
                 python_req.get("max_version")
-            )
-            if not success:
-                errors.append(f"Python: {message}")
+            )))
         
         # Check Node.js requirements
         if "node" in requirements:
             node_req = requirements["node"]
-            success, message = self.check_node(
+            checks.append(("node", lambda: self.check_node(
                 node_req["min_version"],
                 node_req.get("max_version")
-            )
-            if not success:
-                errors.append(f"Node.js: {message}")
+            )))
         
         # Check disk space
         if "disk_space_mb" in requirements:
-            success, message = self.check_disk_space(
+            checks.append(("disk_space", lambda: self.check_disk_space(
                 Path.home(),
                 requirements["disk_space_mb"]
-            )
-            if not success:
-                errors.append(f"Disk space: {message}")
+            )))
         
         # Check external tools
-        if "external_tools" in requirements:
-            for tool_name, tool_req in requirements["external_tools"].items():
+        tool_requirements = requirements.get("external_tools", {})
+        for tool_name, tool_req in tool_requirements.items():
+            checks.append((f"tool:{tool_name}", lambda tool_name=tool_name, tool_req=tool_req: self.check_external_tool(
+                tool_name,
+                tool_req["command"],
+                tool_req.get("min_version")
+            )))
+        
+        # Probes are independent, so run them together and report in the usual order
+        results = self._run_checks(checks)
+        errors = []
+        labels = {"python": "Python", "node": "Node.js", "disk_space": "Disk space"}
+        
+        for name, _ in checks:
+            success, message = results[name]
+            if success:
+                continue
+            
+            if name.startswith("tool:"):
+                tool_name = name[len("tool:"):]
                 # Skip optional tools that fail
-                is_optional = tool_req.get("optional", False)
-                
-                success, message = self.check_external_tool(
-                    tool_name,
-                    tool_req["command"],
-                    tool_req.get("min_version")
-                )
-                
-                if not success and not is_optional:
+                if not tool_requirements[tool_name].get("optional", False):
                     errors.append(f"{tool_name}: {message}")
+            else:
+                errors.append(f"{labels[name]}: {message}")
         
         return len(errors) == 0, errors
     
@@ -589,8 +670,16 @@ class Validator:
             "recommendations": []
         }
         
+        # Run independent probes concurrently; results are recorded in fixed order
+        results = self._run_checks([
+            ("python", self.check_python),
+            ("node", self.check_node),
+            ("gemini_cli", self.check_gemini_cli),
+            ("disk_space", lambda: self.check_disk_space(Path.home()))
+        ])
+        
         # Check Python
-        python_success, python_msg = self.check_python()
+        python_success, python_msg = results["python"]
         diagnostics["checks"]["python"] = {
             "status": "pass" if python_success else "fail",
             "message": python_msg
@@ -600,7 +689,7 @@ class Validator:
             diagnostics["recommendations"].append(self.get_installation_help("python"))
         
         # Check Node.js
-        node_success, node_msg = self.check_node()
+        node_success, node_msg = results["node"]
         diagnostics["checks"]["node"] = {
             "status": "pass" if node_success else "fail", 
             "message": node_msg
@@ -610,7 +699,7 @@ class Validator:
             diagnostics["recommendations"].append(self.get_installation_help("node"))
         
         # Check Gemini CLI
-        gemini_success, gemini_msg = self.check_gemini_cli()
+        gemini_success, gemini_msg = results["gemini_cli"]
         diagnostics["checks"]["gemini_cli"] = {
             "status": "pass" if gemini_success else "fail",
             "message": gemini_msg
@@ -620,7 +709,7 @@ class Validator:
             diagnostics["recommendations"].append(self.get_installation_help("gemini_cli"))
         
         # Check disk space
-        disk_success, disk_msg = self.check_disk_space(Path.home())
+        disk_success, disk_msg = results["disk_space"]
         diagnostics["checks"]["disk_space"] = {
             "status": "pass" if disk_success else "fail",
             "message": disk_msg
@@ -649,19 +738,10 @@ class Validator:
         for tool_alternatives, display_name in tool_checks:
             tool_found = False
             for tool in tool_alternatives:
-                try:
-                    result = subprocess.run(
-                        ["which" if sys.platform != "win32" else "where", tool],
-                        capture_output=True,
-                        text=True,
-                        timeout=5,
-                        shell=(sys.platform == "win32")
-                    )
-                    if result.returncode == 0:
-                        tool_found = True
-                        break
-                except Exception:
-                    continue
+                # shutil.which does the same PATH lookup as which/where without a subprocess
+                if shutil.which(tool):
+                    tool_found = True
+                    break
             
             if not tool_found:
                 # Only report as missing if none of the alternatives were found
@@ -681,5 +761,7 @@ class Validator:
             )
     
     def clear_cache(self) -> None:
-        """Clear validation cache"""
+        """Clear validation cache, including persisted probe results"""
         self.validation_cache.clear()
+        if self.probe_cache is not None:
+            self.probe_cache.clear()
@@ -6,6 +6,9 @@ Business logic services for the SuperGemini installation system
 from .gemini_md import GEMINIMdService
 from .config import ConfigService
 from .files import FileService
+from .backup_catalog import BackupCatalog
+from .backup_store import BackupStore
+from .manifest import ManifestService
 from .settings import SettingsService
 
 # Backward compatibility alias
@@ -16,5 +19,8 @@ __all__ = [
     'CLAUDEMdService',  # Keep for backward compatibility
     'ConfigService', 
     'FileService',
+    'BackupCatalog',
+    'BackupStore',
+    'ManifestService',
     'SettingsService'
 ]
\ No newline at end of file
@@ -0,0 +1,203 @@
+"""
+Backup catalog for SuperGemini
+Keeps size, file count, component versions and checksum of every backup
+archive in <backup_dir>/index.json so listing backups never opens them
+"""
+
+import hashlib
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+from ..utils.archive import scan_archive
+
+CATALOG_FILENAME = "index.json"
+# Bump when entry contents change meaning so catalogs are rebuilt
+CATALOG_VERSION = 2
+
+_CHUNK_SIZE = 1024 * 1024
+
+
+class BackupCatalog:
+    """Reads and writes the catalog of backup archives in a directory"""
+
+    def __init__(self, backup_dir: Path):
+        """
+        Initialize backup catalog
+
+        Args:
+            backup_dir: Directory holding the backup archives
+        """
+        self.backup_dir = backup_dir
+        self.catalog_file = backup_dir / CATALOG_FILENAME
+
+    def load(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Load catalog entries
+
+        Returns:
+            Dict mapping archive file name to its entry, empty if there is no
+            usable catalog
+        """
+        try:
+            with open(self.catalog_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+        if not isinstance(data, dict) or data.get("version") != CATALOG_VERSION:
+            return {}
+        return data.get("backups", {})
+
+    def save(self, entries: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Atomically write catalog entries
+
+        Args:
+            entries: Dict mapping archive file name to its entry
+        """
+        self.backup_dir.mkdir(parents=True, exist_ok=True)
+        data = {
+            "version": CATALOG_VERSION,
+            "backups": {name: entries[name] for name in sorted(entries)}
+        }
+        tmp_file = self.catalog_file.with_name(f"{self.catalog_file.name}.{os.getpid()}.tmp")
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+        os.replace(tmp_file, self.catalog_file)
+
+    @staticmethod
+    def checksum(archive_path: Path) -> str:
+        """sha256 of an archive file as stored (no decompression)"""
+        digest = hashlib.sha256()
+        with open(archive_path, "rb") as f:
+            for chunk in iter(lambda: f.read(_CHUNK_SIZE), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    @classmethod
+    def make_entry(cls, archive_path: Path, files: int,
+                   metadata: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Build a catalog entry for an archive
+
+        Args:
+            archive_path: Backup archive
+            files: Number of archived files, not counting backup_metadata.json
+            metadata: Contents of backup_metadata.json, if any
+        """
+        metadata = metadata or {}
+        stat = archive_path.stat()
+        return {
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "created": datetime.fromtimestamp(stat.st_mtime).isoformat(),
+            "files": files,
+            "components": metadata.get("components", {}),
+            "sha256": cls.checksum(archive_path),
+            "metadata": metadata
+        }
+
+    @staticmethod
+    def is_current(archive_path: Path, entry: Optional[Dict[str, Any]]) -> bool:
+        """
+        Check whether an entry still describes the archive on disk
+
+        Size and mtime are compared so unchanged archives are never reopened.
+        """
+        if not entry:
+            return False
+        try:
+            stat = archive_path.stat()
+        except OSError:
+            return False
+        return stat.st_size == entry.get("size") and stat.st_mtime_ns == entry.get("mtime_ns")
+
+    @classmethod
+    def scan_entry(cls, archive_path: Path) -> Dict[str, Any]:
+        """Build an entry by reading the archive (index first, else one full pass)"""
+        files, metadata = scan_archive(archive_path)
+        return cls.make_entry(archive_path, files, json.loads(metadata.decode()) if metadata else None)
+
+    def record(self, archive_path: Path, files: int,
+               metadata: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Add a freshly written archive to the catalog
+
+        Args:
+            archive_path: Backup archive in this directory
+            files: Number of archived files, not counting backup_metadata.json
+            metadata: Contents of backup_metadata.json, if any
+
+        Returns:
+            The new entry
+        """
+        entry = self.make_entry(archive_path, files, metadata)
+        entries = self.load()
+        entries[archive_path.name] = entry
+        self.save(entries)
+        return entry
+
+    def refresh(self, archive_paths: Iterable[Path]) -> Dict[str, Dict[str, Any]]:
+        """
+        Catalog entries for the given archives
+
+        Current entries are returned as stored. Archives that are new or
+        whose size or mtime changed are rescanned, entries of archives not
+        listed are dropped, and the catalog is rewritten only if anything
+        changed. An archive that cannot be read gets an entry with "error".
+
+        Returns:
+            Dict mapping archive file name to its entry
+        """
+        stored = self.load()
+        entries = {}
+        changed = False
+
+        for archive_path in archive_paths:
+            entry = stored.get(archive_path.name)
+            if not self.is_current(archive_path, entry):
+                try:
+                    entry = self.scan_entry(archive_path)
+                    changed = True
+                except Exception as e:
+                    entries[archive_path.name] = {"error": str(e)}
+                    continue
+            entries[archive_path.name] = entry
+
+        valid = {name: entry for name, entry in entries.items() if "error" not in entry}
+        if changed or set(valid) != set(stored):
+            try:
+                self.save(valid)
+            except OSError:
+                pass  # Read-only backup dir; the catalog is only a cache
+        return entries
+
+    def lookup(self, archive_path: Path) -> Dict[str, Any]:
+        """
+        Catalog entry for one archive, rescanning it only if it changed
+
+        Raises:
+            Exception: If the archive has to be rescanned and cannot be read
+        """
+        entries = self.load()
+        entry = entries.get(archive_path.name)
+        if self.is_current(archive_path, entry):
+            return entry
+
+        entry = self.scan_entry(archive_path)
+        entries[archive_path.name] = entry
+        try:
+            self.save(entries)
+        except OSError:
+            pass
+        return entry
+
+    def forget(self, archive_names: Iterable[str]) -> None:
+        """Drop entries of deleted archives"""
+        entries = self.load()
+        removed = [name for name in archive_names if entries.pop(name, None) is not None]
+        if removed:
+            self.save(entries)
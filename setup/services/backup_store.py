@@ -0,0 +1,324 @@
+"""
+Content-addressed backup store for SuperGemini
+File contents are stored once as gzip blobs keyed by sha256; each snapshot is
+a small manifest mapping relative paths to blobs
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import shutil
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from ..utils.archive import iter_files, member_matches
+
+STORE_DIRNAME = "store"
+SNAPSHOT_VERSION = 1
+
+# gc() leaves unreferenced blobs and temporary files younger than this alone;
+# a snapshot being created stores its blobs before its manifest exists
+GC_MIN_AGE_SECONDS = 60 * 60
+
+_CHUNK_SIZE = 1024 * 1024
+
+
+class BackupStore:
+    """Deduplicating snapshot store inside a backup directory"""
+
+    def __init__(self, backup_dir: Path):
+        """
+        Initialize backup store
+
+        Args:
+            backup_dir: Backup directory; the store lives in <backup_dir>/store
+        """
+        self.root = backup_dir / STORE_DIRNAME
+        self.blobs_dir = self.root / "blobs"
+        self.snapshots_dir = self.root / "snapshots"
+        self.tmp_dir = self.root / "tmp"
+
+    def exists(self) -> bool:
+        """Check whether the store has any snapshots"""
+        return self.snapshots_dir.is_dir() and any(self.snapshots_dir.glob("*.json"))
+
+    def blob_path(self, sha256: str) -> Path:
+        """Blob file for a content hash"""
+        return self.blobs_dir / sha256[:2] / sha256
+
+    def snapshot_path(self, name: str) -> Path:
+        """Manifest file for a snapshot name"""
+        return self.snapshots_dir / f"{name}.json"
+
+    def _store_blob(self, file_path: Path) -> Tuple[str, int]:
+        """
+        Hash and store a file in one read
+
+        Returns:
+            (sha256, compressed bytes written; 0 if the blob already existed)
+        """
+        self.tmp_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.tmp_dir / f"{os.getpid()}-{time.monotonic_ns()}.tmp"
+        digest = hashlib.sha256()
+        try:
+            with open(file_path, "rb") as source, gzip.open(tmp_path, "wb", compresslevel=6) as blob:
+                for chunk in iter(lambda: source.read(_CHUNK_SIZE), b""):
+                    digest.update(chunk)
+                    blob.write(chunk)
+
+            sha256 = digest.hexdigest()
+            target = self.blob_path(sha256)
+            if target.exists():
+                # Mark the blob as in use so a concurrent gc() keeps it
+                os.utime(target)
+                return sha256, 0
+            target.parent.mkdir(parents=True, exist_ok=True)
+            written = tmp_path.stat().st_size
+            os.replace(tmp_path, target)
+            return sha256, written
+        finally:
+            if tmp_path.exists():
+                tmp_path.unlink()
+
+    def load_snapshot(self, name: str) -> Dict[str, Any]:
+        """
+        Load a snapshot manifest
+
+        Raises:
+            FileNotFoundError: If the snapshot does not exist
+            ValueError: If the manifest is not a supported snapshot
+        """
+        with open(self.snapshot_path(name), "r", encoding="utf-8") as f:
+            snapshot = json.load(f)
+        if not isinstance(snapshot, dict) or snapshot.get("version") != SNAPSHOT_VERSION:
+            raise ValueError(f"Unsupported snapshot format: {name}")
+        return snapshot
+
+    def list_snapshots(self) -> List[Dict[str, Any]]:
+        """
+        List snapshots, newest first
+
+        Returns:
+            Manifests without their file tables, plus "path", "files" and "size"
+        """
+        snapshots = []
+        if not self.snapshots_dir.is_dir():
+            return snapshots
+
+        for manifest in self.snapshots_dir.glob("*.json"):
+            try:
+                snapshot = self.load_snapshot(manifest.stem)
+            except (OSError, ValueError):
+                continue
+            files = snapshot.pop("files", {})
+            snapshot["path"] = manifest
+            snapshot["files"] = len(files)
+            snapshot["size"] = sum(entry.get("size", 0) for entry in files.values())
+            snapshots.append(snapshot)
+
+        snapshots.sort(key=lambda snapshot: snapshot.get("created", ""), reverse=True)
+        return snapshots
+
+    def create_snapshot(self, source_dir: Path, name: Optional[str] = None,
+                        metadata: Optional[Dict[str, Any]] = None,
+                        exclude: Iterable[Path] = (), logger=None) -> Dict[str, Any]:
+        """
+        Snapshot every file under source_dir
+
+        Files whose size and mtime match the newest snapshot reuse its hash
+        without being read; other files are hashed and stored in one pass,
+        and only content not already in the store takes new space.
+
+        Args:
+            source_dir: Directory to snapshot
+            name: Snapshot name (default: supergemini_backup_<timestamp>)
+            metadata: Extra information stored with the snapshot
+            exclude: Files or directories under source_dir to leave out
+            logger: Logger for per-file warnings
+
+        Returns:
+            Dict with name, path, files, bytes_total, new_blobs, bytes_stored,
+            reused (files not read) and duration
+        """
+        start = time.perf_counter()
+        created = datetime.now()
+        name = name or f"supergemini_backup_{created.strftime('%Y%m%d_%H%M%S')}"
+
+        previous: Dict[str, Dict[str, Any]] = {}
+        latest = self.list_snapshots()
+        if latest:
+            try:
+                previous = self.load_snapshot(latest[0]["path"].stem)["files"]
+            except (OSError, ValueError):
+                previous = {}
+
+        files: Dict[str, Dict[str, Any]] = {}
+        stats = {"new_blobs": 0, "bytes_stored": 0, "reused": 0, "bytes_total": 0}
+
+        for file_path, arcname in iter_files(source_dir, exclude=list(exclude) + [self.root]):
+            try:
+                stat = file_path.stat()
+                entry = previous.get(arcname)
+                if (entry and entry.get("size") == stat.st_size
+                        and entry.get("mtime_ns") == stat.st_mtime_ns
+                        and self.blob_path(entry["sha256"]).exists()):
+                    sha256 = entry["sha256"]
+                    stats["reused"] += 1
+                else:
+                    sha256, written = self._store_blob(file_path)
+                    if written:
+                        stats["new_blobs"] += 1
+                        stats["bytes_stored"] += written
+
+                files[arcname] = {
+                    "sha256": sha256,
+                    "size": stat.st_size,
+                    "mode": stat.st_mode & 0o777,
+                    "mtime_ns": stat.st_mtime_ns
+                }
+                stats["bytes_total"] += stat.st_size
+            except OSError as e:
+                if logger:
+                    logger.warning(f"Could not add {file_path} to snapshot: {e}")
+
+        snapshot = {
+            "version": SNAPSHOT_VERSION,
+            "name": name,
+            "created": created.isoformat(),
+            "source_dir": str(source_dir),
+            "metadata": metadata or {},
+            "files": files
+        }
+        self.snapshots_dir.mkdir(parents=True, exist_ok=True)
+        manifest = self.snapshot_path(name)
+        tmp_manifest = manifest.with_name(f"{manifest.name}.{os.getpid()}.tmp")
+        with open(tmp_manifest, "w", encoding="utf-8") as f:
+            json.dump(snapshot, f, indent=2)
+        os.replace(tmp_manifest, manifest)
+
+        stats.update({
+            "name": name,
+            "path": manifest,
+            "files": len(files),
+            "duration": time.perf_counter() - start
+        })
+        return stats
+
+    def restore_snapshot(self, name: str, target_dir: Path, overwrite: bool = False,
+                         patterns: Optional[Sequence[str]] = None, logger=None) -> Dict[str, int]:
+        """
+        Restore a snapshot into target_dir
+
+        Args:
+            name: Snapshot to restore
+            target_dir: Directory to restore into
+            overwrite: Replace files that already exist
+            patterns: Restore only matching paths (see archive.member_matches)
+            logger: Logger for per-file warnings
+
+        Returns:
+            Dict with matched, restored, skipped and failed counts
+        """
+        snapshot = self.load_snapshot(name)
+        result = {"matched": 0, "restored": 0, "skipped": 0, "failed": 0}
+        target_root = target_dir.resolve()
+
+        for arcname, entry in snapshot["files"].items():
+            if not member_matches(arcname, patterns):
+                continue
+            result["matched"] += 1
+            target = (target_dir / arcname).resolve()
+            if target_root not in target.parents:
+                if logger:
+                    logger.warning(f"Skipping unsafe path in snapshot: {arcname}")
+                result["failed"] += 1
+                continue
+
+            if target.exists() and not overwrite:
+                if logger:
+                    logger.warning(f"Skipping existing file: {target}")
+                result["skipped"] += 1
+                continue
+
+            try:
+                target.parent.mkdir(parents=True, exist_ok=True)
+                with gzip.open(self.blob_path(entry["sha256"]), "rb") as blob, open(target, "wb") as out:
+                    shutil.copyfileobj(blob, out, _CHUNK_SIZE)
+                os.chmod(target, entry.get("mode", 0o644))
+                mtime_ns = entry.get("mtime_ns")
+                if mtime_ns:
+                    os.utime(target, ns=(mtime_ns, mtime_ns))
+                result["restored"] += 1
+            except OSError as e:
+                if logger:
+                    logger.warning(f"Could not restore {arcname}: {e}")
+                result["failed"] += 1
+
+        return result
+
+    def delete_snapshot(self, name: str) -> None:
+        """Delete a snapshot manifest (run gc() to reclaim its blobs)"""
+        self.snapshot_path(name).unlink()
+
+    def gc(self, min_age: float = GC_MIN_AGE_SECONDS, logger=None) -> Tuple[int, int]:
+        """
+        Remove blobs no snapshot references
+
+        Blobs and leftover temporary files are only removed once they are
+        older than min_age, so a snapshot created at the same time keeps the
+        blobs it has stored but not yet recorded in its manifest.
+
+        Args:
+            min_age: Seconds since last modification before an unreferenced
+                blob or temporary file is removed
+            logger: Logger for warnings
+
+        Returns:
+            (blobs removed, bytes freed); (0, 0) if a snapshot manifest
+            could not be read, since its blobs are unknown
+        """
+        referenced = set()
+        if self.snapshots_dir.is_dir():
+            for manifest in self.snapshots_dir.glob("*.json"):
+                try:
+                    snapshot = self.load_snapshot(manifest.stem)
+                    referenced.update(entry["sha256"] for entry in snapshot["files"].values())
+                except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+                    if logger:
+                        logger.warning(f"Skipping garbage collection, unreadable snapshot {manifest.name}: {e}")
+                    return 0, 0
+
+        cutoff = time.time() - min_age
+        removed = 0
+        freed = 0
+        if self.blobs_dir.is_dir():
+            for blob in self.blobs_dir.glob("*/*"):
+                if blob.name in referenced:
+                    continue
+                try:
+                    stat = blob.stat()
+                    if stat.st_mtime >= cutoff:
+                        continue
+                    blob.unlink()
+                except OSError:
+                    continue
+                freed += stat.st_size
+                removed += 1
+            for fanout in self.blobs_dir.iterdir():
+                try:
+                    if (fanout.is_dir() and fanout.stat().st_mtime < cutoff
+                            and not any(fanout.iterdir())):
+                        fanout.rmdir()
+                except OSError:
+                    pass
+        if self.tmp_dir.is_dir():
+            for tmp_file in self.tmp_dir.iterdir():
+                try:
+                    if tmp_file.stat().st_mtime < cutoff:
+                        tmp_file.unlink()
+                except OSError:
+                    pass
+        return removed, freed
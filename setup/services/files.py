@@ -63,6 +63,36 @@ class FileService:
             print(f"Error copying {source} to {target}: {e}")
             return False
     
+    def write_file(self, target: Path, content: str, source: Optional[Path] = None) -> bool:
+        """
+        Write text to a file, e.g. a transformed copy of a source file
+        
+        Args:
+            target: Target file path
+            content: Text to write (UTF-8)
+            source: File whose permissions the target takes, if any
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        if self.dry_run:
+            print(f"[DRY RUN] Would write {target}")
+            return True
+        
+        try:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            with open(target, 'w', encoding='utf-8', newline='') as f:
+                f.write(content)
+            if source is not None:
+                shutil.copymode(source, target)
+            
+            self.copied_files.append(target)
+            return True
+            
+        except Exception as e:
+            print(f"Error writing {target}: {e}")
+            return False
+    
     def copy_directory(self, source: Path, target: Path, ignore_patterns: Optional[List[str]] = None) -> bool:
         """
         Recursively copy directory with gitignore-style patterns
@@ -2,12 +2,142 @@
 GEMINI.md Manager for preserving user customizations while managing framework imports
 """
 
+import os
 import re
+import threading
+from contextlib import contextmanager
 from pathlib import Path
-from typing import List, Set, Dict, Optional
+from typing import Any, FrozenSet, Iterator, List, Set, Dict, Optional, Tuple, Union
+from .settings import SettingsService
+from ..utils.locking import serialized
 from ..utils.logger import get_logger
 
 
+# Serializes GEMINI.md read-modify-write cycles when components install concurrently
+_gemini_md_lock = threading.RLock()
+
+# Open import transactions by GEMINI.md path (guarded by _gemini_md_lock)
+_active_transactions: Dict[Path, "GEMINIMdTransaction"] = {}
+
+FRAMEWORK_MARKER = "# ═══════════════════════════════════════════════════\n# SuperGemini Framework Components"
+
+DEFAULT_GEMINI_MD = """# SuperGemini Entry Point
+
+This file serves as the entry point for the SuperGemini framework.
+You can add your own custom instructions and configurations here.
+
+The SuperGemini framework components will be automatically imported below.
+"""
+
+_IMPORT_PATTERN = re.compile(r'^@([^\s\n]+\.md)\s*$', re.MULTILINE)
+
+# Rough size of a token in UTF-8 Markdown; good enough for budgeting
+BYTES_PER_TOKEN = 4
+
+# Mode and MCP guides commands can read on demand, with the flags that need them
+ON_DEMAND_DOCS: Dict[str, Tuple[str, ...]] = {
+    "MODE_Brainstorming.md": ("--brainstorm",),
+    "MODE_Introspection.md": ("--introspect",),
+    "MODE_Task_Management.md": ("--task-manage",),
+    "MODE_Orchestration.md": ("--orchestrate",),
+    "MODE_Token_Efficiency.md": ("--token-efficient", "--uc", "--ultracompressed"),
+    "MCP_Context7.md": ("--c7", "--context7", "--all-mcp"),
+    "MCP_Sequential.md": ("--seq", "--sequential", "--all-mcp"),
+    "MCP_Magic.md": ("--magic", "--all-mcp"),
+    "MCP_Morphllm.md": ("--morph", "--morphllm", "--all-mcp"),
+    "MCP_Serena.md": ("--serena", "--all-mcp"),
+    "MCP_Playwright.md": ("--play", "--playwright", "--all-mcp"),
+}
+
+# Framework imports each profile keeps in GEMINI.md: a tuple of the files to
+# keep, or a frozenset of the files to leave out (None keeps everything).
+# Files left out stay installed and can be pulled in on demand with @FILE.md;
+# profiles that leave out ON_DEMAND_DOCS also teach the commands to read them.
+IMPORT_PROFILES: Dict[str, Optional[Union[Tuple[str, ...], FrozenSet[str]]]] = {
+    "full": None,
+    "lazy": frozenset(ON_DEMAND_DOCS),
+    "minimal": ("FLAGS.md", "PRINCIPLES.md", "RULES.md"),
+}
+DEFAULT_IMPORT_PROFILE = "full"
+
+
+def estimate_tokens(size_bytes: int) -> int:
+    """Estimate the tokens a Gemini CLI prompt spends on size_bytes of Markdown"""
+    return -(-size_bytes // BYTES_PER_TOKEN)
+
+
+def format_token_change(before_bytes: int, after_bytes: int) -> str:
+    """Describe a size change in estimated tokens, e.g. ~1,200 -> ~900 tokens (-25%)"""
+    before = estimate_tokens(before_bytes)
+    after = estimate_tokens(after_bytes)
+    change = f" ({(after - before) * 100 / before:+.0f}%)" if before else ""
+    return f"~{before:,} -> ~{after:,} tokens{change}"
+
+
+def profile_imports(profile: Optional[str], file: str) -> bool:
+    """Check whether an import profile keeps file in GEMINI.md"""
+    rule = IMPORT_PROFILES[profile] if profile is not None else None
+    if rule is None:
+        return True
+    if isinstance(rule, frozenset):
+        return file not in rule
+    return file in rule
+
+
+def loads_docs_on_demand(profile: Optional[str]) -> bool:
+    """Check whether a profile leaves the mode and MCP guides to be read on demand"""
+    return profile is not None and not any(profile_imports(profile, doc) for doc in ON_DEMAND_DOCS)
+
+
+# Decorator: run method while holding _gemini_md_lock
+_serialized = serialized(_gemini_md_lock)
+
+
+class GEMINIMdTransaction:
+    """Import changes registered by several components, applied in one write"""
+
+    def __init__(self, service: "GEMINIMdService", profile: Optional[str] = None,
+                 budget: Optional[int] = None, strict: bool = False):
+        self.service = service
+        self.profile = profile
+        self.budget = budget
+        self.strict = strict
+        self.additions: Dict[str, List[str]] = {}
+        self.removals: Set[str] = set()
+        self.result: Optional[bool] = None
+        self.discarded = False
+
+    def add(self, files: List[str], category: str) -> None:
+        """Register files to import under category"""
+        pending = self.additions.setdefault(category, [])
+        for file in files:
+            self.removals.discard(file)
+            if file not in pending:
+                pending.append(file)
+
+    def remove(self, files: List[str]) -> None:
+        """Register files to drop from the imports"""
+        for file in files:
+            for pending in self.additions.values():
+                if file in pending:
+                    pending.remove(file)
+            self.removals.add(file)
+
+    def discard(self) -> None:
+        """Drop every registered change; the transaction will neither write nor remember settings"""
+        self.discarded = True
+
+    def commit(self) -> bool:
+        """Apply every registered change with one read and at most one write"""
+        if not self.additions and not self.removals and self.profile is None:
+            self.result = True
+        else:
+            self.result = self.service.apply_changes(
+                self.additions, self.removals, profile=self.profile, budget=self.budget, strict=self.strict
+            )
+        return self.result
+
+
 class GEMINIMdService:
     """Manages GEMINI.md file updates while preserving user customizations"""
     
@@ -39,9 +169,7 @@ class GEMINIMdService:
                 content = f.read()
             
             # Find all @import statements using regex
-            import_pattern = r'^@([^\s\n]+\.md)\s*$'
-            matches = re.findall(import_pattern, content, re.MULTILINE)
-            existing_imports.update(matches)
+            existing_imports.update(_IMPORT_PATTERN.findall(content))
             
             self.logger.debug(f"Found existing imports: {existing_imports}")
             
@@ -78,10 +206,8 @@ class GEMINIMdService:
             User content without framework imports
         """
         # Look for framework imports section marker
-        framework_marker = "# ═══════════════════════════════════════════════════\n# SuperGemini Framework Components"
-        
-        if framework_marker in content:
-            user_content = content.split(framework_marker)[0].rstrip()
+        if FRAMEWORK_MARKER in content:
+            user_content = content.split(FRAMEWORK_MARKER)[0].rstrip()
         else:
             # If no framework section exists, preserve all content
             user_content = content.rstrip()
@@ -119,10 +245,93 @@ class GEMINIMdService:
         
         return "\n".join(sections)
     
+    def resolve_import_settings(self, profile: Optional[str] = None,
+                                budget: Optional[int] = None) -> Tuple[Optional[str], Optional[int]]:
+        """
+        Fill an unset import profile or context budget from the last install
+        
+        Returns:
+            (profile, budget); None where neither was ever set
+        """
+        try:
+            stored = SettingsService(self.install_dir).get_metadata_setting("gemini_md", {}) or {}
+        except ValueError:
+            stored = {}
+        if profile is None:
+            profile = stored.get("import_profile")
+        if budget is None:
+            budget = stored.get("context_budget")
+        return profile, budget
+    
+    def save_import_settings(self, profile: Optional[str], budget: Optional[int]) -> None:
+        """Remember the import profile and context budget for later updates"""
+        SettingsService(self.install_dir).update_metadata({
+            "gemini_md": {"import_profile": profile, "context_budget": budget}
+        })
+    
+    @contextmanager
+    def transaction(self, profile: Optional[str] = None, budget: Optional[int] = None,
+                    strict: bool = False, remember: bool = False) -> Iterator[GEMINIMdTransaction]:
+        """
+        Collect add_imports/remove_imports calls and apply them together
+        
+        While the transaction is open, every GEMINIMdService for the same
+        GEMINI.md (components create their own) records its changes instead
+        of writing. On a clean exit they are applied with one parse and one
+        atomic write; if the body raises, nothing is written. A failed
+        write is logged like a failed add_imports call, and its outcome is
+        left in the transaction's ``result``. Call ``discard()`` on the
+        transaction to leave GEMINI.md and the stored settings untouched.
+        Nested transactions join the outermost one.
+        
+        Args:
+            profile: Import profile (see IMPORT_PROFILES) to apply
+            budget: Context budget in estimated tokens for everything
+                GEMINI.md pulls into a prompt
+            strict: Leave GEMINI.md unchanged instead of warning when the
+                result is over budget
+            remember: Take an unset profile/budget from the last install and
+                store the ones used once the transaction commits
+        
+        Yields:
+            The open transaction
+        """
+        with _gemini_md_lock:
+            active = _active_transactions.get(self.gemini_md_path)
+            if active is None:
+                if remember:
+                    profile, budget = self.resolve_import_settings(profile, budget)
+                active = GEMINIMdTransaction(self, profile, budget, strict)
+                _active_transactions[self.gemini_md_path] = active
+                owner = True
+            else:
+                owner = False
+        
+        try:
+            yield active
+        finally:
+            if owner:
+                with _gemini_md_lock:
+                    _active_transactions.pop(self.gemini_md_path, None)
+        
+        if owner and not active.discarded and active.commit() and remember \
+                and (profile is not None or budget is not None):
+            try:
+                self.save_import_settings(profile, budget)
+            except ValueError as e:
+                self.logger.warning(f"Could not save GEMINI.md import settings: {e}")
+    
+    def _active_transaction(self) -> Optional[GEMINIMdTransaction]:
+        """Open transaction for this GEMINI.md, if any (call with the lock held)"""
+        return _active_transactions.get(self.gemini_md_path)
+    
+    @_serialized
     def add_imports(self, files: List[str], category: str = "Framework") -> bool:
         """
         Add new imports with duplicate checking and user content preservation
         
+        Inside a transaction() the change is only registered.
+        
         Args:
             files: List of filenames to import
             category: Category name for organizing imports
@@ -130,54 +339,236 @@ class GEMINIMdService:
         Returns:
             True if successful, False otherwise
         """
+        transaction = self._active_transaction()
+        if transaction is not None:
+            transaction.add(files, category)
+            self.logger.debug(f"Queued {len(files)} GEMINI.md imports for category '{category}'")
+            return True
+        return self.apply_changes({category: list(files)}, set())
+    
+    @_serialized
+    def remove_imports(self, files: List[str]) -> bool:
+        """
+        Remove specific imports from GEMINI.md
+        
+        Inside a transaction() the change is only registered.
+        
+        Args:
+            files: List of filenames to remove from imports
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        transaction = self._active_transaction()
+        if transaction is not None:
+            transaction.remove(files)
+            return True
+        if not self.gemini_md_path.exists():
+            return True  # Nothing to remove
+        return self.apply_changes({}, set(files))
+    
+    def _parse(self, content: str) -> Tuple[str, Dict[str, List[str]], Set[str]]:
+        """
+        Parse GEMINI.md once
+        
+        Returns:
+            (user content, framework imports by category, every imported file)
+        """
+        existing_imports = set(_IMPORT_PATTERN.findall(content))
+        return self.extract_user_content(content), self._parse_existing_framework_imports(content), existing_imports
+    
+    def render(self, user_content: str, imports_by_category: Dict[str, List[str]]) -> str:
+        """
+        Build GEMINI.md from user content and framework imports
+        
+        Args:
+            user_content: Content before the framework section
+            imports_by_category: Framework imports by category
+            
+        Returns:
+            Full file content
+        """
+        content_parts = []
+        
+        if user_content.strip():
+            content_parts.append(user_content)
+            content_parts.append("")  # Add blank line before framework section
+        
+        framework_section = self.organize_imports_by_category(imports_by_category)
+        if framework_section:
+            content_parts.append(framework_section)
+        
+        return "\n".join(content_parts)
+    
+    def _write_atomic(self, content: str) -> None:
+        """Write GEMINI.md through a temporary file and os.replace"""
+        self.gemini_md_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.gemini_md_path.with_name(f".{self.gemini_md_path.name}.{os.getpid()}.tmp")
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(content)
+            os.replace(tmp_path, self.gemini_md_path)
+        finally:
+            if tmp_path.exists():
+                tmp_path.unlink()
+    
+    def estimate_file_tokens(self, filename: str) -> int:
+        """Estimated tokens of an imported file in the install dir (0 if missing)"""
         try:
-            # Ensure GEMINI.md exists
-            self.ensure_gemini_md_exists()
+            return estimate_tokens((self.install_dir / filename).stat().st_size)
+        except OSError:
+            return 0
+    
+    def plan_imports(self, content: str, imports_by_category: Dict[str, List[str]],
+                     budget: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Estimate what a GEMINI.md costs in every prompt
+        
+        Args:
+            content: Full GEMINI.md content
+            imports_by_category: Its framework imports by category
+            budget: Context budget in estimated tokens, if any
             
-            # Read existing content and imports
-            existing_content = self.read_existing_content()
-            existing_imports = self.read_existing_imports()
+        Returns:
+            Dict with files (file -> tokens), categories (category -> tokens,
+            imports outside the framework section under "User imports"),
+            counts (category -> files), gemini_md (tokens of the file
+            itself), total, budget and over_budget
+        """
+        files: Dict[str, int] = {}
+        categories: Dict[str, int] = {}
+        counts: Dict[str, int] = {}
+        
+        for category, category_files in imports_by_category.items():
+            categories[category] = 0
+            counts[category] = len(category_files)
+            for filename in category_files:
+                files[filename] = self.estimate_file_tokens(filename)
+                categories[category] += files[filename]
+        
+        user_imports = [f for f in _IMPORT_PATTERN.findall(content) if f not in files]
+        if user_imports:
+            categories["User imports"] = 0
+            counts["User imports"] = len(user_imports)
+            for filename in user_imports:
+                files[filename] = self.estimate_file_tokens(filename)
+                categories["User imports"] += files[filename]
+        
+        gemini_md = estimate_tokens(len(content.encode('utf-8')))
+        total = gemini_md + sum(categories.values())
+        return {
+            "files": files,
+            "categories": categories,
+            "counts": counts,
+            "gemini_md": gemini_md,
+            "total": total,
+            "budget": budget,
+            "over_budget": budget is not None and total > budget
+        }
+    
+    def _log_plan(self, plan: Dict[str, Any]) -> None:
+        """Log the per-category context estimate"""
+        budget = f" of {plan['budget']:,} budget" if plan["budget"] is not None else ""
+        self.logger.info(f"GEMINI.md context estimate: ~{plan['total']:,} tokens{budget}")
+        for category, tokens in plan["categories"].items():
+            self.logger.info(f"  {category}: ~{tokens:,} tokens ({plan['counts'][category]} files)")
+        self.logger.info(f"  GEMINI.md itself: ~{plan['gemini_md']:,} tokens")
+    
+    @_serialized
+    def apply_changes(self, additions: Dict[str, List[str]], removals: Set[str],
+                      profile: Optional[str] = None, budget: Optional[int] = None,
+                      strict: bool = False) -> bool:
+        """
+        Apply import additions and removals with one parse and one write
+        
+        Files already imported anywhere in GEMINI.md are not added again.
+        A missing GEMINI.md starts from the default content. The file is left
+        untouched when the result is byte-identical to what is on disk.
+        
+        Args:
+            additions: Files to import, by category
+            removals: Files to drop from every category
+            profile: Import profile; framework imports it does not keep are
+                dropped (None applies no profile)
+            budget: Context budget in estimated tokens; the per-category
+                estimate is logged whenever a budget is given or GEMINI.md
+                changes
+            strict: Refuse (return False, write nothing) when over budget
+                instead of warning
             
-            # Filter out files already imported
-            new_files = [f for f in files if f not in existing_imports]
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            if profile is not None and profile not in IMPORT_PROFILES:
+                raise ValueError(f"Unknown import profile: {profile}")
             
-            if not new_files:
+            exists = self.gemini_md_path.exists()
+            if not exists and not any(additions.values()):
+                return True  # Nothing to remove
+            if exists:
+                with open(self.gemini_md_path, 'r', encoding='utf-8') as f:
+                    existing_content = f.read()
+            else:
+                existing_content = DEFAULT_GEMINI_MD
+            
+            user_content, imports_by_category, existing_imports = self._parse(existing_content)
+            
+            added = []
+            for category, files in additions.items():
+                new_files = [f for f in files if f not in existing_imports and f not in removals
+                             and profile_imports(profile, f)]
+                if new_files:
+                    imports_by_category.setdefault(category, []).extend(new_files)
+                    existing_imports.update(new_files)
+                    added.extend(new_files)
+                    self.logger.info(f"Adding {len(new_files)} new imports to category '{category}': {new_files}")
+            
+            removed = 0
+            dropped = []
+            for category_files in imports_by_category.values():
+                for file in list(category_files):
+                    if file in removals:
+                        category_files.remove(file)
+                        removed += 1
+                    elif not profile_imports(profile, file):
+                        category_files.remove(file)
+                        dropped.append(file)
+            imports_by_category = {k: v for k, v in imports_by_category.items() if v}
+            if dropped:
+                self.logger.info(
+                    f"Import profile '{profile}' leaves out {len(dropped)} files "
+                    f"(still installed; reference them on demand with @FILE): {dropped}"
+                )
+            changed = bool(added or removed or dropped)
+            
+            new_content = self.render(user_content, imports_by_category)
+            if changed or budget is not None:
+                plan = self.plan_imports(new_content, imports_by_category, budget)
+                self._log_plan(plan)
+                if plan["over_budget"]:
+                    message = (f"GEMINI.md imports need ~{plan['total']:,} tokens, "
+                               f"~{plan['total'] - budget:,} over the {budget:,}-token context budget")
+                    if strict:
+                        self.logger.error(f"{message}; GEMINI.md left unchanged")
+                        return False
+                    self.logger.warning(f"{message}; consider --import-profile lazy or minimal")
+            
+            if exists and not changed:
                 self.logger.info("All files already imported, no changes needed")
                 return True
             
-            self.logger.info(f"Adding {len(new_files)} new imports to category '{category}': {new_files}")
-            
-            # Extract user content (preserve everything before framework section)
-            user_content = self.extract_user_content(existing_content)
-            
-            # Parse existing framework imports by category
-            existing_framework_imports = self._parse_existing_framework_imports(existing_content)
-            
-            # Add new files to the specified category
-            if category not in existing_framework_imports:
-                existing_framework_imports[category] = []
-            existing_framework_imports[category].extend(new_files)
-            
-            # Build new content
-            new_content_parts = []
-            
-            # Add user content
-            if user_content.strip():
-                new_content_parts.append(user_content)
-                new_content_parts.append("")  # Add blank line before framework section
-            
-            # Add organized framework imports
-            framework_section = self.organize_imports_by_category(existing_framework_imports)
-            if framework_section:
-                new_content_parts.append(framework_section)
-            
-            # Write updated content
-            new_content = "\n".join(new_content_parts)
-            
-            with open(self.gemini_md_path, 'w', encoding='utf-8') as f:
-                f.write(new_content)
+            if exists and new_content == existing_content:
+                self.logger.debug("GEMINI.md unchanged, skipping write")
+                return True
             
-            self.logger.success(f"Updated GEMINI.md with {len(new_files)} new imports")
+            self._write_atomic(new_content)
+            if not exists:
+                self.logger.info("Created GEMINI.md with default content")
+            if added:
+                self.logger.success(f"Updated GEMINI.md with {len(added)} new imports")
+            if removed or dropped:
+                self.logger.info(f"Removed {removed + len(dropped)} imports from GEMINI.md")
             return True
             
         except Exception as e:
@@ -196,14 +587,11 @@ class GEMINIMdService:
         """
         imports_by_category = {}
         
-        # Look for framework imports section
-        framework_marker = "# ═══════════════════════════════════════════════════\n# SuperGemini Framework Components"
-        
-        if framework_marker not in content:
+        if FRAMEWORK_MARKER not in content:
             return imports_by_category
         
         # Extract framework section
-        framework_section = content.split(framework_marker)[1] if framework_marker in content else ""
+        framework_section = content.split(FRAMEWORK_MARKER)[1]
         
         # Parse categories and imports
         lines = framework_section.split('\n')
@@ -230,6 +618,7 @@ class GEMINIMdService:
         
         return imports_by_category
     
+    @_serialized
     def ensure_gemini_md_exists(self) -> None:
         """
         Create GEMINI.md with default content if it doesn't exist
@@ -238,79 +627,9 @@ class GEMINIMdService:
             return
         
         try:
-            # Create directory if it doesn't exist
-            self.gemini_md_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            # Default GEMINI.md content
-            default_content = """# SuperGemini Entry Point
-
-This file serves as the entry point for the SuperGemini framework.
-You can add your own custom instructions and configurations here.
-
-The SuperGemini framework components will be automatically imported below.
-"""
-            
-            with open(self.gemini_md_path, 'w', encoding='utf-8') as f:
-                f.write(default_content)
-            
+            self._write_atomic(DEFAULT_GEMINI_MD)
             self.logger.info("Created GEMINI.md with default content")
             
         except Exception as e:
             self.logger.error(f"Failed to create GEMINI.md: {e}")
             raise
-    
-    def remove_imports(self, files: List[str]) -> bool:
-        """
-        Remove specific imports from GEMINI.md
-        
-        Args:
-            files: List of filenames to remove from imports
-            
-        Returns:
-            True if successful, False otherwise
-        """
-        try:
-            if not self.gemini_md_path.exists():
-                return True  # Nothing to remove
-            
-            existing_content = self.read_existing_content()
-            user_content = self.extract_user_content(existing_content)
-            existing_framework_imports = self._parse_existing_framework_imports(existing_content)
-            
-            # Remove files from all categories
-            removed_any = False
-            for category, category_files in existing_framework_imports.items():
-                for file in files:
-                    if file in category_files:
-                        category_files.remove(file)
-                        removed_any = True
-            
-            # Remove empty categories
-            existing_framework_imports = {k: v for k, v in existing_framework_imports.items() if v}
-            
-            if not removed_any:
-                return True  # Nothing was removed
-            
-            # Rebuild content
-            new_content_parts = []
-            
-            if user_content.strip():
-                new_content_parts.append(user_content)
-                new_content_parts.append("")
-            
-            framework_section = self.organize_imports_by_category(existing_framework_imports)
-            if framework_section:
-                new_content_parts.append(framework_section)
-            
-            # Write updated content
-            new_content = "\n".join(new_content_parts)
-            
-            with open(self.gemini_md_path, 'w', encoding='utf-8') as f:
-                f.write(new_content)
-            
-            self.logger.info(f"Removed {len(files)} imports from GEMINI.md")
-            return True
-            
-        except Exception as e:
-            self.logger.error(f"Failed to remove imports from GEMINI.md: {e}")
-            return False
\ No newline at end of file
@@ -0,0 +1,136 @@
+"""
+Per-component install manifests for incremental installs and updates
+Records target path, size, mtime and sha256 of every installed file
+"""
+
+import json
+import os
+from typing import Dict, Any, Optional
+from pathlib import Path
+
+MANIFEST_DIRNAME = ".supergemini-manifests"
+MANIFEST_VERSION = 1
+
+
+class ManifestService:
+    """Reads and writes the install manifest of a single component"""
+
+    def __init__(self, install_dir: Path, component_name: str):
+        """
+        Initialize manifest service
+
+        Args:
+            install_dir: Installation directory
+            component_name: Component the manifest belongs to
+        """
+        self.install_dir = install_dir
+        self.component_name = component_name
+        self.manifest_file = install_dir / MANIFEST_DIRNAME / f"{component_name}.json"
+
+    def load(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Load manifest entries
+
+        Returns:
+            Dict mapping target path (relative to install dir) to its entry,
+            empty if there is no usable manifest
+        """
+        try:
+            with open(self.manifest_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+        if not isinstance(data, dict) or data.get("version") != MANIFEST_VERSION:
+            return {}
+        return data.get("files", {})
+
+    def save(self, entries: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Atomically write manifest entries
+
+        Args:
+            entries: Dict mapping relative target path to its entry
+        """
+        self.manifest_file.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            "version": MANIFEST_VERSION,
+            "component": self.component_name,
+            "files": {key: entries[key] for key in sorted(entries)}
+        }
+        tmp_file = self.manifest_file.with_name(f"{self.manifest_file.name}.{os.getpid()}.tmp")
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2)
+        os.replace(tmp_file, self.manifest_file)
+
+    def remove(self) -> None:
+        """Delete the manifest (e.g. on uninstall)"""
+        try:
+            self.manifest_file.unlink()
+        except OSError:
+            pass
+
+    def relative_key(self, target: Path) -> str:
+        """Manifest key for a target path"""
+        try:
+            return target.relative_to(self.install_dir).as_posix()
+        except ValueError:
+            return target.as_posix()
+
+    def target_path(self, key: str) -> Optional[Path]:
+        """
+        Target path for a manifest key, if it lies inside the install dir
+
+        Keys come from a file on disk, so absolute keys and keys that escape
+        the install dir (via "..", or a symlink) are rejected.
+
+        Returns:
+            Target path, or None if the key points outside the install dir
+        """
+        if Path(key).is_absolute():
+            return None
+        target = self.install_dir / key
+        try:
+            target.resolve().relative_to(self.install_dir.resolve())
+        except (OSError, ValueError, RuntimeError):
+            return None
+        return target
+
+    @staticmethod
+    def make_entry(target: Path, sha256: str, source_sha256: str,
+                   transform: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Build a manifest entry for an installed file
+
+        Args:
+            target: Installed file
+            sha256: Hash of the installed file
+            source_sha256: Hash of the source file it was installed from
+            transform: Id of the transform the installed copy was written
+                with (None for a plain copy)
+        """
+        stat = target.stat()
+        entry = {
+            "size": stat.st_size,
+            "mtime": stat.st_mtime,
+            "sha256": sha256,
+            "source_sha256": source_sha256
+        }
+        if transform is not None:
+            entry["transform"] = transform
+        return entry
+
+    @staticmethod
+    def target_unchanged(target: Path, entry: Optional[Dict[str, Any]]) -> bool:
+        """
+        Check whether an installed file still matches its manifest entry
+
+        Size and mtime are compared so untouched files need no re-hash.
+        """
+        if not entry:
+            return False
+        try:
+            stat = target.stat()
+        except OSError:
+            return False
+        return stat.st_size == entry.get("size") and stat.st_mtime == entry.get("mtime")
@@ -5,12 +5,24 @@ Allows for manipulation of these json files with deep merge and backup
 """
 
 import json
+import threading
 import shutil
 from typing import Dict, Any, Optional, List
 from pathlib import Path
 from datetime import datetime
 import copy
 
+from ..utils.locking import serialized
+
+
+# Serializes reads and read-modify-write cycles on settings.json and
+# .supergemini-metadata.json when components install concurrently
+_settings_lock = threading.RLock()
+
+
+# Decorator: run method while holding _settings_lock
+_serialized = serialized(_settings_lock)
+
 
 class SettingsService:
     """Manages settings.json file operations"""
@@ -27,6 +39,7 @@ class SettingsService:
         self.metadata_file = install_dir / ".supergemini-metadata.json"
         self.backup_dir = install_dir / "backups" / "settings"
         
+    @_serialized
     def load_settings(self) -> Dict[str, Any]:
         """
         Load settings from settings.json
@@ -43,6 +56,7 @@ class SettingsService:
         except (json.JSONDecodeError, IOError) as e:
             raise ValueError(f"Could not load settings from {self.settings_file}: {e}")
     
+    @_serialized
     def save_settings(self, settings: Dict[str, Any], create_backup: bool = True) -> None:
         """
         Save settings to settings.json with optional backup
@@ -65,6 +79,7 @@ class SettingsService:
         except IOError as e:
             raise ValueError(f"Could not save settings to {self.settings_file}: {e}")
     
+    @_serialized
     def load_metadata(self) -> Dict[str, Any]:
         """
         Load SuperGemini metadata from .supergemini-metadata.json
@@ -81,6 +96,7 @@ class SettingsService:
         except (json.JSONDecodeError, IOError) as e:
             raise ValueError(f"Could not load metadata from {self.metadata_file}: {e}")
     
+    @_serialized
     def save_metadata(self, metadata: Dict[str, Any]) -> None:
         """
         Save SuperGemini metadata to .supergemini-metadata.json
@@ -111,6 +127,7 @@ class SettingsService:
         existing = self.load_metadata()
         return self._deep_merge(existing, modifications)
 
+    @_serialized
     def update_metadata(self, modifications: Dict[str, Any]) -> None:
         """
         Update settings with modifications
@@ -122,6 +139,7 @@ class SettingsService:
         merged = self.merge_metadata(modifications)
         self.save_metadata(merged)
 
+    @_serialized
     def migrate_supergemini_data(self) -> bool:
         """
         Migrate SuperGemini-specific data from settings.json to metadata file
@@ -173,6 +191,7 @@ class SettingsService:
         existing = self.load_settings()
         return self._deep_merge(existing, modifications)
     
+    @_serialized
     def update_settings(self, modifications: Dict[str, Any], create_backup: bool = True) -> None:
         """
         Update settings with modifications
@@ -205,6 +224,7 @@ class SettingsService:
         except (KeyError, TypeError):
             return default
     
+    @_serialized
     def set_setting(self, key_path: str, value: Any, create_backup: bool = True) -> None:
         """
         Set setting value using dot-notation path
@@ -227,6 +247,7 @@ class SettingsService:
         
         self.update_settings(modification, create_backup)
     
+    @_serialized
     def remove_setting(self, key_path: str, create_backup: bool = True) -> bool:
         """
         Remove setting using dot-notation path
@@ -258,6 +279,7 @@ class SettingsService:
         except (KeyError, TypeError):
             return False
     
+    @_serialized
     def add_component_registration(self, component_name: str, component_info: Dict[str, Any]) -> None:
         """
         Add component to registry in metadata
@@ -277,6 +299,7 @@ class SettingsService:
         
         self.save_metadata(metadata)
     
+    @_serialized
     def remove_component_registration(self, component_name: str) -> bool:
         """
         Remove component from registry in metadata
@@ -331,6 +354,7 @@ class SettingsService:
         component_info = components.get(component_name, {})
         return component_info.get("version")
     
+    @_serialized
     def update_framework_version(self, version: str) -> None:
         """
         Update SuperGemini framework version in metadata
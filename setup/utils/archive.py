@@ -0,0 +1,743 @@
+"""
+Streaming tar archives for SuperGemini backups
+Writes installation files straight into a (optionally parallel-compressed) tar
+stream and reads archives back regardless of compression, optionally through
+a sidecar member index that allows seeking to single files
+"""
+
+import bisect
+import fnmatch
+import gzip
+import io
+import json
+import os
+import posixpath
+import tarfile
+import time
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+COMPRESSION_METHODS = ("none", "gzip", "bzip2", "zstd")
+
+_SUFFIXES = {
+    "none": ".tar",
+    "gzip": ".tar.gz",
+    "bzip2": ".tar.bz2",
+    "zstd": ".tar.zst",
+}
+
+# Uncompressed bytes per independently compressed gzip member
+PARALLEL_GZIP_BLOCK_SIZE = 1024 * 1024
+
+METADATA_ARCNAME = "backup_metadata.json"
+
+# Sidecar member index written next to an archive (<archive>.idx)
+INDEX_SUFFIX = ".idx"
+INDEX_VERSION = 1
+INDEXABLE_METHODS = ("none", "gzip")
+
+# Parallel extraction threads for uncompressed or indexed archives
+DEFAULT_EXTRACT_JOBS = min(8, os.cpu_count() or 1)
+
+_CHUNK_SIZE = 1024 * 1024
+
+
+def archive_suffix(method: str) -> str:
+    """File suffix for a compression method"""
+    return _SUFFIXES[method]
+
+
+def is_backup_archive(path: Path) -> bool:
+    """
+    Check whether a file name is a backup archive
+
+    Only the archive suffixes the writer produces count, so member indexes
+    (<archive>.idx) and temporary files left by interrupted writes
+    (<archive>.idx.<pid>.tmp) are never listed as backups.
+    """
+    return path.name.endswith(tuple(_SUFFIXES.values()))
+
+
+def detect_compression(archive_path: Path) -> str:
+    """Compression method of an archive, from its file name"""
+    name = archive_path.name
+    for method, suffix in _SUFFIXES.items():
+        if method != "none" and name.endswith(suffix):
+            return method
+    return "none"
+
+
+def _import_zstandard():
+    """Import the optional zstandard package"""
+    try:
+        import zstandard
+    except ImportError:
+        raise ValueError("zstd compression requires the 'zstandard' package (pip install zstandard)")
+    return zstandard
+
+
+class ParallelGzipWriter(io.RawIOBase):
+    """
+    pigz-style gzip writer
+
+    Input is cut into fixed-size blocks that are compressed on a thread pool
+    (zlib releases the GIL) and written in order as consecutive gzip members.
+    Any gzip reader, including tarfile's "r:gz", reads the concatenation as
+    one stream. At most two blocks per worker are in flight, so memory stays
+    bounded.
+
+    ``blocks`` lists (compressed offset, uncompressed offset) of every member
+    written, which is what an archive index needs to start decompressing in
+    the middle of the file.
+    """
+
+    def __init__(self, fileobj, jobs: int, level: int = 6, block_size: int = PARALLEL_GZIP_BLOCK_SIZE):
+        super().__init__()
+        self._fileobj = fileobj
+        self._level = level
+        self._block_size = block_size
+        self._max_pending = 2 * jobs
+        self._executor = ThreadPoolExecutor(max_workers=jobs, thread_name_prefix="sg-gzip")
+        self._pending = deque()
+        self._buffer = bytearray()
+        self._submitted = 0
+        self._written = 0
+        self.blocks: List[Tuple[int, int]] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._buffer += data
+        while len(self._buffer) >= self._block_size:
+            self._submit(bytes(self._buffer[:self._block_size]))
+            del self._buffer[:self._block_size]
+        return len(data)
+
+    def _submit(self, block: bytes) -> None:
+        future = self._executor.submit(gzip.compress, block, self._level, mtime=0)
+        self._pending.append((self._submitted, future))
+        self._submitted += len(block)
+        while len(self._pending) > self._max_pending:
+            self._write_next()
+
+    def _write_next(self) -> None:
+        uncompressed_offset, future = self._pending.popleft()
+        data = future.result()
+        self.blocks.append((self._written, uncompressed_offset))
+        self._fileobj.write(data)
+        self._written += len(data)
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        try:
+            if self._buffer or not self._pending:
+                self._submit(bytes(self._buffer))
+                self._buffer.clear()
+            while self._pending:
+                self._write_next()
+        finally:
+            self._executor.shutdown()
+            super().close()
+
+
+@contextmanager
+def open_archive_writer(archive_path: Path, method: str = "gzip", jobs: int = 1,
+                        blocks: Optional[List[Tuple[int, int]]] = None) -> Iterator[tarfile.TarFile]:
+    """
+    Open a tar archive for streaming writes
+
+    Args:
+        archive_path: Archive to create
+        method: One of COMPRESSION_METHODS
+        jobs: Compression threads; above 1, gzip uses ParallelGzipWriter and
+            zstd uses multi-threaded compression
+        blocks: If given, gzip is always written block-wise and the list is
+            filled with the ParallelGzipWriter block table on close
+    """
+    if method not in COMPRESSION_METHODS:
+        raise ValueError(f"Unknown compression method: {method}")
+
+    if method == "zstd" or (method == "gzip" and (jobs > 1 or blocks is not None)):
+        if method == "zstd":
+            zstandard = _import_zstandard()
+        with open(archive_path, "wb") as raw:
+            if method == "zstd":
+                compressor = zstandard.ZstdCompressor(threads=jobs if jobs > 1 else 0)
+                stream = compressor.stream_writer(raw, closefd=False)
+            else:
+                stream = ParallelGzipWriter(raw, max(jobs, 1), block_size=PARALLEL_GZIP_BLOCK_SIZE)
+            try:
+                with tarfile.open(fileobj=stream, mode="w|") as tar:
+                    yield tar
+            finally:
+                stream.close()
+                if blocks is not None and method == "gzip":
+                    blocks.extend(stream.blocks)
+        return
+
+    mode = {"none": "w", "gzip": "w:gz", "bzip2": "w:bz2"}[method]
+    with tarfile.open(archive_path, mode) as tar:
+        yield tar
+
+
+@contextmanager
+def open_archive_reader(archive_path: Path) -> Iterator[tarfile.TarFile]:
+    """
+    Open a backup archive for reading, whatever its compression
+
+    zstd archives are opened as a forward-only stream; iterate members in
+    order rather than calling getmember().
+    """
+    if detect_compression(archive_path) == "zstd":
+        zstandard = _import_zstandard()
+        with open(archive_path, "rb") as raw:
+            with zstandard.ZstdDecompressor().stream_reader(raw) as stream:
+                with tarfile.open(fileobj=stream, mode="r|") as tar:
+                    yield tar
+        return
+
+    with tarfile.open(archive_path, "r:*") as tar:
+        yield tar
+
+
+def add_bytes(tar: tarfile.TarFile, arcname: str, data: bytes) -> tarfile.TarInfo:
+    """Add an in-memory file to an archive"""
+    info = tarfile.TarInfo(arcname)
+    info.size = len(data)
+    info.mtime = int(time.time())
+    info.mode = 0o644
+    tar.addfile(info, io.BytesIO(data))
+    return info
+
+
+def iter_files(root: Path, exclude: Iterable[Path] = ()) -> Iterator[Tuple[Path, str]]:
+    """
+    Walk regular files under root in sorted order
+
+    Args:
+        root: Directory to walk
+        exclude: Files or directories to leave out
+
+    Yields:
+        (path, archive name relative to root)
+    """
+    excluded = {os.path.abspath(path) for path in exclude}
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames if os.path.abspath(os.path.join(dirpath, d)) not in excluded)
+        for filename in sorted(filenames):
+            path = os.path.join(dirpath, filename)
+            if os.path.abspath(path) in excluded or not os.path.isfile(path):
+                continue
+            yield Path(path), Path(os.path.relpath(path, root)).as_posix()
+
+
+def _padded(size: int) -> int:
+    """Size of a tar member's data rounded up to whole blocks"""
+    return -(-size // tarfile.BLOCKSIZE) * tarfile.BLOCKSIZE
+
+
+def _index_entry(info: tarfile.TarInfo, data_offset: int) -> Dict[str, Any]:
+    """Index entry for a tar member whose data starts at data_offset"""
+    return {
+        "type": "dir" if info.isdir() else "file",
+        "offset": data_offset,
+        "size": info.size,
+        "mode": info.mode,
+        "mtime": info.mtime
+    }
+
+
+def index_path(archive_path: Path) -> Path:
+    """Sidecar index file of an archive"""
+    return archive_path.with_name(archive_path.name + INDEX_SUFFIX)
+
+
+def write_backup_archive(root: Path,
+                         archive_path: Path,
+                         method: str = "gzip",
+                         jobs: int = 1,
+                         metadata: Optional[bytes] = None,
+                         exclude: Iterable[Path] = (),
+                         index: bool = False,
+                         logger=None) -> Dict[str, Any]:
+    """
+    Stream every file under root into a new archive
+
+    Args:
+        root: Directory to back up
+        archive_path: Archive to create
+        method: One of COMPRESSION_METHODS
+        jobs: Compression threads
+        metadata: Optional JSON bytes stored as backup_metadata.json
+        exclude: Files or directories under root to leave out
+        index: Also write <archive>.idx with the data offset of every member;
+            gzip archives are then written block-wise so a member can be
+            read by decompressing only the blocks it spans
+        logger: Logger for per-file warnings
+
+    Returns:
+        Dict with files, bytes_in (uncompressed), bytes_out, duration and
+        throughput (MB/s of input)
+    """
+    if index and method not in INDEXABLE_METHODS:
+        raise ValueError(f"Indexed archives support {', '.join(INDEXABLE_METHODS)} compression, not {method}")
+
+    start = time.perf_counter()
+    files = 0
+    bytes_in = 0
+    members: Dict[str, Dict[str, Any]] = {}
+    blocks: Optional[List[Tuple[int, int]]] = [] if index and method == "gzip" else None
+
+    def record(tar: tarfile.TarFile, info: tarfile.TarInfo) -> None:
+        # tar.offset is now just past the member's padded data
+        members[info.name] = _index_entry(info, tar.offset - _padded(info.size))
+
+    index_path(archive_path).unlink(missing_ok=True)
+
+    with open_archive_writer(archive_path, method, jobs, blocks=blocks) as tar:
+        if metadata is not None:
+            record(tar, add_bytes(tar, METADATA_ARCNAME, metadata))
+
+        for path, arcname in iter_files(root, exclude=list(exclude) + [archive_path, index_path(archive_path)]):
+            try:
+                info = tar.gettarinfo(str(path), arcname=arcname)
+                with open(path, "rb") as f:
+                    tar.addfile(info, f)
+                if info.isreg():
+                    record(tar, info)
+                else:
+                    # Links are not indexed; restores fall back to streaming
+                    index = False
+                files += 1
+                bytes_in += info.size
+            except OSError as e:
+                if logger:
+                    logger.warning(f"Could not add {path} to backup: {e}")
+
+    if index:
+        write_archive_index(archive_path, method, members, blocks)
+
+    duration = time.perf_counter() - start
+    return {
+        "files": files,
+        "bytes_in": bytes_in,
+        "bytes_out": archive_path.stat().st_size,
+        "duration": duration,
+        "throughput": bytes_in / (1024 * 1024) / duration if duration > 0 else 0.0
+    }
+
+
+def write_archive_index(archive_path: Path, method: str, members: Dict[str, Dict[str, Any]],
+                        blocks: Optional[List[Tuple[int, int]]] = None) -> Path:
+    """
+    Atomically write the sidecar index of a finished archive
+
+    Args:
+        archive_path: Archive the index describes
+        method: Compression method of the archive
+        members: Member name -> {type, offset, size, mode, mtime}; offsets
+            are positions in the uncompressed tar stream
+        blocks: (compressed offset, uncompressed offset) of each gzip member
+
+    Returns:
+        Path to the index
+    """
+    target = index_path(archive_path)
+    data = {
+        "version": INDEX_VERSION,
+        "method": method,
+        "archive_size": archive_path.stat().st_size,
+        "blocks": blocks or [],
+        "members": members
+    }
+    tmp_path = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, separators=(",", ":"))
+    os.replace(tmp_path, target)
+    return target
+
+
+def load_archive_index(archive_path: Path) -> Optional[Dict[str, Any]]:
+    """
+    Load the sidecar index of an archive
+
+    Returns:
+        The index, or None if there is none or it does not describe the
+        archive as it is on disk
+    """
+    try:
+        with open(index_path(archive_path), "r", encoding="utf-8") as f:
+            data = json.load(f)
+        archive_size = archive_path.stat().st_size
+    except (OSError, ValueError):
+        return None
+
+    if (not isinstance(data, dict) or data.get("version") != INDEX_VERSION
+            or data.get("method") != detect_compression(archive_path)
+            or data.get("archive_size") != archive_size):
+        return None
+    if data["method"] == "gzip" and not data.get("blocks"):
+        return None
+    return data
+
+
+def _scan_uncompressed(archive_path: Path) -> Optional[Dict[str, Any]]:
+    """
+    Build an in-memory index of an uncompressed tar from its headers
+
+    tarfile seeks over member data, so only the headers are read. Returns
+    None if the archive has members that are neither files nor directories.
+    """
+    members = {}
+    with tarfile.open(archive_path, "r:") as tar:
+        for info in tar:
+            if not (info.isreg() or info.isdir()):
+                return None
+            members[info.name] = _index_entry(info, info.offset_data)
+    return {"method": "none", "blocks": [], "members": members}
+
+
+def member_matches(name: str, patterns: Optional[Sequence[str]]) -> bool:
+    """
+    Check whether an archive member is selected by restore patterns
+
+    A pattern selects a member with that exact name, everything below it when
+    it names a directory, or any name it matches as a glob. No patterns
+    selects everything.
+    """
+    if not patterns:
+        return True
+    for pattern in patterns:
+        pattern = pattern.strip("/")
+        if pattern.startswith("./"):
+            pattern = pattern[2:]
+        if name == pattern or name.startswith(pattern + "/") or fnmatch.fnmatchcase(name, pattern):
+            return True
+    return False
+
+
+def _safe_target(target_root: Path, name: str) -> Optional[Path]:
+    """Resolved restore target for a member name, or None if it escapes the root"""
+    target = (target_root / name).resolve()
+    if target_root not in target.parents:
+        return None
+    return target
+
+
+def _safe_link(target_root: Path, member: tarfile.TarInfo) -> bool:
+    """Check that a link member points inside the root; other special files are refused"""
+    if member.issym():
+        if posixpath.isabs(member.linkname):
+            return False
+        link_target = posixpath.join(posixpath.dirname(member.name), member.linkname)
+    elif member.islnk():
+        link_target = member.linkname
+    else:
+        return False  # Devices and FIFOs never belong in a backup
+    return _safe_target(target_root, link_target) is not None
+
+
+# tarfile's "data" filter (Python 3.12, and security releases of 3.8+)
+# re-checks links, permissions and special files during extraction
+_EXTRACT_FILTER = {"filter": "data"} if hasattr(tarfile, "data_filter") else {}
+
+
+class _IndexedReader:
+    """
+    Reads byte ranges of the uncompressed tar stream of an indexed archive
+
+    Uncompressed archives are read with plain seeks. For block-wise gzip the
+    reader seeks to the gzip member containing the requested offset, and
+    keeps decompressing forward when the next range lies in the same or the
+    following block, so sorted reads decompress each block at most once.
+    """
+
+    def __init__(self, archive_path: Path, index: Dict[str, Any]):
+        self._file = open(archive_path, "rb")
+        self._gzip = index["method"] == "gzip"
+        self._blocks = index.get("blocks", [])
+        self._block_starts = [uncompressed for _, uncompressed in self._blocks]
+        self._decompressor = None
+        self._position = -1  # Uncompressed offset of the next byte of _pending
+        self._pending = b""
+        self._block = -1
+
+    def close(self) -> None:
+        self._file.close()
+
+    def _seek_block(self, block: int) -> None:
+        self._file.seek(self._blocks[block][0])
+        self._decompressor = zlib.decompressobj(wbits=31)
+        self._position = self._blocks[block][1]
+        self._pending = b""
+        self._block = block
+
+    def _fill(self) -> bool:
+        """Decompress the next piece of the stream into _pending"""
+        if self._decompressor.eof:
+            unused = self._decompressor.unused_data
+            self._decompressor = zlib.decompressobj(wbits=31)
+            self._block += 1
+            if unused:
+                self._pending = self._decompressor.decompress(unused)
+                return True
+        data = self._file.read(_CHUNK_SIZE // 4)
+        if not data:
+            return False
+        self._pending = self._decompressor.decompress(data)
+        return True
+
+    def iter_range(self, offset: int, size: int) -> Iterator[bytes]:
+        """Yield the bytes [offset, offset + size) of the tar stream"""
+        if not self._gzip:
+            self._file.seek(offset)
+            while size > 0:
+                chunk = self._file.read(min(size, _CHUNK_SIZE))
+                if not chunk:
+                    raise EOFError("Archive ends before the indexed member")
+                size -= len(chunk)
+                yield chunk
+            return
+
+        block = bisect.bisect_right(self._block_starts, offset) - 1
+        if self._decompressor is None or self._position > offset or block > self._block + 1:
+            self._seek_block(block)
+
+        while size > 0:
+            end = self._position + len(self._pending)
+            if end <= offset:
+                self._position = end
+                self._pending = b""
+            elif self._position < offset:
+                self._pending = self._pending[offset - self._position:]
+                self._position = offset
+            if self._pending and self._position >= offset:
+                chunk = self._pending[:size]
+                self._pending = self._pending[len(chunk):]
+                self._position += len(chunk)
+                offset += len(chunk)
+                size -= len(chunk)
+                yield chunk
+                continue
+            if not self._fill():
+                raise EOFError("Archive ends before the indexed member")
+
+
+def read_indexed_member(archive_path: Path, index: Dict[str, Any], name: str) -> Optional[bytes]:
+    """Read one regular member through an archive index, or None if it is not indexed"""
+    entry = index["members"].get(name)
+    if entry is None or entry["type"] != "file":
+        return None
+    reader = _IndexedReader(archive_path, index)
+    try:
+        return b"".join(reader.iter_range(entry["offset"], entry["size"]))
+    finally:
+        reader.close()
+
+
+def scan_archive(archive_path: Path) -> Tuple[int, Optional[bytes]]:
+    """
+    Count archived files and read backup_metadata.json
+
+    Uses the archive index when there is one; otherwise reads the archive
+    once from start to end.
+
+    Returns:
+        (number of archived files, not counting backup_metadata.json;
+        metadata bytes or None)
+    """
+    index = load_archive_index(archive_path)
+    if index is not None:
+        members = index["members"]
+        files = sum(1 for name, entry in members.items()
+                    if entry["type"] == "file" and name != METADATA_ARCNAME)
+        return files, read_indexed_member(archive_path, index, METADATA_ARCNAME)
+
+    files = 0
+    metadata = None
+    with open_archive_reader(archive_path) as tar:
+        for member in tar:
+            if member.name == METADATA_ARCNAME:
+                metadata_file = tar.extractfile(member)
+                if metadata_file:
+                    metadata = metadata_file.read()
+            elif member.isreg():
+                files += 1
+    return files, metadata
+
+
+def _write_member(target: Path, chunks: Iterable[bytes], mode: int, mtime: int) -> None:
+    """Write a restored file and apply its mode and mtime"""
+    target.parent.mkdir(parents=True, exist_ok=True)
+    with open(target, "wb") as out:
+        for chunk in chunks:
+            out.write(chunk)
+    os.chmod(target, mode & 0o777)
+    os.utime(target, (mtime, mtime))
+
+
+def _new_result() -> Dict[str, int]:
+    return {"matched": 0, "restored": 0, "skipped": 0, "failed": 0}
+
+
+def _extract_indexed(archive_path: Path, index: Dict[str, Any], target_dir: Path,
+                     selected: List[Tuple[str, Dict[str, Any]]], overwrite: bool,
+                     jobs: int, logger) -> Dict[str, int]:
+    """Extract selected index entries on a thread pool, one reader per worker"""
+    result = _new_result()
+    target_root = target_dir.resolve()
+    work = []
+
+    for name, entry in selected:
+        result["matched"] += 1
+        target = _safe_target(target_root, name)
+        if target is None:
+            if logger:
+                logger.warning(f"Skipping unsafe path in backup: {name}")
+            result["failed"] += 1
+        elif entry["type"] == "dir":
+            target.mkdir(parents=True, exist_ok=True)
+        elif target.exists() and not overwrite:
+            if logger:
+                logger.warning(f"Skipping existing file: {target}")
+            result["skipped"] += 1
+        else:
+            work.append((name, entry, target))
+
+    if not work:
+        return result
+
+    # Contiguous runs in archive order, balanced by bytes, so each worker
+    # reads its part of the archive front to back
+    work.sort(key=lambda item: item[1]["offset"])
+    jobs = max(1, min(jobs, len(work)))
+    share = sum(entry["size"] for _, entry, _ in work) / jobs
+    runs: List[list] = [[]]
+    run_bytes = 0
+    for item in work:
+        if runs[-1] and run_bytes >= share and len(runs) < jobs:
+            runs.append([])
+            run_bytes = 0
+        runs[-1].append(item)
+        run_bytes += item[1]["size"]
+
+    def extract_run(run) -> Tuple[int, int]:
+        restored = failed = 0
+        reader = _IndexedReader(archive_path, index)
+        try:
+            for name, entry, target in run:
+                try:
+                    _write_member(target, reader.iter_range(entry["offset"], entry["size"]),
+                                  entry["mode"], entry["mtime"])
+                    restored += 1
+                except (OSError, EOFError, zlib.error) as e:
+                    if logger:
+                        logger.warning(f"Could not restore {name}: {e}")
+                    failed += 1
+        finally:
+            reader.close()
+        return restored, failed
+
+    if len(runs) == 1:
+        outcomes = [extract_run(runs[0])]
+    else:
+        with ThreadPoolExecutor(max_workers=len(runs), thread_name_prefix="sg-restore") as executor:
+            outcomes = list(executor.map(extract_run, runs))
+
+    for restored, failed in outcomes:
+        result["restored"] += restored
+        result["failed"] += failed
+    return result
+
+
+def _extract_stream(archive_path: Path, target_dir: Path, patterns: Optional[Sequence[str]],
+                    skip: Sequence[str], overwrite: bool, logger) -> Dict[str, int]:
+    """Extract matching members in one sequential pass over the archive"""
+    result = _new_result()
+    target_root = target_dir.resolve()
+
+    with open_archive_reader(archive_path) as tar:
+        for member in tar:
+            if member.name in skip or not member_matches(member.name, patterns):
+                continue
+            result["matched"] += 1
+            target = _safe_target(target_root, member.name)
+            if target is None:
+                if logger:
+                    logger.warning(f"Skipping unsafe path in backup: {member.name}")
+                result["failed"] += 1
+                continue
+            if member.isdir():
+                target.mkdir(parents=True, exist_ok=True)
+                continue
+            if target.exists() and not overwrite:
+                if logger:
+                    logger.warning(f"Skipping existing file: {target}")
+                result["skipped"] += 1
+                continue
+
+            try:
+                if member.isreg():
+                    source = tar.extractfile(member)
+                    _write_member(target, iter(lambda: source.read(_CHUNK_SIZE), b""),
+                                  member.mode, member.mtime)
+                elif _safe_link(target_root, member):
+                    tar.extract(member, target_dir, **_EXTRACT_FILTER)
+                else:
+                    if logger:
+                        logger.warning(f"Skipping unsafe link in backup: {member.name}")
+                    result["failed"] += 1
+                    continue
+                result["restored"] += 1
+            except (OSError, tarfile.TarError) as e:
+                if logger:
+                    logger.warning(f"Could not restore {member.name}: {e}")
+                result["failed"] += 1
+
+    return result
+
+
+def extract_archive(archive_path: Path,
+                    target_dir: Path,
+                    patterns: Optional[Sequence[str]] = None,
+                    overwrite: bool = False,
+                    jobs: int = DEFAULT_EXTRACT_JOBS,
+                    skip: Sequence[str] = (METADATA_ARCNAME,),
+                    logger=None) -> Dict[str, int]:
+    """
+    Restore members of an archive, optionally only those matching patterns
+
+    Indexed and uncompressed archives are listed once from the index (or the
+    tar headers) and only the selected members are read, on ``jobs``
+    threads. Other archives are streamed once, extracting matches as they
+    pass.
+
+    Args:
+        archive_path: Archive to restore from
+        target_dir: Directory to restore into
+        patterns: Member names, directories or globs to restore (see
+            member_matches); None restores everything
+        overwrite: Replace files that already exist
+        jobs: Extraction threads for uncompressed or indexed archives
+        skip: Member names never restored
+        logger: Logger for per-file warnings
+
+    Returns:
+        Dict with matched, restored, skipped and failed counts
+    """
+    index = load_archive_index(archive_path)
+    if index is None and detect_compression(archive_path) == "none":
+        index = _scan_uncompressed(archive_path)
+
+    if index is None:
+        return _extract_stream(archive_path, target_dir, patterns, skip, overwrite, logger)
+
+    selected = [(name, entry) for name, entry in index["members"].items()
+                if name not in skip and member_matches(name, patterns)]
+    return _extract_indexed(archive_path, index, target_dir, selected, overwrite, jobs, logger)
@@ -0,0 +1,66 @@
+"""
+Bounded JSON key scanner for SuperGemini
+Looks for object keys in JSON files up to a fixed depth, refusing files larger
+than a read budget before opening them
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Iterable, Tuple
+
+# Largest file (in bytes) that is parsed at all
+DEFAULT_JSON_SCAN_BUDGET = 1024 * 1024
+
+
+def _has_key(value: Any, needles: Tuple[str, ...], depth: int, max_depth: int) -> bool:
+    """Walk containers down to max_depth, stopping at the first matching key"""
+    if depth > max_depth:
+        return False
+    if isinstance(value, dict):
+        for key in value:
+            if any(needle in key.lower() for needle in needles):
+                return True
+        children = value.values()
+    elif isinstance(value, list):
+        children = value
+    else:
+        return False
+    return any(_has_key(child, needles, depth + 1, max_depth) for child in children)
+
+
+def json_has_key(file_path: Path,
+                 needles: Iterable[str],
+                 max_depth: int = 3,
+                 read_budget: int = DEFAULT_JSON_SCAN_BUDGET) -> bool:
+    """
+    Check whether a JSON file has an object key containing any needle
+
+    Files larger than read_budget are rejected from their size alone, so
+    large session logs are never opened. Smaller files are parsed with the
+    json module's C parser, which checks the whole document; truncated,
+    malformed or concatenated files (e.g. JSONL logs) therefore never match.
+    Keys of objects nested deeper than max_depth containers (the top-level
+    value is depth 0) are not matched, and the walk stops at the first match.
+
+    Args:
+        file_path: JSON file to scan
+        needles: Lowercase substrings to look for in lowercased keys
+        max_depth: Deepest container nesting whose object keys are checked
+        read_budget: Largest file size in bytes that is read
+
+    Returns:
+        True if the file is valid JSON with a matching key; False otherwise,
+        including when the file is over budget or could not be read
+    """
+    try:
+        if os.stat(file_path).st_size > read_budget:
+            return False
+        with open(file_path, 'rb') as f:
+            data = f.read(read_budget + 1)
+        if len(data) > read_budget:
+            return False  # Grew since the size check
+        document = json.loads(data.decode('utf-8'))
+    except (OSError, ValueError, RecursionError):
+        return False
+    return _has_key(document, tuple(needles), 0, max_depth)
@@ -0,0 +1,26 @@
+"""
+Locking helpers for services shared by concurrently installing components
+"""
+
+import functools
+from typing import Callable, ContextManager
+
+
+def serialized(lock: ContextManager) -> Callable[[Callable], Callable]:
+    """
+    Build a decorator that runs the wrapped function while holding lock
+
+    Args:
+        lock: Lock to hold, normally a threading.RLock so decorated methods
+            can call each other
+
+    Returns:
+        Decorator for functions and methods
+    """
+    def decorator(method: Callable) -> Callable:
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            with lock:
+                return method(*args, **kwargs)
+        return wrapper
+    return decorator
@@ -85,6 +85,9 @@ class Logger:
                     'CRITICAL': '[CRITICAL]'
                 }
                 
+                if getattr(record, 'success', False):
+                    return f"{Colors.GREEN}[✓] {record.getMessage()}{Colors.RESET}"
+                
                 color = colors.get(record.levelname, Colors.WHITE)
                 prefix = prefixes.get(record.levelname, '[LOG]')
                 
@@ -170,23 +173,10 @@ class Logger:
     
     def success(self, message: str, **kwargs) -> None:
         """Log success message (info level with special formatting)"""
-        # Use a custom success formatter for console
-        if self.logger.handlers:
-            console_handler = self.logger.handlers[0]
-            if hasattr(console_handler, 'formatter'):
-                original_format = console_handler.formatter.format
-                
-                def success_format(record):
-                    return f"{Colors.GREEN}[✓] {record.getMessage()}{Colors.RESET}"
-                
-                console_handler.formatter.format = success_format
-                self.logger.info(message, **kwargs)
-                console_handler.formatter.format = original_format
-            else:
-                self.logger.info(f"SUCCESS: {message}", **kwargs)
-        else:
-            self.logger.info(f"SUCCESS: {message}", **kwargs)
-        
+        # Flag the record instead of swapping the console formatter, which
+        # would race with messages logged from other threads
+        extra = dict(kwargs.pop('extra', None) or {}, success=True)
+        self.logger.info(message, extra=extra, **kwargs)
         self.log_counts['info'] += 1
     
     def step(self, step: int, total: int, message: str, **kwargs) -> None:
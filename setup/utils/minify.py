@@ -0,0 +1,134 @@
+"""
+Markdown minifier for installed SuperGemini framework files
+Produces a compact copy for the model to read: comments, example sections,
+decorative rules and repeated blocks are dropped and whitespace collapsed.
+Fenced code blocks are kept verbatim.
+"""
+
+import re
+from pathlib import Path
+from typing import List, Optional
+
+# Bump when the output changes so installed copies are rewritten
+MINIFY_VERSION = 1
+
+# Repeated blocks shorter than this are kept (short lines like "**Will:**"
+# legitimately repeat)
+MIN_DEDUPE_CHARS = 40
+
+_FENCE = re.compile(r'^\s*(```|~~~)')
+_HEADING = re.compile(r'^(#{1,6})\s+(.*)$')
+_EXAMPLE_HEADING = re.compile(r'\bexamples?\b', re.IGNORECASE)
+_HTML_COMMENT = re.compile(r'<!--.*?-->', re.DOTALL)
+_THEMATIC_BREAK = re.compile(r'^\s*([-*_])(\s*\1){2,}\s*$')
+_TABLE_SEPARATOR_CELL = re.compile(r'^(:?)-+(:?)$')
+_TABLE_CELL_SPLIT = re.compile(r'(?<!\\)\|')
+_INNER_SPACES = re.compile(r'(?<=\S) {2,}(?=\S)')
+
+
+def _split_frontmatter(text: str):
+    """Split off YAML frontmatter, which is kept as is"""
+    if text.startswith("---\n"):
+        end = text.find("\n---\n", 4)
+        if end >= 0:
+            return text[:end + 5], text[end + 5:]
+    return "", text
+
+
+def _compact_table_row(line: str) -> str:
+    """Drop the alignment padding of a table row"""
+    cells = [cell.strip() for cell in _TABLE_CELL_SPLIT.split(line.strip().strip("|"))]
+    compact = []
+    for cell in cells:
+        separator = _TABLE_SEPARATOR_CELL.match(cell)
+        compact.append(f"{separator.group(1)}-{separator.group(2)}" if separator else cell)
+    return "|" + "|".join(compact) + "|"
+
+
+def _drop_example_sections(lines: List[str]) -> List[str]:
+    """Remove sections whose heading mentions examples, up to the next heading of the same or a higher level"""
+    kept = []
+    in_fence = False
+    skip_level: Optional[int] = None
+    for line in lines:
+        if _FENCE.match(line):
+            in_fence = not in_fence
+        elif not in_fence:
+            heading = _HEADING.match(line)
+            if heading:
+                level = len(heading.group(1))
+                if skip_level is not None and level <= skip_level:
+                    skip_level = None
+                # The document title (level 1) names the file; keep it
+                if skip_level is None and level > 1 and _EXAMPLE_HEADING.search(heading.group(2)):
+                    skip_level = level
+        if skip_level is None:
+            kept.append(line)
+    return kept
+
+
+def minify_markdown(text: str) -> str:
+    """
+    Minify Markdown for model consumption
+
+    Strips HTML comments, drops example sections and thematic breaks,
+    removes table padding, collapses runs of spaces and blank lines, and
+    drops blocks of at least MIN_DEDUPE_CHARS that already appeared
+    earlier in the file. Fenced code blocks and frontmatter are kept.
+
+    Args:
+        text: Markdown source
+
+    Returns:
+        Minified Markdown ending in a single newline
+    """
+    frontmatter, body = _split_frontmatter(text.replace("\r\n", "\n"))
+    body = _HTML_COMMENT.sub("", body)
+    lines = _drop_example_sections(body.split("\n"))
+
+    # Group lines into blocks separated by blank lines; a fenced code block
+    # always stays inside one block
+    blocks: List[List[str]] = []
+    current: List[str] = []
+    in_fence = False
+    for line in lines:
+        if _FENCE.match(line):
+            in_fence = not in_fence
+            current.append(line.rstrip())
+            continue
+        if in_fence:
+            current.append(line.rstrip())
+            continue
+        if not line.strip() or _THEMATIC_BREAK.match(line):
+            if current:
+                blocks.append(current)
+                current = []
+            continue
+        line = line.rstrip()
+        if line.lstrip().startswith("|"):
+            line = _compact_table_row(line)
+        else:
+            indent = len(line) - len(line.lstrip())
+            line = line[:indent] + _INNER_SPACES.sub(" ", line[indent:])
+        current.append(line)
+    if current:
+        blocks.append(current)
+
+    seen = set()
+    kept = []
+    for block in blocks:
+        joined = "\n".join(block)
+        if len(joined) >= MIN_DEDUPE_CHARS and not _HEADING.match(block[0]):
+            if joined in seen:
+                continue
+            seen.add(joined)
+        kept.append(joined)
+
+    return frontmatter + "\n\n".join(kept) + "\n"
+
+
+def minify_file(source: Path, text: str) -> str:
+    """File transform: minify Markdown files and leave other files unchanged"""
+    if source.suffix.lower() != ".md":
+        return text
+    return minify_markdown(text)
@@ -0,0 +1,192 @@
+"""
+Global npm package inventory for SuperGemini
+Reads `npm ls -g --json --depth=0` once and answers package lookups from memory
+"""
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+import threading
+from pathlib import Path
+from typing import Dict, Optional
+
+from .logger import get_logger
+from .probe_cache import ProbeCache
+
+__all__ = [
+    'npm_package_name',
+    'parse_npm_inventory',
+    'find_global_node_modules',
+    'get_npm_global_inventory',
+    'invalidate_npm_global_inventory',
+    'get_installed_npm_version'
+]
+
+NPM_LS_COMMAND = ["npm", "ls", "-g", "--json", "--depth=0"]
+
+_inventory_lock = threading.Lock()
+_inventory_cache: Optional[Dict[str, str]] = None
+
+
+def npm_package_name(package_spec: str) -> str:
+    """
+    Strip the version/tag from an npm package spec
+
+    Handles scoped packages, e.g. "@upstash/context7-mcp@latest" -> "@upstash/context7-mcp"
+    and "left-pad@1.3.0" -> "left-pad".
+    """
+    if package_spec.startswith("@"):
+        scope, _, rest = package_spec[1:].partition("/")
+        return f"@{scope}/{rest.split('@', 1)[0]}" if rest else package_spec
+    return package_spec.split("@", 1)[0]
+
+
+def parse_npm_inventory(output: str) -> Dict[str, str]:
+    """
+    Parse `npm ls -g --json --depth=0` output into {package name: version}
+
+    Raises:
+        ValueError: If output is not valid npm JSON
+    """
+    data = json.loads(output or "{}")
+    if not isinstance(data, dict):
+        raise ValueError("Unexpected npm ls output")
+
+    inventory = {}
+    for name, info in (data.get("dependencies") or {}).items():
+        version = info.get("version", "unknown") if isinstance(info, dict) else "unknown"
+        inventory[name] = version
+    return inventory
+
+
+def _npmrc_prefix() -> Optional[str]:
+    """Get the global prefix configured in the environment or the user .npmrc"""
+    prefix = os.environ.get("NPM_CONFIG_PREFIX") or os.environ.get("npm_config_prefix")
+    if prefix:
+        return prefix
+    try:
+        with open(Path.home() / ".npmrc", 'r', encoding='utf-8') as f:
+            for line in f:
+                name, sep, value = line.partition("=")
+                if sep and name.strip() == "prefix":
+                    return os.path.expanduser(value.strip())
+    except OSError:
+        pass
+    return None
+
+
+def find_global_node_modules(npm_executable: str) -> Optional[Path]:
+    """
+    Locate the global node_modules directory without running npm
+
+    Uses the configured prefix if there is one, otherwise the node_modules
+    directory that contains npm itself (the npm executable is a link into
+    <root>/npm/bin).
+
+    Args:
+        npm_executable: Resolved path of the npm executable
+
+    Returns:
+        Global node_modules directory, or None if it cannot be determined
+    """
+    prefix = _npmrc_prefix()
+    if prefix:
+        root = Path(prefix) / "node_modules" if sys.platform == "win32" else Path(prefix) / "lib" / "node_modules"
+        return root if root.is_dir() else None
+
+    npm_path = Path(os.path.realpath(npm_executable))
+    for parent in npm_path.parents:
+        if parent.name == "node_modules":
+            return parent
+    return None
+
+
+def _npm_ls_cache_key(probe_cache: Optional[ProbeCache]) -> Optional[str]:
+    """Build the probe cache key for `npm ls -g`, or None if it cannot be cached"""
+    if probe_cache is None:
+        return None
+    executable = shutil.which("npm")
+    if not executable:
+        return None
+    global_root = find_global_node_modules(executable)
+    if global_root is None:
+        return None
+    # Installing or removing a global package changes the directory mtime
+    return ProbeCache.make_key(NPM_LS_COMMAND, executable, watch_paths=[global_root])
+
+
+def get_npm_global_inventory(refresh: bool = False,
+                             probe_cache: Optional[ProbeCache] = None) -> Optional[Dict[str, str]]:
+    """
+    Get globally installed npm packages, cached for the rest of the run
+
+    Args:
+        refresh: Re-read the inventory even if it is cached
+        probe_cache: Persistent probe cache to answer from and store into;
+            entries are invalidated when the global node_modules directory changes
+
+    Returns:
+        Dict mapping package name to version, or None if npm could not be queried
+    """
+    global _inventory_cache
+
+    with _inventory_lock:
+        if _inventory_cache is not None and not refresh:
+            return _inventory_cache
+
+        logger = get_logger()
+        cache_key = None if refresh else _npm_ls_cache_key(probe_cache)
+        if cache_key:
+            cached = probe_cache.get(cache_key)
+            if cached is not None:
+                try:
+                    _inventory_cache = parse_npm_inventory(cached.stdout)
+                    logger.debug(f"Loaded global npm inventory from probe cache: {len(_inventory_cache)} packages")
+                    return _inventory_cache
+                except ValueError:
+                    pass
+
+        try:
+            result = subprocess.run(
+                NPM_LS_COMMAND,
+                capture_output=True,
+                text=True,
+                timeout=60,
+                shell=(sys.platform == "win32")
+            )
+            # npm ls exits non-zero on peer/extraneous problems but still prints the tree
+            _inventory_cache = parse_npm_inventory(result.stdout)
+            if cache_key:
+                probe_cache.put(cache_key, result)
+            logger.debug(f"Loaded global npm inventory: {len(_inventory_cache)} packages")
+        except (subprocess.TimeoutExpired, OSError, ValueError) as e:
+            logger.debug(f"Could not read global npm inventory: {e}")
+            return None
+
+        return _inventory_cache
+
+
+def invalidate_npm_global_inventory() -> None:
+    """Drop the cached inventory, e.g. after installing packages"""
+    global _inventory_cache
+
+    with _inventory_lock:
+        _inventory_cache = None
+
+
+def get_installed_npm_version(package_spec: str) -> Optional[str]:
+    """
+    Get the globally installed version of an npm package
+
+    Args:
+        package_spec: Package name, optionally with a version/tag suffix
+
+    Returns:
+        Installed version, or None if the package is not installed or npm is unavailable
+    """
+    inventory = get_npm_global_inventory()
+    if inventory is None:
+        return None
+    return inventory.get(npm_package_name(package_spec))
@@ -0,0 +1,169 @@
+"""
+Persistent cache for external tool probes (node --version, gemini --version, ...)
+Entries are keyed by command, resolved executable path, executable mtime and a
+hash of PATH, so upgrading a tool or changing PATH invalidates them automatically.
+Only successful probes are stored; a failing probe is re-run on the next call.
+"""
+
+import hashlib
+import json
+import os
+import subprocess
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Any, Iterable, List, Optional
+
+from .logger import get_logger
+
+# Default time-to-live for cached probe results (seconds)
+DEFAULT_PROBE_CACHE_TTL = 24 * 60 * 60
+
+PROBE_CACHE_FILENAME = ".supergemini-probe-cache.json"
+
+
+def get_default_probe_cache_ttl() -> int:
+    """Get probe cache TTL, overridable with SUPERGEMINI_PROBE_CACHE_TTL (0 disables)"""
+    env_ttl = os.getenv("SUPERGEMINI_PROBE_CACHE_TTL")
+    if env_ttl is not None:
+        try:
+            return max(0, int(env_ttl))
+        except ValueError:
+            get_logger().warning(f"Ignoring invalid SUPERGEMINI_PROBE_CACHE_TTL: {env_ttl}")
+    return DEFAULT_PROBE_CACHE_TTL
+
+
+class ProbeCache:
+    """On-disk cache of probe subprocess results"""
+
+    def __init__(self, cache_file: Path, ttl: int = DEFAULT_PROBE_CACHE_TTL):
+        """
+        Initialize probe cache
+
+        Args:
+            cache_file: JSON file holding cached entries
+            ttl: Seconds an entry stays valid (0 disables the cache)
+        """
+        self.cache_file = cache_file
+        self.ttl = ttl
+        self._entries: Optional[Dict[str, Dict[str, Any]]] = None
+        self._lock = threading.Lock()
+        self.logger = get_logger()
+
+    @staticmethod
+    def make_key(command: List[str], executable: str, watch_paths: Iterable[Path] = ()) -> Optional[str]:
+        """
+        Build cache key for a probe
+
+        Args:
+            command: Probe command
+            executable: Resolved executable path
+            watch_paths: Extra files/directories whose mtimes the probe output
+                depends on (e.g. the global node_modules directory for npm ls)
+
+        Returns:
+            Cache key, or None if the executable or a watched path cannot be stat'ed
+        """
+        try:
+            mtimes = [os.stat(executable).st_mtime_ns]
+            mtimes.extend(os.stat(path).st_mtime_ns for path in watch_paths)
+        except OSError:
+            return None
+        path_hash = hashlib.sha256(os.environ.get("PATH", "").encode("utf-8")).hexdigest()[:16]
+        mtime_part = ",".join(str(mtime) for mtime in mtimes)
+        return f"{' '.join(command)}|{executable}|{mtime_part}|{path_hash}"
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        """Load entries from disk once (caller holds the lock)"""
+        if self._entries is None:
+            self._entries = {}
+            try:
+                if self.cache_file.exists():
+                    with open(self.cache_file, 'r', encoding='utf-8') as f:
+                        data = json.load(f)
+                    if isinstance(data, dict):
+                        self._entries = data.get("entries", {})
+            except (OSError, ValueError) as e:
+                self.logger.debug(f"Ignoring unreadable probe cache {self.cache_file}: {e}")
+        return self._entries
+
+    def _save(self) -> None:
+        """Write entries to disk atomically, dropping expired ones (caller holds the lock)"""
+        now = time.time()
+        entries = {
+            key: entry for key, entry in self._entries.items()
+            if now - entry.get("timestamp", 0) < self.ttl
+        }
+        self._entries = entries
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.cache_file.with_name(f"{self.cache_file.name}.{os.getpid()}.tmp")
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump({"entries": entries}, f, indent=2)
+            os.replace(tmp_file, self.cache_file)
+        except OSError as e:
+            self.logger.debug(f"Could not write probe cache {self.cache_file}: {e}")
+
+    def get(self, key: str) -> Optional[subprocess.CompletedProcess]:
+        """
+        Get cached probe result
+
+        Args:
+            key: Key from make_key()
+
+        Returns:
+            Cached CompletedProcess, or None on miss/expiry
+        """
+        if self.ttl <= 0:
+            return None
+
+        with self._lock:
+            entry = self._load().get(key)
+
+        if not entry or time.time() - entry.get("timestamp", 0) >= self.ttl:
+            return None
+
+        # A failed probe may mean the tool is being installed or repaired;
+        # only a success is stable enough to reuse
+        if entry.get("returncode") != 0:
+            return None
+
+        return subprocess.CompletedProcess(
+            args=entry.get("args", []),
+            returncode=entry.get("returncode", 1),
+            stdout=entry.get("stdout", ""),
+            stderr=entry.get("stderr", "")
+        )
+
+    def put(self, key: str, result: subprocess.CompletedProcess) -> None:
+        """
+        Store probe result and persist the cache
+
+        Failed probes (non-zero return code) are not stored, so a tool that is
+        installed or fixed after a failing run is picked up immediately.
+
+        Args:
+            key: Key from make_key()
+            result: Completed probe subprocess (text mode)
+        """
+        if self.ttl <= 0 or result.returncode != 0:
+            return
+
+        with self._lock:
+            self._load()[key] = {
+                "args": list(result.args) if isinstance(result.args, (list, tuple)) else result.args,
+                "returncode": result.returncode,
+                "stdout": result.stdout or "",
+                "stderr": result.stderr or "",
+                "timestamp": time.time()
+            }
+            self._save()
+
+    def clear(self) -> None:
+        """Remove all cached entries"""
+        with self._lock:
+            self._entries = {}
+            try:
+                self.cache_file.unlink()
+            except OSError:
+                pass
@@ -0,0 +1,165 @@
+import json
+import tarfile
+
+import pytest
+
+from setup.utils import archive
+from setup.utils.archive import open_archive_reader, write_backup_archive
+
+
+def make_install(tmp_path):
+    root = tmp_path / ".gemini"
+    (root / "commands" / "sg").mkdir(parents=True)
+    (root / "backups").mkdir()
+    (root / "GEMINI.md").write_text("@FLAGS.md\n" * 200)
+    (root / "commands" / "sg" / "build.toml").write_text("prompt = 'build'")
+    (root / "backups" / "old.tar.gz").write_bytes(b"old backup")
+    return root
+
+
+def read_archive(path):
+    with open_archive_reader(path) as tar:
+        return {member.name: tar.extractfile(member).read() for member in tar if member.isfile()}
+
+
+@pytest.mark.parametrize("method, jobs", [("none", 1), ("gzip", 1), ("gzip", 3), ("bzip2", 1)])
+def test_streamed_archive_round_trips(tmp_path, monkeypatch, method, jobs):
+    monkeypatch.setattr(archive, "PARALLEL_GZIP_BLOCK_SIZE", 512)
+    root = make_install(tmp_path)
+    target = tmp_path / f"backup{archive.archive_suffix(method)}"
+
+    stats = write_backup_archive(root, target, method=method, jobs=jobs,
+                                 metadata=json.dumps({"components": {}}).encode(),
+                                 exclude=[root / "backups"])
+
+    members = read_archive(target)
+    assert sorted(members) == ["GEMINI.md", "backup_metadata.json", "commands/sg/build.toml"]
+    assert members["GEMINI.md"] == (root / "GEMINI.md").read_bytes()
+    assert json.loads(members["backup_metadata.json"]) == {"components": {}}
+    assert stats["files"] == 2
+    assert stats["bytes_in"] == len(members["GEMINI.md"]) + len(members["commands/sg/build.toml"])
+
+
+def test_parallel_gzip_is_readable_with_random_access(tmp_path, monkeypatch):
+    monkeypatch.setattr(archive, "PARALLEL_GZIP_BLOCK_SIZE", 512)
+    root = make_install(tmp_path)
+    target = tmp_path / "backup.tar.gz"
+    write_backup_archive(root, target, method="gzip", jobs=4, exclude=[root / "backups"])
+
+    with tarfile.open(target, "r:gz") as tar:
+        assert tar.extractfile("commands/sg/build.toml").read() == b"prompt = 'build'"
+
+
+def test_zstd_round_trip(tmp_path):
+    pytest.importorskip("zstandard")
+    root = make_install(tmp_path)
+    target = tmp_path / "backup.tar.zst"
+    write_backup_archive(root, target, method="zstd", jobs=2, exclude=[root / "backups"])
+    assert "GEMINI.md" in read_archive(target)
+
+
+def make_large_install(tmp_path):
+    root = make_install(tmp_path)
+    (root / "settings.json").write_text('{"theme": "dark"}')
+    for i in range(20):
+        (root / "commands" / "sg" / f"cmd{i:02d}.toml").write_text(f"prompt = '{i}'\n" * (i * 10 + 1))
+    return root
+
+
+def test_indexed_gzip_restores_only_matching_members(tmp_path, monkeypatch):
+    monkeypatch.setattr(archive, "PARALLEL_GZIP_BLOCK_SIZE", 512)
+    root = make_large_install(tmp_path)
+    target = tmp_path / "backup.tar.gz"
+    write_backup_archive(root, target, method="gzip", metadata=b"{}", exclude=[root / "backups"], index=True)
+
+    index = archive.load_archive_index(target)
+    assert len(index["blocks"]) > 10
+    assert archive.read_indexed_member(target, index, "backup_metadata.json") == b"{}"
+
+    restored = tmp_path / "restored"
+    result = archive.extract_archive(target, restored, patterns=["commands/sg", "settings.json"], jobs=3)
+
+    assert result == {"matched": 22, "restored": 22, "skipped": 0, "failed": 0}
+    assert not (restored / "GEMINI.md").exists()
+    assert not (restored / "backup_metadata.json").exists()
+    for path in (root / "commands" / "sg").iterdir():
+        assert (restored / "commands" / "sg" / path.name).read_bytes() == path.read_bytes()
+
+
+def test_indexed_restore_reads_only_the_blocks_it_needs(tmp_path, monkeypatch):
+    monkeypatch.setattr(archive, "PARALLEL_GZIP_BLOCK_SIZE", 512)
+    root = make_large_install(tmp_path)
+    target = tmp_path / "backup.tar.gz"
+    write_backup_archive(root, target, method="gzip", exclude=[root / "backups"], index=True)
+
+    # Corrupt the second half of the archive; GEMINI.md sits near the start
+    index = archive.load_archive_index(target)
+    assert index["members"]["GEMINI.md"]["offset"] < index["blocks"][len(index["blocks"]) // 2][1]
+    data = bytearray(target.read_bytes())
+    middle = index["blocks"][len(index["blocks"]) // 2][0]
+    data[middle:] = bytes(len(data) - middle)
+    target.write_bytes(bytes(data))
+
+    result = archive.extract_archive(target, tmp_path / "restored", patterns=["GEMINI.md"])
+
+    assert result["restored"] == 1
+    assert (tmp_path / "restored" / "GEMINI.md").read_bytes() == (root / "GEMINI.md").read_bytes()
+
+
+def test_stale_index_is_ignored(tmp_path):
+    root = make_install(tmp_path)
+    target = tmp_path / "backup.tar.gz"
+    write_backup_archive(root, target, method="gzip", exclude=[root / "backups"], index=True)
+    write_backup_archive(root, target, method="gzip", exclude=[root / "backups"])
+
+    assert archive.load_archive_index(target) is None
+
+
+@pytest.mark.parametrize("method", ["none", "bzip2"])
+def test_unindexed_restore_filters_with_globs(tmp_path, method):
+    root = make_large_install(tmp_path)
+    target = tmp_path / f"backup{archive.archive_suffix(method)}"
+    write_backup_archive(root, target, method=method, exclude=[root / "backups"])
+
+    restored = tmp_path / "restored"
+    result = archive.extract_archive(target, restored, patterns=["*.md", "commands/sg/cmd0?.toml"], jobs=2)
+
+    assert result["restored"] == 11
+    assert (restored / "GEMINI.md").read_bytes() == (root / "GEMINI.md").read_bytes()
+    assert (restored / "commands" / "sg" / "cmd09.toml").exists()
+    assert not (restored / "commands" / "sg" / "cmd10.toml").exists()
+    assert archive.extract_archive(target, restored, patterns=["GEMINI.md"])["skipped"] == 1
+
+
+def test_restore_refuses_paths_outside_target(tmp_path):
+    target = tmp_path / "evil.tar"
+    with tarfile.open(target, "w") as tar:
+        archive.add_bytes(tar, "../escaped.txt", b"nope")
+        archive.add_bytes(tar, "ok.txt", b"fine")
+
+    result = archive.extract_archive(target, tmp_path / "restored")
+
+    assert result["failed"] == 1 and result["restored"] == 1
+    assert not (tmp_path / "escaped.txt").exists()
+
+
+def test_restore_refuses_links_outside_target(tmp_path):
+    target = tmp_path / "links.tar.gz"
+    with tarfile.open(target, "w:gz") as tar:
+        archive.add_bytes(tar, "a.txt", b"fine")
+        for name, linkname, kind in (("up", "../outside", tarfile.SYMTYPE),
+                                     ("abs", "/etc/passwd", tarfile.SYMTYPE),
+                                     ("hard", "../../outside", tarfile.LNKTYPE),
+                                     ("fifo", "", tarfile.FIFOTYPE),
+                                     ("ok", "a.txt", tarfile.SYMTYPE)):
+            info = tarfile.TarInfo(name)
+            info.type = kind
+            info.linkname = linkname
+            tar.addfile(info)
+
+    restored = tmp_path / "restored"
+    result = archive.extract_archive(target, restored)
+
+    assert result["failed"] == 4 and result["restored"] == 2
+    assert sorted(p.name for p in restored.iterdir()) == ["a.txt", "ok"]
+    assert (restored / "ok").read_bytes() == b"fine"
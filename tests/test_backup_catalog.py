@@ -0,0 +1,100 @@
+import json
+import os
+
+import pytest
+
+from setup.cli.commands import backup
+from setup.services import backup_catalog
+from setup.services.backup_catalog import BackupCatalog
+from setup.utils.archive import write_backup_archive
+
+
+def make_backup(tmp_path, name="supergemini_backup_1.tar.gz"):
+    root = tmp_path / ".gemini"
+    (root / "commands").mkdir(parents=True, exist_ok=True)
+    (root / "GEMINI.md").write_text("@FLAGS.md\n")
+    (root / "commands" / "build.toml").write_text("prompt = 'build'")
+    backup_dir = root / "backups"
+    backup_dir.mkdir(exist_ok=True)
+    metadata = {"components": {"core": "4.0.0"}, "framework_version": "4.0.0"}
+    archive_path = backup_dir / name
+    stats = write_backup_archive(root, archive_path, metadata=json.dumps(metadata).encode(),
+                                 exclude=[backup_dir])
+    BackupCatalog(backup_dir).record(archive_path, stats["files"], metadata)
+    return backup_dir, archive_path
+
+
+@pytest.fixture
+def no_archive_reads(monkeypatch):
+    def fail(path):
+        raise AssertionError(f"archive opened: {path}")
+    monkeypatch.setattr(backup_catalog, "scan_archive", fail)
+
+
+def test_record_stores_size_files_components_and_checksum(tmp_path):
+    backup_dir, archive_path = make_backup(tmp_path)
+
+    entry = BackupCatalog(backup_dir).load()[archive_path.name]
+
+    assert entry["size"] == archive_path.stat().st_size
+    assert entry["files"] == 2
+    assert entry["components"] == {"core": "4.0.0"}
+    assert entry["sha256"] == BackupCatalog.checksum(archive_path)
+
+
+def test_list_and_info_read_only_the_catalog(tmp_path, no_archive_reads):
+    backup_dir, archive_path = make_backup(tmp_path)
+
+    backups = backup.list_backups(backup_dir)
+    info = backup.get_backup_info(archive_path)
+
+    assert [b["path"] for b in backups] == [archive_path]
+    assert backups[0]["files"] == 2
+    assert info["metadata"]["framework_version"] == "4.0.0"
+    assert "error" not in info
+
+
+def test_changed_archive_is_rescanned_lazily(tmp_path):
+    backup_dir, archive_path = make_backup(tmp_path)
+    catalog = BackupCatalog(backup_dir)
+    stat = archive_path.stat()
+    os.utime(archive_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    entry = catalog.lookup(archive_path)
+
+    assert entry["mtime_ns"] == stat.st_mtime_ns + 10**9
+    assert entry["files"] == 2
+    assert catalog.load()[archive_path.name] == entry
+
+
+def test_refresh_adds_new_archives_and_drops_deleted_ones(tmp_path):
+    backup_dir, first = make_backup(tmp_path)
+    _, second = make_backup(tmp_path, "supergemini_backup_2.tar.gz")
+    catalog = BackupCatalog(backup_dir)
+    catalog.save({first.name: catalog.load()[first.name]})
+    first.unlink()
+
+    entries = catalog.refresh([second])
+
+    assert set(entries) == {second.name}
+    assert set(catalog.load()) == {second.name}
+
+
+def test_rescan_counts_files_like_record(tmp_path):
+    backup_dir, archive_path = make_backup(tmp_path)
+    recorded = BackupCatalog(backup_dir).load()[archive_path.name]["files"]
+
+    assert BackupCatalog.scan_entry(archive_path)["files"] == recorded == 2
+    write_backup_archive(backup_dir.parent, archive_path, metadata=b"{}", exclude=[backup_dir], index=True)
+    assert archive_path.with_name(archive_path.name + ".idx").exists()
+    assert BackupCatalog.scan_entry(archive_path)["files"] == 2
+
+
+def test_listing_ignores_indexes_and_leftover_temp_files(tmp_path):
+    backup_dir, archive_path = make_backup(tmp_path)
+    (backup_dir / f"{archive_path.name}.idx.1234.tmp").write_text("{")
+
+    backups = backup.list_backups(backup_dir)
+
+    assert [b["path"] for b in backups] == [archive_path]
+    assert "error" not in backups[0]
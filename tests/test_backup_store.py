@@ -0,0 +1,102 @@
+import os
+
+from setup.services.backup_store import BackupStore
+
+
+def make_install(tmp_path):
+    root = tmp_path / ".gemini"
+    (root / "commands" / "sg").mkdir(parents=True)
+    (root / "backups").mkdir()
+    (root / "GEMINI.md").write_text("@FLAGS.md\n")
+    (root / "FLAGS.md").write_text("# Flags\n" * 100)
+    (root / "COPY.md").write_text("# Flags\n" * 100)
+    (root / "commands" / "sg" / "build.toml").write_text("prompt = 'build'")
+    return root
+
+
+def test_snapshot_dedups_identical_content(tmp_path):
+    root = make_install(tmp_path)
+    store = BackupStore(root / "backups")
+
+    stats = store.create_snapshot(root, name="first", exclude=[root / "backups"])
+
+    assert stats["files"] == 4
+    assert stats["new_blobs"] == 3  # FLAGS.md and COPY.md share a blob
+    assert not any("backups" in name for name in store.load_snapshot("first")["files"])
+
+
+def test_unchanged_files_reuse_previous_snapshot(tmp_path):
+    root = make_install(tmp_path)
+    store = BackupStore(root / "backups")
+    store.create_snapshot(root, name="first", exclude=[root / "backups"])
+
+    (root / "GEMINI.md").write_text("@FLAGS.md\n@RULES.md\n")
+    stats = store.create_snapshot(root, name="second", exclude=[root / "backups"])
+
+    assert stats["reused"] == 3
+    assert stats["new_blobs"] == 1
+    assert [s["name"] for s in store.list_snapshots()] == ["second", "first"]
+
+
+def test_restore_round_trips(tmp_path):
+    root = make_install(tmp_path)
+    store = BackupStore(root / "backups")
+    store.create_snapshot(root, name="first", exclude=[root / "backups"])
+    os.chmod(root / "FLAGS.md", 0o600)
+
+    target = tmp_path / "restored"
+    result = store.restore_snapshot("first", target)
+
+    assert result == {"matched": 4, "restored": 4, "skipped": 0, "failed": 0}
+    assert (target / "commands" / "sg" / "build.toml").read_text() == "prompt = 'build'"
+    assert (target / "FLAGS.md").read_bytes() == (root / "FLAGS.md").read_bytes()
+
+    assert store.restore_snapshot("first", target)["skipped"] == 4
+
+
+def test_gc_removes_only_unreferenced_blobs(tmp_path):
+    root = make_install(tmp_path)
+    store = BackupStore(root / "backups")
+    store.create_snapshot(root, name="first", exclude=[root / "backups"])
+    (root / "GEMINI.md").write_text("changed\n")
+    store.create_snapshot(root, name="second", exclude=[root / "backups"])
+
+    assert store.gc(min_age=0) == (0, 0)
+
+    store.delete_snapshot("first")
+    assert store.gc() == (0, 0)  # Blobs younger than the grace period stay
+    removed, freed = store.gc(min_age=0)
+
+    assert removed == 1 and freed > 0
+    assert store.restore_snapshot("second", tmp_path / "restored")["failed"] == 0
+
+
+def test_gc_keeps_everything_when_a_manifest_is_unreadable(tmp_path):
+    root = make_install(tmp_path)
+    store = BackupStore(root / "backups")
+    store.create_snapshot(root, name="first", exclude=[root / "backups"])
+    store.delete_snapshot("first")
+    store.snapshot_path("broken").write_text("{")
+    warnings = []
+
+    class Logger:
+        def warning(self, message):
+            warnings.append(message)
+
+    assert store.gc(min_age=0, logger=Logger()) == (0, 0)
+    assert any(store.blobs_dir.glob("*/*"))
+    assert warnings and "broken.json" in warnings[0]
+
+
+def test_gc_leaves_recent_temporary_files(tmp_path):
+    store = BackupStore(tmp_path / "backups")
+    store.tmp_dir.mkdir(parents=True)
+    fresh = store.tmp_dir / "1-1.tmp"
+    stale = store.tmp_dir / "1-2.tmp"
+    fresh.write_bytes(b"in progress")
+    stale.write_bytes(b"left behind")
+    os.utime(stale, (1, 1))
+
+    store.gc()
+
+    assert fresh.exists() and not stale.exists()
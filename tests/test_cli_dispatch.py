@@ -0,0 +1,38 @@
+import subprocess
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+def _imported_operation_modules(argv):
+    code = (
+        "import sys\n"
+        f"sys.argv = ['SuperGemini'] + {argv!r}\n"
+        "from SuperGemini import __main__ as hub\n"
+        "parser, subparsers, global_parser = hub.create_parser()\n"
+        "hub.register_operation_parsers(subparsers, global_parser, hub.get_selected_operation(sys.argv[1:]))\n"
+        "parser.parse_args(sys.argv[1:])\n"
+        "print(sorted(m for m in sys.modules if m.startswith('setup.cli.commands.')))\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], cwd=PROJECT_ROOT,
+                            capture_output=True, text=True, check=True)
+    return result.stdout.strip()
+
+
+def test_only_selected_operation_module_is_imported():
+    assert _imported_operation_modules(["backup", "--list"]) == "['setup.cli.commands.backup']"
+
+
+def test_no_operation_imports_no_operation_modules():
+    assert _imported_operation_modules(["--verbose"]) == "[]"
+
+
+def test_global_option_values_are_not_taken_as_the_operation():
+    from SuperGemini.__main__ import get_selected_operation
+
+    assert get_selected_operation(["--install-dir", "backup", "install"]) == "install"
+    assert get_selected_operation(["--install-dir=backup", "install"]) == "install"
+    assert get_selected_operation(["--install-d", "backup", "uninstall", "--dry-run"]) == "uninstall"
+    assert get_selected_operation(["-v", "backup", "--list"]) == "backup"
+    assert get_selected_operation(["--install-dir", "install", "bogus"]) is None
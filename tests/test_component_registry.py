@@ -0,0 +1,78 @@
+import hashlib
+import json
+import os
+
+from setup import PROJECT_ROOT
+from setup.core.registry import ComponentRegistry, COMPONENT_INDEX_VERSION
+
+COMPONENTS_DIR = PROJECT_ROOT / "setup" / "components"
+
+
+def test_registry_resolves_components_and_loads_classes_on_demand():
+    registry = ComponentRegistry(COMPONENTS_DIR)
+
+    assert set(registry.list_components()) >= {"core", "commands", "mcp", "mcp_docs", "modes"}
+    assert registry.resolve_dependencies(["modes"]) == ["core", "modes"]
+    assert registry.get_components_by_category("integration") == ["mcp"]
+
+    component_class = registry.get_component_class("core")
+    assert component_class.__name__ == "CoreComponent"
+    assert component_class.component_dependencies == ()
+
+
+def _write_index(components_dir, modules):
+    index = {
+        "version": COMPONENT_INDEX_VERSION,
+        "modules": {
+            name: hashlib.sha256((components_dir / f"{name}.py").read_bytes()).hexdigest()
+            for name in modules
+        },
+        "components": {
+            "alpha": {"module": "setup.components.alpha", "class": "AlphaComponent", "dependencies": [], "category": "core"}
+        },
+    }
+    index_file = components_dir / "components.index.json"
+    index_file.write_text(json.dumps(index))
+    return index_file
+
+
+def test_index_is_used_only_while_fresh(tmp_path):
+    module_file = tmp_path / "alpha.py"
+    module_file.write_text("ALPHA = 1\n")
+    index_file = _write_index(tmp_path, ["alpha"])
+    index_mtime = index_file.stat().st_mtime
+
+    registry = ComponentRegistry(tmp_path)
+    assert registry._load_index()
+    assert registry.dependency_graph == {"alpha": set()}
+
+    # Timestamps alone (e.g. from a wheel or zip install) do not make it stale
+    os.utime(module_file, (index_mtime + 10, index_mtime + 10))
+    assert ComponentRegistry(tmp_path)._load_index()
+
+    # Same source with CRLF line endings
+    module_file.write_bytes(b"ALPHA = 1\r\n")
+    assert ComponentRegistry(tmp_path)._load_index()
+
+    # Module edited since the index was generated
+    module_file.write_text("ALPHA = 2\n")
+    assert not ComponentRegistry(tmp_path)._load_index()
+
+    # Module added since the index was generated
+    module_file.write_text("ALPHA = 1\n")
+    (tmp_path / "beta.py").write_text("")
+    assert not ComponentRegistry(tmp_path)._load_index()
+
+
+def test_stale_index_is_scanned_in_memory_without_rewriting(tmp_path):
+    (tmp_path / "alpha.py").write_text("")
+    index_file = _write_index(tmp_path, ["alpha"])
+    before = index_file.read_text()
+    (tmp_path / "beta.py").write_text("")
+
+    registry = ComponentRegistry(tmp_path)
+    registry.discover_components()
+
+    assert "alpha" not in registry.list_components()
+    assert index_file.read_text() == before
+    assert not list(tmp_path.glob("*.tmp"))
@@ -0,0 +1,181 @@
+import os
+import threading
+import tomllib
+from pathlib import Path
+
+from setup.components.commands import CommandsComponent
+
+from setup.services import gemini_md
+from setup.services.gemini_md import DEFAULT_GEMINI_MD, GEMINIMdService
+
+
+def count_writes(monkeypatch):
+    writes = []
+    original = GEMINIMdService._write_atomic
+
+    def write(self, content):
+        writes.append(content)
+        original(self, content)
+
+    monkeypatch.setattr(GEMINIMdService, "_write_atomic", write)
+    return writes
+
+
+def test_transaction_applies_all_components_in_one_write(tmp_path, monkeypatch):
+    writes = count_writes(monkeypatch)
+    service = GEMINIMdService(tmp_path)
+
+    with service.transaction():
+        GEMINIMdService(tmp_path).add_imports(["FLAGS.md", "RULES.md"], category="Core Framework")
+        threads = [
+            threading.Thread(target=GEMINIMdService(tmp_path).add_imports,
+                             args=([f"MODE_{i}.md"],), kwargs={"category": "Behavioral Modes"})
+            for i in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert not service.gemini_md_path.exists()
+
+    assert len(writes) == 1
+    content = service.gemini_md_path.read_text()
+    assert content.startswith(DEFAULT_GEMINI_MD.rstrip())
+    assert "# Core Framework\n@FLAGS.md\n@RULES.md\n" in content
+    assert "\n".join(f"@MODE_{i}.md" for i in range(4)) in content
+
+
+def test_byte_identical_result_is_not_written(tmp_path, monkeypatch):
+    service = GEMINIMdService(tmp_path)
+    service.add_imports(["FLAGS.md"], category="Core Framework")
+    mtime = service.gemini_md_path.stat().st_mtime_ns
+    writes = count_writes(monkeypatch)
+
+    with service.transaction():
+        service.add_imports(["FLAGS.md"], category="Core Framework")
+        service.add_imports(["MODE_X.md"], category="Behavioral Modes")
+        service.remove_imports(["MODE_X.md"])
+
+    assert writes == []
+    assert service.gemini_md_path.stat().st_mtime_ns == mtime
+
+
+def test_user_content_and_removals_are_preserved(tmp_path):
+    service = GEMINIMdService(tmp_path)
+    service.gemini_md_path.write_text("# My notes\n@MINE.md\n")
+
+    with service.transaction():
+        service.add_imports(["FLAGS.md", "MINE.md"], category="Core Framework")
+        service.add_imports(["MCP_Context7.md"], category="MCP Documentation")
+    service.remove_imports(["MCP_Context7.md"])
+
+    content = service.gemini_md_path.read_text()
+    assert content.startswith("# My notes\n@MINE.md\n")
+    assert content.count("@MINE.md") == 1
+    assert "@FLAGS.md" in content
+    assert "MCP" not in content
+    assert not [p for p in os.listdir(tmp_path) if p.endswith(".tmp")]
+
+
+def test_failed_transaction_body_writes_nothing(tmp_path):
+    service = GEMINIMdService(tmp_path)
+    try:
+        with service.transaction():
+            service.add_imports(["FLAGS.md"], category="Core Framework")
+            raise RuntimeError("install failed")
+    except RuntimeError:
+        pass
+
+    assert not service.gemini_md_path.exists()
+    assert gemini_md._active_transactions == {}
+
+
+def install_framework_files(tmp_path):
+    for name, size in {"FLAGS.md": 400, "RULES.md": 800, "MODE_Brainstorming.md": 200,
+                       "MCP_Context7.md": 100}.items():
+        (tmp_path / name).write_text("x" * size)
+
+
+def test_plan_reports_tokens_per_category(tmp_path):
+    install_framework_files(tmp_path)
+    service = GEMINIMdService(tmp_path)
+    service.add_imports(["FLAGS.md", "RULES.md"], category="Core Framework")
+    service.add_imports(["MODE_Brainstorming.md"], category="Behavioral Modes")
+    content = service.gemini_md_path.read_text()
+
+    plan = service.plan_imports(content, {"Core Framework": ["FLAGS.md", "RULES.md"],
+                                          "Behavioral Modes": ["MODE_Brainstorming.md"]}, budget=300)
+
+    assert plan["categories"] == {"Core Framework": 300, "Behavioral Modes": 50}
+    assert plan["files"]["RULES.md"] == 200
+    assert plan["total"] == 350 + plan["gemini_md"]
+    assert plan["over_budget"]
+
+
+def test_minimal_profile_keeps_only_core_imports(tmp_path):
+    install_framework_files(tmp_path)
+    service = GEMINIMdService(tmp_path)
+    service.add_imports(["MODE_Brainstorming.md"], category="Behavioral Modes")
+
+    with service.transaction(profile="minimal"):
+        service.add_imports(["FLAGS.md", "RULES.md"], category="Core Framework")
+        service.add_imports(["MCP_Context7.md"], category="MCP Documentation")
+
+    content = service.gemini_md_path.read_text()
+    assert "@FLAGS.md" in content and "@RULES.md" in content
+    assert "MODE_" not in content and "MCP_" not in content
+    assert (tmp_path / "MODE_Brainstorming.md").exists()
+
+
+def test_lazy_profile_leaves_mode_and_mcp_guides_to_commands(tmp_path):
+    install_framework_files(tmp_path)
+    service = GEMINIMdService(tmp_path)
+
+    with service.transaction(profile="lazy"):
+        service.add_imports(["FLAGS.md", "RULES.md"], category="Core Framework")
+        service.add_imports(["MODE_Introspection.md"], category="Behavioral Modes")
+        service.add_imports(["MCP_Sequential.md"], category="MCP Documentation")
+
+    content = service.gemini_md_path.read_text()
+    assert "@FLAGS.md" in content and "@RULES.md" in content
+    assert "MODE_" not in content and "MCP_" not in content
+
+    commands = CommandsComponent(tmp_path)
+    assert commands.get_file_transform({"import_profile": "full"}) is None
+    _, transform = commands.get_file_transform({"import_profile": "lazy"})
+    source = Path(__file__).parent.parent / "SuperGemini" / "Commands" / "analyze.toml"
+    prompt = tomllib.loads(transform(source, source.read_text(encoding="utf-8")))["prompt"]
+    assert "`--seq`, `--sequential`, `--all-mcp`: MCP_Sequential.md" in prompt
+    assert "`--introspect`: MODE_Introspection.md" in prompt
+
+
+def test_strict_budget_refuses_and_leaves_gemini_md_unchanged(tmp_path):
+    install_framework_files(tmp_path)
+    service = GEMINIMdService(tmp_path)
+    service.add_imports(["FLAGS.md"], category="Core Framework")
+    before = service.gemini_md_path.read_bytes()
+
+    with service.transaction(budget=150, strict=True) as transaction:
+        service.add_imports(["RULES.md"], category="Core Framework")
+
+    assert transaction.result is False
+    assert service.gemini_md_path.read_bytes() == before
+
+    with service.transaction(budget=150) as transaction:
+        service.add_imports(["RULES.md"], category="Core Framework")
+
+    assert transaction.result is True
+    assert "@RULES.md" in service.gemini_md_path.read_text()
+
+
+def test_remembered_profile_applies_to_later_updates(tmp_path):
+    install_framework_files(tmp_path)
+    service = GEMINIMdService(tmp_path)
+
+    with service.transaction(profile="minimal", remember=True):
+        service.add_imports(["FLAGS.md"], category="Core Framework")
+    with service.transaction(remember=True):
+        service.add_imports(["MODE_Brainstorming.md"], category="Behavioral Modes")
+
+    assert service.resolve_import_settings() == ("minimal", None)
+    assert "MODE_" not in service.gemini_md_path.read_text()
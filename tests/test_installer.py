@@ -0,0 +1,193 @@
+import json
+import threading
+import time
+
+from setup.core.base import Component
+from setup.core.installer import Installer
+from setup.core.registry import COMPONENT_INDEX_FILENAME, COMPONENT_INDEX_VERSION, ComponentRegistry
+
+
+class FakeComponent(Component):
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+    finished = []
+
+    def __init__(self, name, dependencies, install_dir):
+        self.component_name = name
+        self.component_dependencies = tuple(dependencies)
+        super().__init__(install_dir)
+
+    def get_metadata(self):
+        return {"name": self.component_name, "version": "0", "description": "", "category": "test"}
+
+    def validate_prerequisites(self, installSubPath=None):
+        return True, []
+
+    def _install(self, config):
+        cls = FakeComponent
+        with cls.lock:
+            cls.active += 1
+            cls.peak = max(cls.peak, cls.active)
+        time.sleep(0.05)
+        with cls.lock:
+            cls.active -= 1
+            cls.finished.append(self.component_name)
+        return True
+
+    def _post_install(self):
+        return True
+
+    def uninstall(self):
+        return True
+
+    def _get_source_dir(self):
+        return None
+
+
+def fake_registry(tmp_path, graph):
+    components_dir = tmp_path / "components"
+    components_dir.mkdir()
+    index = {
+        "version": COMPONENT_INDEX_VERSION,
+        "modules": {},
+        "components": {
+            name: {"module": "tests.test_installer", "class": "FakeComponent",
+                   "dependencies": deps, "category": "test"}
+            for name, deps in graph.items()
+        }
+    }
+    (components_dir / COMPONENT_INDEX_FILENAME).write_text(json.dumps(index))
+    return ComponentRegistry(components_dir)
+
+
+def test_install_components_runs_dependency_levels_concurrently(tmp_path):
+    FakeComponent.finished = []
+    registry = fake_registry(tmp_path, {"core": [], "commands": ["core"], "modes": ["core"], "mcp": ["core"]})
+    installer = Installer(tmp_path, max_workers=4, registry=registry)
+    installer._run_post_install_validation = lambda: None
+    installer.register_components([
+        FakeComponent("core", [], tmp_path),
+        FakeComponent("commands", ["core"], tmp_path),
+        FakeComponent("modes", ["core"], tmp_path),
+        FakeComponent("mcp", ["core"], tmp_path),
+    ])
+    progress = []
+
+    ordered = installer.resolve_dependencies(["commands", "modes", "mcp"])
+    assert installer.get_installation_levels(ordered) == [["core"], ["commands", "modes", "mcp"]]
+
+    assert installer.install_components(
+        ["commands", "modes", "mcp"],
+        progress_callback=lambda name, ok, done, total: progress.append((done, total)),
+    )
+
+    assert FakeComponent.finished[0] == "core"
+    assert FakeComponent.peak == 3
+    assert progress == [(1, 4), (2, 4), (3, 4), (4, 4)]
+    assert installer.installed_components == {"core", "commands", "modes", "mcp"}
+
+
+def test_create_backup_streams_install_dir_without_backups_or_local(tmp_path):
+    import tarfile
+
+    (tmp_path / "backups").mkdir()
+    (tmp_path / "backups" / "old.tar.gz").write_bytes(b"old")
+    (tmp_path / "local").mkdir()
+    (tmp_path / "local" / "cache.bin").write_bytes(b"cache")
+    (tmp_path / "commands" / "sg").mkdir(parents=True)
+    (tmp_path / "commands" / "sg" / "build.toml").write_text("prompt = 'build'")
+    (tmp_path / "GEMINI.md").write_text("@FLAGS.md")
+
+    backup_path = Installer(tmp_path).create_backup()
+
+    with tarfile.open(backup_path, "r:gz") as tar:
+        assert sorted(tar.getnames()) == ["GEMINI.md", "commands/sg/build.toml"]
+
+
+def test_update_creates_a_single_backup(tmp_path):
+    registry = fake_registry(tmp_path, {"core": []})
+    installer = Installer(tmp_path, registry=registry)
+    installer._run_post_install_validation = lambda: None
+    installer.register_components([FakeComponent("core", [], tmp_path)])
+    (tmp_path / "GEMINI.md").write_text("@FLAGS.md")
+    backups = []
+    create_backup = installer.create_backup
+    installer.create_backup = lambda **kwargs: backups.append(create_backup(**kwargs)) or backups[-1]
+
+    assert installer.update_components(["core"], {"backup": True})
+    assert len(backups) == 1 and backups[0] == installer.backup_path
+
+
+def test_install_command_always_passes_mcp_concurrency(tmp_path):
+    import argparse
+    from setup.cli.commands.install import execute_installation
+
+    registry = fake_registry(tmp_path, {"core": []})
+    installer = Installer(tmp_path, registry=registry)
+    configs = []
+    installer.install_components = lambda components, config, **kwargs: configs.append(config) or True
+    installer.installed_components.add("core")
+    args = argparse.Namespace(
+        force_overwrite=False, skip_gemini_md=True, no_backup=True, backup_dedup=False,
+        import_profile=None, context_budget=None, strict_budget=False, minify=None,
+        skip_validation=True, dry_run=False, mcp_servers=None, mcp_jobs=2, mcp_npm_batch=True
+    )
+
+    assert execute_installation(["core"], installer, registry, {"core": FakeComponent("core", [], tmp_path)}, args)
+    assert configs[0]["mcp_jobs"] == 2
+    assert configs[0]["mcp_npm_batch"] is True
+    assert "selected_mcp_servers" not in configs[0]
+
+
+def test_minify_setting_is_saved_only_when_given(tmp_path):
+    registry = fake_registry(tmp_path, {"core": []})
+    saved = []
+
+    def install(config):
+        installer = Installer(tmp_path, registry=registry)
+        installer.save_minify = saved.append
+        installer.register_components([FakeComponent("core", [], tmp_path)])
+        assert installer.install_components(["core"], dict(config, backup=False, skip_validation=True))
+
+    install({})
+    assert saved == []
+    install({"minify": True})
+    assert saved == [True]
+
+
+class FailingComponent(FakeComponent):
+    def validate_prerequisites(self, installSubPath=None):
+        return False, ["missing tool"]
+
+
+def _install_with_profile(tmp_path, component, dry_run):
+    registry = fake_registry(tmp_path, {component.component_name: []})
+    installer = Installer(tmp_path, dry_run=dry_run, registry=registry)
+    installer.register_components([component])
+    installer.install_components([component.component_name],
+                                 {"import_profile": "minimal", "backup": False, "dry_run": dry_run})
+
+
+def _snapshot(tmp_path):
+    gemini_md = tmp_path / "GEMINI.md"
+    metadata = tmp_path / ".supergemini-metadata.json"
+    gemini_md.write_text("# User notes\n\n@FLAGS.md\n@MODE_Brainstorming.md\n")
+    metadata.write_text(json.dumps({"gemini_md": {"import_profile": "full"}}))
+    return lambda: (gemini_md.read_bytes(), metadata.read_bytes())
+
+
+def test_dry_run_leaves_gemini_md_and_metadata_unchanged(tmp_path):
+    read = _snapshot(tmp_path)
+    before = read()
+
+    _install_with_profile(tmp_path, FakeComponent("core", [], tmp_path), dry_run=True)
+    assert read() == before
+
+
+def test_profile_is_not_applied_when_nothing_installed(tmp_path):
+    read = _snapshot(tmp_path)
+    before = read()
+
+    _install_with_profile(tmp_path, FailingComponent("core", [], tmp_path), dry_run=False)
+    assert read() == before
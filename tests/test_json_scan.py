@@ -0,0 +1,59 @@
+import json
+
+from setup.utils.json_scan import json_has_key
+
+NEEDLES = ("supergemini", "mcp_servers")
+
+
+def write(tmp_path, data, name="config.json"):
+    path = tmp_path / name
+    path.write_text(data if isinstance(data, str) else json.dumps(data))
+    return path
+
+
+def test_matches_keys_up_to_max_depth(tmp_path):
+    assert json_has_key(write(tmp_path, {"SuperGemini": 1}), NEEDLES)
+    assert json_has_key(write(tmp_path, {"a": [{"b": {"my_mcp_servers": {}}}]}), NEEDLES)
+    assert not json_has_key(write(tmp_path, {"a": [{"b": {"c": {"supergemini": 1}}}]}), NEEDLES)
+
+
+def test_values_and_deep_siblings_do_not_match(tmp_path):
+    data = {"note": "supergemini", "deep": [[[[{"supergemini": 1}]]]], "items": ["mcp_servers"]}
+    assert not json_has_key(write(tmp_path, data), NEEDLES)
+    data["later"] = {"supergemini_version": "1"}
+    assert json_has_key(write(tmp_path, data), NEEDLES)
+
+
+def test_escaped_keys_and_strings_with_structural_characters(tmp_path):
+    raw = '{"text": "quote \\" and {braces} [\\"supergemini\\": 1]", "\\u0073upergemini": true}'
+    assert json_has_key(write(tmp_path, raw), NEEDLES)
+    raw = '{"text": "quote \\" and {\\"supergemini\\": 1}"}'
+    assert not json_has_key(write(tmp_path, raw), NEEDLES)
+
+
+def test_files_over_budget_are_not_opened(tmp_path, monkeypatch):
+    path = write(tmp_path, {"log": "x" * 10000, "supergemini": 1})
+    assert json_has_key(path, NEEDLES)
+    assert not json_has_key(tmp_path / "missing.json", NEEDLES)
+
+    def refuse_open(*args, **kwargs):
+        raise AssertionError("over-budget file was opened")
+
+    monkeypatch.setattr("builtins.open", refuse_open)
+    assert not json_has_key(path, NEEDLES, read_budget=4096)
+
+
+def test_invalid_json_never_matches(tmp_path):
+    for raw in ('{"supergemini": 1', '{"supergemini": 1,}', '{"supergemini": tru}',
+                '{"supergemini": "bad \\x escape"}', '{"supergemini": 1} trailing',
+                '{"supergemini" 1}', b'{"supergemini": "\xff"}'):
+        path = tmp_path / "bad.json"
+        path.write_bytes(raw if isinstance(raw, bytes) else raw.encode())
+        assert not json_has_key(path, NEEDLES), raw
+
+
+def test_jsonl_logs_never_match(tmp_path):
+    lines = [json.dumps({"event": i, "supergemini": True}) for i in range(3)]
+    path = write(tmp_path, "\n".join(lines) + "\n", name="session.jsonl")
+    assert not json_has_key(path, NEEDLES)
+    assert json_has_key(write(tmp_path, lines[0] + "\n", name="one.jsonl"), NEEDLES)
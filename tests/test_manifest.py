@@ -0,0 +1,131 @@
+import os
+
+from setup.core.base import Component
+from setup.services.manifest import ManifestService
+
+
+class FileComponent(Component):
+    component_name = "files"
+
+    def __init__(self, source_dir, install_dir):
+        self.source_dir = source_dir
+        super().__init__(install_dir)
+
+    def get_metadata(self):
+        return {"name": "files", "version": "0", "description": "", "category": "test"}
+
+    def _get_source_dir(self):
+        return self.source_dir
+
+    def files(self):
+        return [(path, self.install_dir / path.name) for path in sorted(self.source_dir.iterdir())]
+
+    def validate_prerequisites(self, installSubPath=None):
+        return True, []
+
+    def _install(self, config):
+        return True
+
+    def _post_install(self):
+        return True
+
+    def uninstall(self):
+        return True
+
+
+def make_component(tmp_path, **files):
+    source = tmp_path / "source"
+    source.mkdir(exist_ok=True)
+    for name, content in files.items():
+        (source / f"{name}.md").write_text(content)
+    return FileComponent(source, tmp_path / "install")
+
+
+def test_second_sync_skips_unchanged_files(tmp_path):
+    component = make_component(tmp_path, a="alpha", b="beta")
+    assert component._sync_files(component.files()) == 2
+    assert component.sync_stats["copied"] == 2
+
+    (component.source_dir / "b.md").write_text("beta v2")
+    assert component._sync_files(component.files()) == 2
+    assert component.sync_stats["copied"] == 1
+    assert component.sync_stats["skipped"] == 1
+    assert component.sync_stats["bytes_skipped"] == len("alpha")
+    assert (component.install_dir / "b.md").read_text() == "beta v2"
+
+
+def test_modified_target_is_recopied(tmp_path):
+    component = make_component(tmp_path, a="alpha")
+    component._sync_files(component.files())
+
+    target = component.install_dir / "a.md"
+    target.write_text("edited by user")
+    os.utime(target, (1, 1))
+    component._sync_files(component.files())
+    assert component.sync_stats["copied"] == 1
+    assert target.read_text() == "alpha"
+
+
+def test_files_dropped_from_source_are_removed(tmp_path):
+    component = make_component(tmp_path, a="alpha", b="beta", c="gamma")
+    component._sync_files(component.files())
+
+    (component.source_dir / "b.md").unlink()
+    (component.source_dir / "c.md").unlink()
+    edited = component.install_dir / "c.md"
+    edited.write_text("keep me")
+    os.utime(edited, (1, 1))
+
+    component._sync_files(component.files())
+    assert component.sync_stats["removed"] == 1
+    assert not (component.install_dir / "b.md").exists()
+    assert edited.read_text() == "keep me"
+    assert set(ManifestService(component.install_dir, "files").load()) == {"a.md"}
+
+
+def test_manifest_keys_outside_install_dir_are_never_removed(tmp_path):
+    component = make_component(tmp_path, a="alpha")
+    component._sync_files(component.files())
+
+    outside = tmp_path / "outside.md"
+    outside.write_text("not ours")
+    manifest = ManifestService(component.install_dir, "files")
+    entries = manifest.load()
+    for key in (outside.as_posix(), "../outside.md"):
+        entries[key] = manifest.make_entry(outside, "0" * 64, "0" * 64)
+    manifest.save(entries)
+
+    component._sync_files(component.files())
+    assert outside.read_text() == "not ours"
+    assert component.sync_stats["removed"] == 0
+
+
+def test_transform_change_rewrites_installed_copies(tmp_path):
+    component = make_component(tmp_path, a="alpha")
+    upper = ("upper/1", lambda source, text: text.upper())
+
+    component._sync_files(component.files(), transform=upper)
+    assert (component.install_dir / "a.md").read_text() == "ALPHA"
+    assert (component.source_dir / "a.md").read_text() == "alpha"
+    assert ManifestService(component.install_dir, "files").load()["a.md"]["transform"] == "upper/1"
+
+    component._sync_files(component.files(), transform=upper)
+    assert component.sync_stats["skipped"] == 1
+
+    component._sync_files(component.files())
+    assert component.sync_stats["copied"] == 1
+    assert (component.install_dir / "a.md").read_text() == "alpha"
+
+
+def test_minify_config_reports_source_and_installed_sizes(tmp_path):
+    component = make_component(tmp_path, a="# A\n\nspaced    out\n\n\n\nend\n")
+    transform = component.get_file_transform({"minify": True})
+    assert component.get_file_transform({}) is None
+
+    component._sync_files(component.files(), transform=transform)
+    assert (component.install_dir / "a.md").read_text() == "# A\n\nspaced out\n\nend\n"
+    assert component.sync_stats["bytes_source"] > component.sync_stats["bytes_installed"]
+
+    component._sync_files(component.files(), transform=transform)
+    assert component.sync_stats["skipped"] == 1
+    assert component.sync_stats["bytes_source"] > component.sync_stats["bytes_installed"]
@@ -0,0 +1,125 @@
+import threading
+import time
+
+from setup.components.mcp import MCPComponent
+
+
+def test_install_server_packages_runs_concurrently(monkeypatch, tmp_path):
+    component = MCPComponent(install_dir=tmp_path)
+    active = {"now": 0, "peak": 0}
+    lock = threading.Lock()
+
+    def fake_install(server_key, server_info):
+        with lock:
+            active["now"] += 1
+            active["peak"] = max(active["peak"], active["now"])
+        time.sleep(0.05)
+        with lock:
+            active["now"] -= 1
+        return server_key != "magic"
+
+    monkeypatch.setattr(component, "_install_mcp_server_package", fake_install)
+    monkeypatch.setattr(component, "_verify_mcp_installation", lambda key, info: True)
+
+    servers = ["context7", "sequential", "magic", "playwright"]
+    results = component._install_server_packages(servers, max_workers=2)
+
+    assert set(results) == set(servers)
+    assert results["magic"] == {"installed": False, "verified": False}
+    assert results["context7"] == {"installed": True, "verified": True}
+    assert active["peak"] == 2
+
+
+def test_batched_npm_install_falls_back_per_package(monkeypatch, tmp_path):
+    component = MCPComponent(install_dir=tmp_path)
+    batches = []
+    single = []
+
+    def fake_batch(server_keys):
+        batches.append(list(server_keys))
+        return False
+
+    def fake_install(server_key, server_info):
+        single.append(server_key)
+        return True
+
+    monkeypatch.setattr(component, "_install_npm_packages_batch", fake_batch)
+    monkeypatch.setattr(component, "_install_mcp_server_package", fake_install)
+    monkeypatch.setattr(component, "_verify_mcp_installation", lambda key, info: True)
+
+    servers = ["context7", "sequential", "serena"]
+    results = component._install_server_packages(servers, batch_npm=True)
+
+    assert batches == [["context7", "sequential"]]
+    assert sorted(single) == sorted(servers)
+    assert all(r["installed"] for r in results.values())
+
+
+def test_batched_npm_install_skips_per_package_on_success(monkeypatch, tmp_path):
+    component = MCPComponent(install_dir=tmp_path)
+    single = []
+
+    monkeypatch.setattr(component, "_install_npm_packages_batch", lambda keys: True)
+    monkeypatch.setattr(component, "_install_mcp_server_package",
+                        lambda key, info: single.append(key) or True)
+    monkeypatch.setattr(component, "_verify_mcp_installation", lambda key, info: True)
+
+    component._install_server_packages(["context7", "playwright", "serena"], batch_npm=True)
+
+    assert single == ["serena"]
+
+
+def test_verification_runs_in_the_install_workers(monkeypatch, tmp_path):
+    component = MCPComponent(install_dir=tmp_path)
+    active = {"now": 0, "peak": 0}
+    lock = threading.Lock()
+
+    def slow_verify(server_key, server_info):
+        with lock:
+            active["now"] += 1
+            active["peak"] = max(active["peak"], active["now"])
+        time.sleep(0.05)
+        with lock:
+            active["now"] -= 1
+        return True
+
+    monkeypatch.setattr(component, "_install_mcp_server_package", lambda key, info: True)
+    monkeypatch.setattr(component, "_verify_mcp_installation", slow_verify)
+
+    results = component._install_server_packages(["context7", "sequential", "serena"], max_workers=3)
+
+    assert all(r == {"installed": True, "verified": True} for r in results.values())
+    assert active["peak"] == 3
+
+
+def test_npm_verification_refreshes_a_stale_inventory(monkeypatch, tmp_path):
+    from setup.components import mcp as mcp_module
+
+    component = MCPComponent(install_dir=tmp_path)
+    reads = []
+
+    def fake_inventory(refresh=False):
+        reads.append(refresh)
+        return {"@upstash/context7-mcp": "1.0.0"} if refresh else {}
+
+    monkeypatch.setattr(mcp_module, "get_npm_global_inventory", fake_inventory)
+
+    assert component._verify_npm_installation("context7", component.mcp_servers["context7"])
+    assert reads == [False, True]
+
+
+def test_npm_package_name_handles_scoped_packages():
+    from setup.utils.npm import npm_package_name
+
+    assert npm_package_name("@upstash/context7-mcp@latest") == "@upstash/context7-mcp"
+    assert npm_package_name("@21st-dev/magic") == "@21st-dev/magic"
+    assert npm_package_name("left-pad@1.3.0") == "left-pad"
+    assert npm_package_name("left-pad") == "left-pad"
+
+
+def test_parse_npm_inventory():
+    from setup.utils.npm import parse_npm_inventory
+
+    output = '{"name": "lib", "dependencies": {"npm": {"version": "10.8.2"}, "@playwright/mcp": {"version": "0.0.30"}}}'
+    assert parse_npm_inventory(output) == {"npm": "10.8.2", "@playwright/mcp": "0.0.30"}
+    assert parse_npm_inventory("{}") == {}
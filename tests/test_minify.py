@@ -0,0 +1,59 @@
+from pathlib import Path
+
+from setup.utils.minify import minify_file, minify_markdown
+
+SOURCE = """# Mode
+
+<!-- internal note -->
+**Purpose**:   Keep   things short
+
+## Examples
+```
+/sg:analyze --uc
+```
+
+## Tables
+| Flag   | Effect         |
+|--------|:--------------:|
+| `--uc` | compact output |
+
+---
+
+This boilerplate paragraph is long enough to be deduplicated.
+
+
+
+This boilerplate paragraph is long enough to be deduplicated.
+
+## Code
+```
+keep    this   spacing
+# not a heading
+```
+"""
+
+
+def test_minify_drops_comments_examples_and_padding():
+    result = minify_markdown(SOURCE)
+    assert "internal note" not in result
+    assert "## Examples" not in result and "/sg:analyze" not in result
+    assert "**Purpose**: Keep things short" in result
+    assert "|Flag|Effect|\n|-|:-:|\n|`--uc`|compact output|" in result
+    assert "---" not in result and "\n\n\n" not in result
+    assert result.count("This boilerplate paragraph") == 1
+
+
+def test_minify_keeps_code_blocks_verbatim():
+    result = minify_markdown(SOURCE)
+    assert "```\nkeep    this   spacing\n# not a heading\n```\n" in result
+    assert minify_markdown(result) == result
+
+
+def test_shipped_markdown_gets_smaller_and_other_files_are_untouched():
+    modes = Path(__file__).parent.parent / "SuperGemini" / "Modes"
+    for source in modes.glob("*.md"):
+        text = source.read_text(encoding="utf-8")
+        minified = minify_file(source, text)
+        assert len(minified) < len(text)
+        assert minified.startswith("# ")
+    assert minify_file(Path("analyze.toml"), SOURCE) == SOURCE
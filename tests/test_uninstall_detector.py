@@ -0,0 +1,187 @@
+import errno
+import os
+import re
+
+from setup.cli.commands.uninstall import (
+    SignatureMatcher, SuperGeminiFileDetector, cleanup_empty_directories, remove_files_batched,
+    verify_complete_removal, verify_directory_safety, verify_supergemini_file
+)
+
+SAMPLES = [
+    "# SuperGemini Framework",
+    "see superclaude   framework docs",
+    "Imports: @FLAGS.md and friends",
+    "load mode_brainstorming.md",
+    "MCP_Context7.md",
+    "visit claude.ai/code",
+    "export SUPERGEMINI_HOME=1",
+    "token and then token again before efficiency",
+    "token on one line\nefficiency on the next",
+    "mcp mcp mcp ... server",
+    "behavioral notes without the other word",
+    "structuredthinking",
+    "plain session log " * 300,
+    "",
+]
+
+
+def test_signature_matcher_agrees_with_per_signature_search(tmp_path):
+    signatures = SuperGeminiFileDetector(tmp_path).supergemini_signatures
+    matcher = SignatureMatcher(signatures)
+    for sample in SAMPLES:
+        expected = any(re.search(s, sample, re.IGNORECASE | re.MULTILINE) for s in signatures)
+        assert matcher.search(sample) == expected, sample
+
+
+def test_file_content_analysis_uses_first_4kb(tmp_path):
+    detector = SuperGeminiFileDetector(tmp_path)
+    early = tmp_path / "early.json"
+    early.write_text('{"note": "SuperGemini Framework"}' + " " * 8000)
+    late = tmp_path / "late.json"
+    late.write_text(" " * 8000 + "SuperGemini Framework")
+    assert detector._analyze_file_content(early)
+    assert not detector._analyze_file_content(late)
+
+
+def test_scan_all_files_is_deterministic_across_worker_counts(tmp_path, monkeypatch):
+    monkeypatch.setattr("setup.cli.commands.uninstall.SCAN_BATCH_SIZE", 3)
+    (tmp_path / "commands" / "sg").mkdir(parents=True)
+    (tmp_path / "notes").mkdir()
+    (tmp_path / "GEMINI.md").write_text("# SuperGemini")
+    (tmp_path / "commands" / "sg" / "build.toml").write_text("prompt = ''")
+    for index in range(10):
+        (tmp_path / "notes" / f"note-{index}.txt").write_text("user notes")
+    (tmp_path / "notes" / "loop").symlink_to(tmp_path, target_is_directory=True)
+
+    detector = SuperGeminiFileDetector(tmp_path)
+    serial = detector.scan_all_files(max_workers=1)
+    parallel = detector.scan_all_files(max_workers=4)
+
+    assert serial == parallel
+    assert serial[0] == [tmp_path / "GEMINI.md", tmp_path / "commands" / "sg" / "build.toml"]
+    assert serial[1] == [tmp_path / "notes" / f"note-{index}.txt" for index in range(10)]
+
+
+def test_directory_safety_is_derived_from_one_scan(tmp_path, monkeypatch):
+    (tmp_path / "commands" / "sg").mkdir(parents=True)
+    (tmp_path / "commands" / "sg" / "build.toml").write_text("prompt = ''")
+    (tmp_path / "commands" / "mine.toml").write_text("prompt = 'user command'")
+    (tmp_path / "modes" / "empty").mkdir(parents=True)
+    (tmp_path / "modes" / "MODE_Brainstorming.md").write_text("mode")
+
+    scan = SuperGeminiFileDetector(tmp_path).classify_tree(max_workers=1)
+
+    calls = []
+    monkeypatch.setattr(SuperGeminiFileDetector, "is_supergemini_file",
+                        lambda self, path: calls.append(path) or False)
+    assert verify_directory_safety(tmp_path / "commands" / "sg", "commands", scan)
+    assert not verify_directory_safety(tmp_path / "commands", "commands", scan)
+    assert verify_directory_safety(tmp_path / "modes", "modes", scan)
+    assert not verify_directory_safety(tmp_path, "core", scan)
+    assert verify_supergemini_file(tmp_path / "modes" / "MODE_Brainstorming.md", "modes", scan)
+    assert calls == []
+
+
+def test_snapshot_rechecks_only_changed_entries(tmp_path, monkeypatch):
+    (tmp_path / "logs").mkdir()
+    framework = tmp_path / "FLAGS.md"
+    framework.write_text("flags")
+    notes = tmp_path / "notes.txt"
+    notes.write_text("user notes")
+    scan = SuperGeminiFileDetector(tmp_path).classify_tree(max_workers=1)
+
+    classify = SuperGeminiFileDetector.is_supergemini_file
+    calls = []
+    monkeypatch.setattr(SuperGeminiFileDetector, "is_supergemini_file",
+                        lambda self, path: calls.append(path.name) or classify(self, path))
+
+    assert scan.recheck(framework) is True
+    notes.write_text("now mentions the SuperGemini Framework")
+    assert scan.recheck(notes) is True
+    assert calls == ["notes.txt"]
+
+    framework.unlink()
+    assert scan.recheck(framework) is None
+    assert verify_complete_removal(tmp_path, scan=scan) == [notes]
+
+    notes.unlink()
+    cleanup_empty_directories(tmp_path, scan=scan)
+    assert not (tmp_path / "logs").exists()
+    assert verify_complete_removal(tmp_path, scan=scan) == []
+
+
+def test_batched_removal_retries_only_locked_files(tmp_path, monkeypatch):
+    (tmp_path / "modes").mkdir()
+    files = [tmp_path / "FLAGS.md", tmp_path / "modes" / "MODE_Brainstorming.md", tmp_path / "modes" / "busy.md"]
+    for file_path in files:
+        file_path.write_text("# SuperGemini")
+    missing = tmp_path / "RULES.md"
+
+    real_unlink = os.unlink
+    attempts = {"busy.md": 0}
+
+    def flaky_unlink(path, *, dir_fd=None):
+        if os.path.basename(path) == "busy.md":
+            attempts["busy.md"] += 1
+            if attempts["busy.md"] < 3:
+                raise OSError(errno.EBUSY, "busy")
+        return real_unlink(path, dir_fd=dir_fd)
+
+    monkeypatch.setattr("setup.cli.commands.uninstall.os.unlink", flaky_unlink)
+    result = remove_files_batched(files + [missing], retry_delay=0)
+
+    assert sorted(result["removed"]) == sorted(files)
+    assert result["missing"] == [missing]
+    assert result["failed"] == []
+    assert result["retried"] == 2
+    assert not any(file_path.exists() for file_path in files)
+
+
+def test_batched_removal_keeps_files_changed_since_scan(tmp_path):
+    framework = tmp_path / "FLAGS.md"
+    framework.write_text("flags")
+    notes = tmp_path / "notes.md"
+    notes.write_text("# SuperGemini notes")
+    scan = SuperGeminiFileDetector(tmp_path).classify_tree(max_workers=1)
+
+    notes.write_text("my own notes, nothing else")
+    result = remove_files_batched([framework, notes], scan=scan)
+
+    assert result["removed"] == [framework]
+    assert result["preserved"] == [notes]
+    assert notes.exists()
+
+    dry = remove_files_batched([notes], dry_run=True)
+    assert dry["removed"] == [notes] and notes.exists()
+
+
+def test_dry_run_uninstall_changes_nothing(tmp_path, monkeypatch):
+    from argparse import Namespace
+
+    from setup.cli.commands import uninstall
+    from setup.components.core import CoreComponent
+
+    def forbidden(*args, **kwargs):
+        raise AssertionError("dry run must not change the installation")
+
+    monkeypatch.setattr(CoreComponent, "uninstall", forbidden)
+    monkeypatch.setattr(uninstall, "cleanup_environment_variables", forbidden)
+    monkeypatch.setattr(uninstall, "cleanup_empty_directories", forbidden)
+
+    flags = tmp_path / "FLAGS.md"
+    flags.write_text("# SuperGemini Framework flags")
+    (tmp_path / "empty").mkdir()
+    args = Namespace(dry_run=True, install_dir=tmp_path, cleanup_env=True, no_restore_script=False,
+                     complete=False, removal_log=None)
+    info = {"supergemini_files": [flags], "preserved_files": []}
+
+    assert uninstall.perform_enhanced_uninstall(["core"], args, info, {"SUPERGEMINI_HOME": "x"})
+    assert flags.exists() and (tmp_path / "empty").is_dir()
+
+
+def test_scan_jobs_follow_the_cpu_affinity_mask(monkeypatch):
+    from setup.cli.commands import uninstall
+
+    monkeypatch.setattr(os, "cpu_count", lambda: 16)
+    monkeypatch.setattr(os, "sched_getaffinity", lambda pid: {0}, raising=False)
+    assert uninstall._usable_cpu_count() == 1
@@ -0,0 +1,139 @@
+import json
+import subprocess
+import sys
+
+from setup.core import validator as validator_module
+from setup.core.validator import Validator
+
+
+def _count_subprocess_runs(monkeypatch):
+    calls = []
+    real_run = subprocess.run
+
+    def counting_run(*args, **kwargs):
+        calls.append(args[0])
+        return real_run(*args, **kwargs)
+
+    monkeypatch.setattr(validator_module.subprocess, "run", counting_run)
+    return calls
+
+
+def test_probe_results_persist_across_validators(monkeypatch, tmp_path):
+    calls = _count_subprocess_runs(monkeypatch)
+    command = [sys.executable, "--version"]
+
+    first = Validator(install_dir=tmp_path)._run_probe(command)
+    second = Validator(install_dir=tmp_path)._run_probe(command)
+
+    assert len(calls) == 1
+    assert second.returncode == first.returncode == 0
+    assert second.stdout == first.stdout
+    assert (tmp_path / ".supergemini-probe-cache.json").exists()
+
+
+def test_probe_cache_respects_ttl_and_path(monkeypatch, tmp_path):
+    calls = _count_subprocess_runs(monkeypatch)
+    command = [sys.executable, "--version"]
+
+    Validator(install_dir=tmp_path, probe_cache_ttl=0)._run_probe(command)
+    Validator(install_dir=tmp_path, probe_cache_ttl=0)._run_probe(command)
+    assert len(calls) == 2
+
+    Validator(install_dir=tmp_path)._run_probe(command)
+    monkeypatch.setenv("PATH", "/nonexistent")
+    Validator(install_dir=tmp_path)._run_probe(command)
+    assert len(calls) == 4
+
+
+def test_validate_requirements_runs_probes_under_total_deadline(monkeypatch, tmp_path):
+    import time
+
+    validator = Validator(probe_deadline=0.5)
+
+    def slow_tool(tool_name, command, min_version=None):
+        time.sleep(0.3)
+        return False, f"{tool_name} missing"
+
+    monkeypatch.setattr(validator, "check_external_tool", slow_tool)
+    monkeypatch.setattr(validator, "check_node", lambda *a: (False, "node missing"))
+
+    requirements = {
+        "node": {"min_version": "18.0.0"},
+        "external_tools": {
+            "alpha": {"command": "alpha --version"},
+            "beta": {"command": "beta --version", "optional": True},
+            "gamma": {"command": "gamma --version"},
+        },
+    }
+
+    start = time.monotonic()
+    success, errors = validator.validate_requirements(requirements)
+    elapsed = time.monotonic() - start
+
+    assert not success
+    assert errors == ["Node.js: node missing", "alpha: alpha missing", "gamma: gamma missing"]
+    assert elapsed < 0.8
+
+
+def test_run_checks_reports_overrunning_probe():
+    import time
+
+    validator = Validator(probe_deadline=0.1)
+    results = validator._run_checks([
+        ("fast", lambda: (True, "ok")),
+        ("slow", lambda: time.sleep(0.5) or (True, "late")),
+    ])
+
+    assert results["fast"] == (True, "ok")
+    assert results["slow"][0] is False
+
+
+def test_failed_probes_are_not_cached(monkeypatch, tmp_path):
+    calls = _count_subprocess_runs(monkeypatch)
+    command = [sys.executable, "-c", "raise SystemExit(3)"]
+
+    first = Validator(install_dir=tmp_path)._run_probe(command)
+    second = Validator(install_dir=tmp_path)._run_probe(command)
+
+    assert first.returncode == second.returncode == 3
+    assert len(calls) == 2
+
+
+def test_npm_inventory_uses_probe_cache_until_global_packages_change(monkeypatch, tmp_path):
+    import os
+    from setup.utils import npm as npm_module
+    from setup.utils.probe_cache import ProbeCache
+
+    global_root = tmp_path / "prefix" / "lib" / "node_modules"
+    npm_bin = global_root / "npm" / "bin" / "npm-cli.js"
+    npm_bin.parent.mkdir(parents=True)
+    npm_bin.write_text("")
+    monkeypatch.delenv("NPM_CONFIG_PREFIX", raising=False)
+    monkeypatch.delenv("npm_config_prefix", raising=False)
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setattr(npm_module.shutil, "which", lambda name: str(npm_bin))
+
+    calls = []
+
+    def fake_run(command, **kwargs):
+        calls.append(command)
+        tree = {"dependencies": {"left-pad": {"version": "1.3.0"}}}
+        return subprocess.CompletedProcess(command, 0, stdout=json.dumps(tree), stderr="")
+
+    monkeypatch.setattr(npm_module.subprocess, "run", fake_run)
+    cache = ProbeCache(tmp_path / "cache.json")
+
+    def load():
+        npm_module.invalidate_npm_global_inventory()
+        return npm_module.get_npm_global_inventory(probe_cache=cache)
+
+    assert load() == {"left-pad": "1.3.0"}
+    assert load() == {"left-pad": "1.3.0"}
+    assert len(calls) == 1
+
+    (global_root / "left-pad").mkdir()
+    stat = os.stat(global_root)
+    os.utime(global_root, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    load()
+    assert len(calls) == 2
+    npm_module.invalidate_npm_global_inventory()